@@ -0,0 +1,283 @@
+"""
+Conferatur 명령줄 비교 도구
+
+GUI 없이 폴더/파일/텍스트를 비교하고 결과를 JSON 또는 JSONL로 출력한다.
+tkinter/ttkbootstrap을 가져오지 않으므로 디스플레이가 없는 서버나 CI에서도 동작한다.
+판정은 GUI와 같은 compare_engine 코드를 쓴다.
+
+종료 코드: 0 = 차이 없음, 1 = 차이 있음, 2 = 오류 (취소 포함)
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from compare_engine import (
+    DEFAULT_CONFIG_DIR,
+    DEFAULT_HASH_ALGORITHM,
+    DEFAULT_HASH_BACKEND,
+    DEFAULT_HASH_CACHE_MAX_ENTRIES,
+    DEFAULT_HASH_CHUNK_SIZE,
+    DEFAULT_PROCESS_BATCH_SIZE,
+    FOLDER_STATUS_CODES,
+    HASH_ALGORITHMS,
+    HASH_BACKENDS,
+    HASH_CACHE_FILENAME,
+    FolderCompareJob,
+    HashCache,
+    compare_texts,
+    compile_exclude_patterns,
+    folder_result_to_dict,
+    format_byte_size,
+    format_duration,
+    is_folder_manifest,
+    normalize_hash_workers,
+)
+
+EXIT_SAME = 0
+EXIT_DIFFERENT = 1
+EXIT_ERROR = 2
+
+FOLDER_METHODS = ("md5", "date", "both", "binary")
+
+# 진행 상황 출력과 새 결과 확인 주기 (초)
+CLI_POLL_INTERVAL_S = 0.1
+
+
+class JsonWriter:
+    """결과 레코드를 JSON 한 덩어리 또는 JSONL 스트림으로 출력.
+
+    jsonl이면 레코드가 들어오는 대로 한 줄씩 내보내고, json이면 모아 두었다가
+    finish()에서 {"results": [...], "summary": {...}} 하나로 쓴다.
+    """
+
+    def __init__(self, stream, output_format):
+        self.stream = stream
+        self.output_format = output_format
+        self.results = []
+
+    def result(self, record):
+        if self.output_format == 'jsonl':
+            self._write_line(dict(record, type='result'))
+        else:
+            self.results.append(record)
+
+    def finish(self, summary):
+        if self.output_format == 'jsonl':
+            self._write_line(dict(summary, type='summary'))
+        else:
+            json.dump({'results': self.results, 'summary': summary}, self.stream,
+                      ensure_ascii=False, indent=2)
+            self.stream.write('\n')
+        self.stream.flush()
+
+    def _write_line(self, record):
+        self.stream.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+        self.stream.write('\n')
+        self.stream.flush()
+
+
+def text_block_record(block):
+    """diff_text_lines 블록 → JSON 레코드 (spans는 [줄 번호, 시작 열, 끝 열])"""
+    return {
+        'tag': block['tag'],
+        'left_start': block['left_start'],
+        'left_end': block['left_end'],
+        'right_start': block['right_start'],
+        'right_end': block['right_end'],
+        'left_lines': block['left_lines'],
+        'right_lines': block['right_lines'],
+        'left_spans': [list(span) for span in block['left_spans']],
+        'right_spans': [list(span) for span in block['right_spans']],
+    }
+
+
+def _print_progress(snapshot):
+    if snapshot['phase'] == 'hash':
+        line = "비교 중 {}/{} ({}/s)".format(
+            snapshot['pairs_done'], snapshot['pairs_total'],
+            format_byte_size(int(snapshot['throughput'])))
+        if snapshot['eta'] is not None:
+            line += ", 남은 시간 " + format_duration(snapshot['eta'])
+    else:
+        line = "스캔 중 {}개".format(snapshot['files_scanned'])
+    sys.stderr.write('\r' + line.ljust(60))
+    sys.stderr.flush()
+
+
+def _cli_cache_factory(path):
+    def open_cache():
+        parent_dir = os.path.dirname(path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        return HashCache(path, DEFAULT_HASH_CACHE_MAX_ENTRIES)
+    return open_cache
+
+
+def run_folder_compare(args, writer):
+    """폴더 비교. GUI와 같은 FolderCompareJob을 띄우고 결과를 내보냄.
+
+    jsonl은 결과를 찾는 대로(해시가 끝난 순서) 내보내고, json은 같은 입력이면 실행마다
+    같은 출력이 되도록 compare_folders처럼 경로순으로 정렬한다.
+    """
+    for folder in (args.left, args.right):
+        if not os.path.exists(folder):
+            sys.stderr.write("오류: 폴더를 찾을 수 없습니다: {}\n".format(folder))
+            return EXIT_ERROR
+        if not os.path.isdir(folder) and not is_folder_manifest(folder):
+            sys.stderr.write("오류: 폴더나 매니페스트 파일이 아닙니다: {}\n".format(folder))
+            return EXIT_ERROR
+
+    cache_factory = None
+    if not args.no_cache:
+        cache_factory = _cli_cache_factory(args.cache or str(DEFAULT_CONFIG_DIR / HASH_CACHE_FILENAME))
+    job = FolderCompareJob(
+        args.left, args.right, args.method,
+        exclude_matcher=compile_exclude_patterns(tuple(args.exclude)),
+        hash_workers=normalize_hash_workers(args.workers) if args.workers else None,
+        cache_factory=cache_factory,
+        hash_algorithm=args.algorithm,
+        hash_chunk_size=DEFAULT_HASH_CHUNK_SIZE,
+        hash_backend=args.backend,
+        process_workers=args.process_workers,
+        process_batch_size=DEFAULT_PROCESS_BATCH_SIZE,
+    )
+    started = time.monotonic()
+    job.start()
+
+    emitted = 0
+    try:
+        while True:
+            finished = job.wait(CLI_POLL_INTERVAL_S)
+            results = job.results
+            while emitted < len(results):
+                writer.result(folder_result_to_dict(results[emitted]))
+                emitted += 1
+            if args.progress:
+                _print_progress(job.snapshot())
+            if finished:
+                break
+    except KeyboardInterrupt:
+        job.cancel()
+        job.wait()
+    if args.progress:
+        sys.stderr.write('\n')
+
+    if job.error is not None:
+        sys.stderr.write("오류: {}\n".format(job.error))
+        return EXIT_ERROR
+    if job.cancelled:
+        sys.stderr.write("취소됨\n")
+        return EXIT_ERROR
+
+    if args.format == 'json':
+        writer.results.sort(key=lambda record: record['path'])
+
+    counts = {}
+    for result in job.results:
+        code = FOLDER_STATUS_CODES.get(result.status, result.status)
+        counts[code] = counts.get(code, 0) + 1
+    writer.finish({
+        'mode': 'folder',
+        'left': args.left,
+        'right': args.right,
+        'method': args.method,
+        'algorithm': job.hash_algorithm,
+        'files_scanned': job.files_scanned,
+        'pairs_compared': job.pairs_done,
+        'files_skipped': job.files_skipped,
+        'identical_dirs': [path.replace(os.sep, '/') for path in job.identical_dirs],
+        'excluded_files': len(job.excluded_files),
+        'excluded_dirs': len(job.excluded_dirs),
+        'differences': len(job.results),
+        'counts': counts,
+        'elapsed_s': round(time.monotonic() - started, 3),
+    })
+    return EXIT_DIFFERENT if job.results else EXIT_SAME
+
+
+def _read_text_argument(value, is_file):
+    if value == '-':
+        return sys.stdin.read()
+    if is_file:
+        with open(value, 'r', encoding='utf-8') as f:
+            return f.read()
+    return value
+
+
+def run_text_compare(args, writer):
+    """파일/텍스트 비교. GUI 텍스트 탭과 같은 diff_text_lines 결과를 그대로 출력."""
+    is_file = args.mode == 'file'
+    if args.left == '-' and args.right == '-':
+        sys.stderr.write("오류: 표준 입력(-)은 한쪽에만 쓸 수 있습니다\n")
+        return EXIT_ERROR
+    try:
+        left_text = _read_text_argument(args.left, is_file)
+        right_text = _read_text_argument(args.right, is_file)
+    except (OSError, UnicodeDecodeError) as e:
+        sys.stderr.write("오류: {}\n".format(e))
+        return EXIT_ERROR
+
+    blocks = compare_texts(left_text, right_text)
+    for block in blocks:
+        writer.result(text_block_record(block))
+    writer.finish({
+        'mode': args.mode,
+        'left_lines': len(left_text.splitlines()),
+        'right_lines': len(right_text.splitlines()),
+        'differences': len(blocks),
+    })
+    return EXIT_DIFFERENT if blocks else EXIT_SAME
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='compare_cli.py',
+        description="Conferatur 명령줄 비교 (종료 코드: 0 같음, 1 다름, 2 오류)")
+    subparsers = parser.add_subparsers(dest='mode')
+
+    def add_common(sub):
+        sub.add_argument('left', help="왼쪽")
+        sub.add_argument('right', help="오른쪽")
+        sub.add_argument('--format', choices=('json', 'jsonl'), default='json',
+                         help="출력 형식 (jsonl은 결과를 찾는 대로 한 줄씩 출력)")
+
+    folder = subparsers.add_parser('folder', help="폴더 비교 (폴더 대신 매니페스트 파일도 가능)")
+    add_common(folder)
+    folder.add_argument('--method', choices=FOLDER_METHODS, default='md5', help="비교 방식")
+    folder.add_argument('--algorithm', choices=tuple(HASH_ALGORITHMS), default=DEFAULT_HASH_ALGORITHM,
+                        help="해시 알고리즘")
+    folder.add_argument('--exclude', action='append', default=[], metavar='PATTERN',
+                        help="제외 패턴 (여러 번 지정 가능)")
+    folder.add_argument('--workers', type=int, default=0, help="해시 스레드 수 (0 = 자동)")
+    folder.add_argument('--backend', choices=HASH_BACKENDS, default=DEFAULT_HASH_BACKEND,
+                        help="해시 실행 방식")
+    folder.add_argument('--process-workers', type=int, default=0, help="프로세스 수 (0 = 자동)")
+    folder.add_argument('--cache', default=None, help="해시 캐시 파일 경로")
+    folder.add_argument('--no-cache', action='store_true', help="해시 캐시를 쓰지 않음")
+    folder.add_argument('--progress', action='store_true', help="진행 상황을 표준 오류로 출력")
+
+    add_common(subparsers.add_parser('file', help="텍스트 파일 비교 (UTF-8, '-'는 표준 입력)"))
+    add_common(subparsers.add_parser('text', help="문자열 비교 ('-'는 표준 입력)"))
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.mode:
+        parser.print_help(sys.stderr)
+        return EXIT_ERROR
+
+    writer = JsonWriter(sys.stdout, args.format)
+    if args.mode == 'folder':
+        return run_folder_compare(args, writer)
+    return run_text_compare(args, writer)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,3257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파일 및 폴더 비교 엔진 (GUI 없음)
+compare_tool.py(Tk GUI)와 compare_cli.py(명령줄)가 함께 사용:
+- 폴더 스캔, 제외 패턴, 해시/바이트 비교, 해시 캐시
+- 백그라운드 폴더 비교 작업, 폴더 매니페스트, 실시간 감시
+- 텍스트 줄/문자 단위 차이 계산
+tkinter/ttkbootstrap을 import하지 않으므로 디스플레이 없이도 쓸 수 있다.
+
+스크립트나 다른 서비스에서 쓸 때의 진입점 (파일 맨 아래 '공개 API'):
+- compare_folders(): 폴더 비교를 끝까지 실행하고 FolderCompareReport 반환
+- compare_texts() / compare_text_files(): 텍스트 차이 블록 목록 반환
+- calculate_file_md5(), should_exclude(): 단일 파일 해시, 제외 패턴 판정
+"""
+
+import os
+import sys
+import hashlib
+import difflib
+import json
+import fnmatch
+import errno
+import functools
+import re
+import select
+import shutil
+import sqlite3
+import struct
+import tempfile
+import zlib
+import ctypes
+import ctypes.util
+from array import array
+from collections import Counter, namedtuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing
+from datetime import datetime
+from pathlib import Path
+
+
+# 설정/해시 캐시 저장 위치 (GUI와 CLI가 같은 캐시를 공유)
+DEFAULT_CONFIG_DIR = Path.home() / '.conferatur'
+HASH_CACHE_FILENAME = 'hash_cache.sqlite3'
+
+DEFAULT_HASH_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+MAX_HASH_WORKERS = 64
+
+
+def normalize_hash_workers(value):
+    """해시 작업자 수 설정값을 실제 스레드 수로 변환 (0 이하 = 자동)."""
+    try:
+        workers = int(value)
+    except (TypeError, ValueError):
+        workers = 0
+    if workers <= 0:
+        return DEFAULT_HASH_WORKERS
+    return min(workers, MAX_HASH_WORKERS)
+
+
+# 해시 계산 방식: 스레드 풀(기본) 또는 프로세스 풀
+HASH_BACKENDS = ('thread', 'process')
+DEFAULT_HASH_BACKEND = 'thread'
+DEFAULT_PROCESS_BATCH_SIZE = 64
+MAX_PROCESS_BATCH_SIZE = 4096
+# 이보다 작은 파일 쌍은 여러 개를 한 작업으로 묶어 프로세스 간 전송 비용을 줄임
+PROCESS_SMALL_FILE_LIMIT = 1024 * 1024
+# 작업 길이를 추정할 때 파일 하나를 여는 비용을 바이트로 환산한 값
+PROCESS_FILE_COST_BYTES = 64 * 1024
+
+
+def normalize_hash_backend(value):
+    """알 수 없는 해시 방식 설정값은 기본값(thread)으로 되돌림."""
+    return value if value in HASH_BACKENDS else DEFAULT_HASH_BACKEND
+
+
+def normalize_process_workers(value):
+    """프로세스 풀 크기 설정값을 실제 프로세스 수로 변환 (0 이하 = CPU 수)."""
+    try:
+        workers = int(value)
+    except (TypeError, ValueError):
+        workers = 0
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return min(workers, MAX_HASH_WORKERS)
+
+
+def normalize_process_batch_size(value):
+    """작은 파일 묶음 크기 설정값을 1 ~ MAX_PROCESS_BATCH_SIZE 범위로 제한."""
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        size = DEFAULT_PROCESS_BATCH_SIZE
+    return max(1, min(size, MAX_PROCESS_BATCH_SIZE))
+
+
+# (선택) 설치되어 있으면 더 빠른 비암호화/병렬 해시를 폴더 비교에 사용할 수 있음
+try:
+    import xxhash  # type: ignore
+except ImportError:
+    xxhash = None
+try:
+    import blake3  # type: ignore
+except ImportError:
+    blake3 = None
+
+
+class Crc32Hasher:
+    """zlib.crc32를 hashlib 객체처럼 update()/hexdigest()로 쓰기 위한 래퍼"""
+
+    def __init__(self):
+        self._crc = 0
+
+    def update(self, data):
+        self._crc = zlib.crc32(data, self._crc)
+
+    def hexdigest(self):
+        return f"{self._crc:08x}"
+
+
+# 폴더 비교 내용 판정에 쓸 수 있는 해시 알고리즘: 이름 -> (표시 이름, 해시 객체 생성자)
+# 변경 감지용이므로 암호학적 강도는 필요 없고, 속도 차이가 크다.
+HASH_ALGORITHMS = {
+    'md5': ('MD5', hashlib.md5),
+    'blake2b': ('BLAKE2b', hashlib.blake2b),
+    'crc32': ('CRC32', Crc32Hasher),
+}
+if xxhash is not None:
+    HASH_ALGORITHMS['xxh3'] = ('xxHash (XXH3)', getattr(xxhash, 'xxh3_64', xxhash.xxh64))
+if blake3 is not None:
+    HASH_ALGORITHMS['blake3'] = ('BLAKE3', blake3.blake3)
+DEFAULT_HASH_ALGORITHM = 'md5'
+
+
+def normalize_hash_algorithm(name):
+    """저장된 알고리즘 이름을 검증. 모르거나 설치되지 않은 알고리즘이면 기본값."""
+    return name if name in HASH_ALGORITHMS else DEFAULT_HASH_ALGORITHM
+
+
+def hash_algorithm_label(name):
+    """알고리즘 표시 이름 (설치되지 않은 알고리즘은 이름 그대로)"""
+    spec = HASH_ALGORITHMS.get(name)
+    return spec[0] if spec else name
+
+
+def new_hasher(algorithm=DEFAULT_HASH_ALGORITHM):
+    return HASH_ALGORITHMS[normalize_hash_algorithm(algorithm)][1]()
+
+
+# 파일 해시 읽기 버퍼 크기. SSD 순차 읽기에서 syscall 비용이 무시될 만큼 크게 잡는다.
+DEFAULT_HASH_CHUNK_SIZE = 1024 * 1024
+MIN_HASH_CHUNK_KB = 64
+MAX_HASH_CHUNK_KB = 16 * 1024
+
+_read_buffers = threading.local()
+
+
+def _get_read_buffer(chunk_size, slot='full'):
+    """스레드마다 용도(slot)별로 하나씩 재사용하는 읽기 버퍼 (memoryview)."""
+    view = getattr(_read_buffers, slot, None)
+    if view is None or len(view) != chunk_size:
+        view = memoryview(bytearray(chunk_size))
+        setattr(_read_buffers, slot, view)
+    return view
+
+
+def hash_file(filepath, algorithm=DEFAULT_HASH_ALGORITHM, chunk_size=DEFAULT_HASH_CHUNK_SIZE):
+    """파일 전체를 해시하고 읽은 바이트 수를 함께 반환.
+
+    청크마다 bytes 객체를 새로 만들지 않도록 재사용 버퍼에 readinto로 읽고,
+    버퍼링 없는 파일 객체를 써서 chunk_size 단위로 바로 시스템 호출한다.
+
+    Returns:
+        (digest, bytes_read). 읽을 수 없으면 digest는 None.
+    """
+    hasher = new_hasher(algorithm)
+    view = _get_read_buffer(chunk_size)
+    bytes_read = 0
+    try:
+        with open(filepath, "rb", buffering=0) as f:
+            while True:
+                count = f.readinto(view)
+                if not count:
+                    break
+                hasher.update(view[:count])
+                bytes_read += count
+        return hasher.hexdigest(), bytes_read
+    except Exception:
+        return None, bytes_read
+
+
+def calculate_file_digest(filepath, algorithm=DEFAULT_HASH_ALGORITHM, chunk_size=DEFAULT_HASH_CHUNK_SIZE):
+    """선택한 알고리즘으로 파일 전체 해시 계산. 읽을 수 없으면 None."""
+    return hash_file(filepath, algorithm, chunk_size)[0]
+
+
+def _first_difference(left_view, right_view, count):
+    """같은 길이 count의 두 버퍼에서 처음 달라지는 위치 (구간을 반씩 좁혀 찾음)"""
+    low, high = 0, count
+    while high - low > 64:
+        mid = (low + high) // 2
+        if left_view[low:mid] == right_view[low:mid]:
+            low = mid
+        else:
+            high = mid
+    for index in range(low, high):
+        if left_view[index] != right_view[index]:
+            return index
+    return high
+
+
+def _read_full(raw_file, view):
+    """view가 가득 차거나 파일 끝에 닿을 때까지 readinto를 반복 (읽은 바이트 수).
+
+    버퍼 없는 파일의 readinto는 파이프, FUSE/네트워크 마운트, 시그널 등으로 요청보다
+    적게 돌려줄 수 있으므로 한 번 읽은 양을 블록 크기로 믿으면 안 된다.
+    """
+    total = 0
+    size = len(view)
+    while total < size:
+        count = raw_file.readinto(view[total:])
+        if not count:
+            break
+        total += count
+    return total
+
+
+def compare_files_binary(left_path, right_path, chunk_size=DEFAULT_HASH_CHUNK_SIZE):
+    """두 파일을 같은 오프셋씩 번갈아 읽어 바이트 단위로 비교.
+
+    첫 번째로 다른 블록에서 바로 멈추므로, 앞부분부터 달라지는 파일은 해시보다
+    훨씬 적게 읽는다. 한쪽이 먼저 끝나면 그 위치를 첫 차이로 본다.
+    읽을 수 없는 파일은 다른 것으로 판정한다.
+
+    Returns:
+        (same, first_diff_offset, bytes_read). 같거나 읽기 실패 시 offset은 None.
+    """
+    left_view = _get_read_buffer(chunk_size, 'left')
+    right_view = _get_read_buffer(chunk_size, 'right')
+    offset = 0
+    bytes_read = 0
+    try:
+        with open(left_path, "rb", buffering=0) as left_file, \
+                open(right_path, "rb", buffering=0) as right_file:
+            while True:
+                left_count = _read_full(left_file, left_view)
+                right_count = _read_full(right_file, right_view)
+                bytes_read += left_count + right_count
+                count = min(left_count, right_count)
+                if left_view[:count] != right_view[:count]:
+                    return False, offset + _first_difference(left_view, right_view, count), bytes_read
+                if left_count != right_count:
+                    return False, offset + count, bytes_read
+                if not count:
+                    return True, None, bytes_read
+                offset += count
+    except Exception:
+        return False, None, bytes_read
+
+
+def calculate_file_md5(filepath):
+    """파일의 MD5 해시 계산. 읽을 수 없으면 None."""
+    return calculate_file_digest(filepath, 'md5')
+
+
+HASH_BENCHMARK_BYTES = 256 * 1024 * 1024
+HASH_BENCHMARK_CHUNK = 1024 * 1024
+
+
+def benchmark_hash_algorithms(total_bytes=HASH_BENCHMARK_BYTES, chunk_size=HASH_BENCHMARK_CHUNK):
+    """메모리 버퍼를 해시해 알고리즘별 처리 속도를 측정 (디스크 I/O 제외).
+
+    Returns:
+        [(알고리즘 이름, MB/s), ...] (HASH_ALGORITHMS 순서)
+    """
+    data = os.urandom(chunk_size)
+    rounds = max(1, total_bytes // chunk_size)
+    results = []
+    for name in HASH_ALGORITHMS:
+        hasher = new_hasher(name)
+        started = time.perf_counter()
+        for _ in range(rounds):
+            hasher.update(data)
+        hasher.hexdigest()
+        elapsed = max(time.perf_counter() - started, 1e-9)
+        results.append((name, rounds * chunk_size / elapsed / (1024 * 1024)))
+    return results
+
+
+PARTIAL_HASH_BLOCK_SIZE = 64 * 1024
+
+
+def calculate_partial_fingerprint(filepath, size, block_size=PARTIAL_HASH_BLOCK_SIZE,
+                                  algorithm=DEFAULT_HASH_ALGORITHM):
+    """파일 앞/중간/끝 블록만 읽어 만든 빠른 지문. 읽을 수 없으면 None.
+
+    파일 크기가 세 블록 이하이면 파일 전체를 읽으므로 지문 비교만으로 결론이 난다.
+    """
+    hasher = new_hasher(algorithm)
+    try:
+        with open(filepath, "rb") as f:
+            if size <= block_size * 3:
+                hasher.update(f.read())
+            else:
+                view = _get_read_buffer(block_size, 'partial')
+                for offset in (0, (size - block_size) // 2, size - block_size):
+                    f.seek(offset)
+                    count = f.readinto(view)
+                    hasher.update(view[:count])
+        return hasher.hexdigest()
+    except Exception:
+        return None
+
+
+def compare_pair_batch(items, algorithm=DEFAULT_HASH_ALGORITHM,
+                       block_size=PARTIAL_HASH_BLOCK_SIZE, chunk_size=DEFAULT_HASH_CHUNK_SIZE):
+    """프로세스 풀 작업 단위: 크기가 같은 파일 쌍 여러 개를 차례로 판정.
+
+    items: [(key, left_path, right_path, size), ...]
+    Returns: [(key, same, stage, left_digest, right_digest, bytes_read), ...]
+        stage는 'partial' 또는 'full'이고, 파일 전체의 해시를 얻은 경우에만
+        digest가 채워진다 (부모 프로세스에서 캐시에 저장).
+    """
+    results = []
+    for key, left_path, right_path, size in items:
+        left = calculate_partial_fingerprint(left_path, size, block_size, algorithm)
+        right = calculate_partial_fingerprint(right_path, size, block_size, algorithm)
+        bytes_read = 2 * min(size, block_size * 3)
+        if left is not None and right is not None:
+            if size <= block_size * 3:
+                results.append((key, left == right, 'partial', left, right, bytes_read))
+                continue
+            if left != right:
+                results.append((key, False, 'partial', None, None, bytes_read))
+                continue
+        left, left_read = hash_file(left_path, algorithm, chunk_size)
+        right, right_read = hash_file(right_path, algorithm, chunk_size)
+        results.append((key, left == right, 'full', left, right,
+                        bytes_read + left_read + right_read))
+    return results
+
+
+DEFAULT_HASH_CACHE_MAX_ENTRIES = 500000
+# mtime/ctime이 이 시간(ns) 이내인 파일은 같은 시각으로 다시 수정될 수 있어 캐시하지 않음
+HASH_CACHE_RACY_WINDOW_NS = 2 * 10 ** 9
+
+
+# 폴더 스캔 결과 한 항목: 절대 경로와 DirEntry stat에서 얻은 메타데이터
+# ctime_ns는 mtime을 보존하는 복사(copy2)로 제자리에서 덮어쓴 파일을 구분하는 데 쓴다
+FileEntry = namedtuple('FileEntry', 'path size mtime_ns dev ino ctime_ns', defaults=(0,))
+
+
+def stat_file_entry(path):
+    """단일 파일을 stat해 FileEntry로 반환. 실패 시 None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return None
+    return FileEntry(path, st.st_size, st.st_mtime_ns, st.st_dev, st.st_ino, st.st_ctime_ns)
+
+
+def format_mtime_ns(mtime_ns):
+    """mtime_ns를 트리 표시용 문자열로 변환"""
+    return datetime.fromtimestamp(mtime_ns / 1e9).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def format_byte_size(num_bytes):
+    """바이트 수를 진행률 표시용 문자열로 변환 (예: 12.3 MB)"""
+    value = float(num_bytes)
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if value < 1024 or unit == 'GB':
+            break
+        value /= 1024
+    if unit == 'B':
+        return f"{int(value)} B"
+    return f"{value:.1f} {unit}"
+
+
+def format_duration(seconds):
+    """남은 시간을 m:ss 또는 h:mm:ss 형식으로 변환"""
+    seconds = max(0, int(seconds + 0.5))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
+
+
+class CompareCancelled(Exception):
+    """폴더 비교가 취소되었을 때 작업 스레드 내부와 compare_folders()에서 사용"""
+
+
+_GLOB_CHARS = frozenset('*?[')
+
+
+class ExcludeMatcher:
+    """제외 패턴(.gitignore 형식)을 한 번 컴파일해 두고 재사용하는 매처.
+
+    패턴마다 fnmatch를 반복 호출하는 대신, 글롭 문자가 없는 이름은 집합으로,
+    나머지는 하나의 결합 정규식으로 묶는다. 판정 규칙은 기존 should_exclude와 같다:
+      - 'name/' 폴더 패턴: 폴더 경로 구성요소가 name과 매칭되거나 경로가 'name/'로 시작
+      - 파일 패턴: 전체 경로, 파일 이름, 경로 구성요소 중 하나라도 매칭
+    """
+
+    def __init__(self, patterns):
+        self.patterns = tuple(patterns)
+        # fnmatch.fnmatch와 같이 os.path.normcase 기준으로 대소문자 구분 여부 결정
+        self._ignore_case = os.path.normcase('A') == 'a'
+        flags = re.IGNORECASE if self._ignore_case else 0
+
+        dir_literals, dir_globs, dir_prefixes = set(), [], []
+        file_literals, file_globs, path_globs = set(), [], []
+
+        for pattern in self.patterns:
+            normalized = pattern.replace(os.sep, '/')
+            if normalized.endswith('/'):
+                folder_pattern = normalized.rstrip('/')
+                dir_prefixes.append(self._fold(folder_pattern + '/'))
+                if _GLOB_CHARS.isdisjoint(folder_pattern):
+                    dir_literals.add(self._fold(folder_pattern))
+                else:
+                    dir_globs.append(fnmatch.translate(folder_pattern))
+            else:
+                if _GLOB_CHARS.isdisjoint(normalized):
+                    file_literals.add(self._fold(normalized))
+                else:
+                    file_globs.append(fnmatch.translate(normalized))
+                # 전체 경로 매칭: fnmatch의 *, ?, [...]는 '/'와도 매칭되므로 글롭 패턴은 모두,
+                # 글롭이 없으면 '/'가 들어 있는 패턴만 경로 구성요소 검사와 결과가 달라짐
+                if '/' in normalized or not _GLOB_CHARS.isdisjoint(normalized):
+                    path_globs.append(fnmatch.translate(normalized))
+
+        def combine(parts):
+            return re.compile('|'.join(parts), flags).match if parts else None
+
+        self._dir_literals = frozenset(dir_literals)
+        self._dir_regex = combine(dir_globs)
+        self._dir_prefixes = tuple(dir_prefixes)
+        self._file_literals = frozenset(file_literals)
+        self._file_regex = combine(file_globs)
+        self._path_regex = combine(path_globs)
+
+    def __bool__(self):
+        return bool(self.patterns)
+
+    def _fold(self, text):
+        return text.lower() if self._ignore_case else text
+
+    def _dir_name_matches(self, name):
+        """폴더 구성요소 이름이 폴더 패턴 또는 파일 패턴과 매칭되는지"""
+        folded = self._fold(name)
+        if folded in self._dir_literals or folded in self._file_literals:
+            return True
+        if self._dir_regex is not None and self._dir_regex(name):
+            return True
+        return self._file_regex is not None and self._file_regex(name) is not None
+
+    def _file_name_matches(self, name):
+        if self._fold(name) in self._file_literals:
+            return True
+        return self._file_regex is not None and self._file_regex(name) is not None
+
+    def excludes_dir(self, rel_dir):
+        """폴더(슬래시 구분 상대 경로) 아래 모든 파일이 제외되는지. True면 탐색 생략 가능."""
+        name = rel_dir.rsplit('/', 1)[-1]
+        if self._dir_name_matches(name):
+            return True
+        return bool(self._dir_prefixes) and self._fold(rel_dir + '/').startswith(self._dir_prefixes)
+
+    def excludes_walked_file(self, rel_path, name):
+        """상위 폴더가 이미 excludes_dir로 걸러진 상태에서 파일 제외 여부 판정."""
+        if self._file_name_matches(name):
+            return True
+        return self._path_regex is not None and self._path_regex(rel_path) is not None
+
+    def excludes_dir_path(self, rel_dir):
+        """폴더 자신이나 상위 폴더 중 하나라도 excludes_dir에 걸리는지 (단독 판정용)."""
+        if not self.patterns or not rel_dir:
+            return False
+        parts = rel_dir.split('/')
+        return any(self.excludes_dir('/'.join(parts[:index])) for index in range(1, len(parts) + 1))
+
+    def excludes(self, rel_path):
+        """슬래시 구분 상대 경로 전체에 대한 제외 여부 (단독 판정용)."""
+        if not self.patterns:
+            return False
+        parts = rel_path.split('/')
+        for index in range(1, len(parts)):
+            if self.excludes_dir('/'.join(parts[:index])):
+                return True
+        return self.excludes_walked_file(rel_path, parts[-1])
+
+
+@functools.lru_cache(maxsize=8)
+def compile_exclude_patterns(patterns):
+    """제외 패턴 튜플을 ExcludeMatcher로 컴파일 (같은 패턴은 재사용)."""
+    return ExcludeMatcher(patterns)
+
+
+def scan_folder_tree(root_folder, exclude=None, cancel_event=None, on_progress=None, match_root=''):
+    """os.scandir로 폴더를 순회해 {상대 경로: FileEntry} 목록을 만든다.
+
+    상대 경로는 상위 디렉토리 접두어에 이름을 이어 붙여 만들고, 크기/수정 시각은
+    DirEntry에 캐시된 stat에서 가져온다. os.walk와 마찬가지로 디렉토리 심볼릭
+    링크는 따라가지 않고, 읽을 수 없는 디렉토리는 건너뛴다.
+    exclude(ExcludeMatcher)에 걸리는 폴더는 내려가지 않고, 걸리는 파일은
+    목록 대신 제외 집합에 담긴다.
+    match_root는 root_folder가 비교 루트의 하위 폴더일 때 그 '/' 구분 상대 경로로,
+    경로 패턴이 비교 루트 기준 전체 경로로 판정되게 한다.
+    cancel_event가 설정되면 CompareCancelled를 발생시키고, on_progress는
+    디렉토리 하나를 읽을 때마다 새로 찾은 파일 수와 함께 호출된다.
+
+    Returns:
+        (files, excluded_files, excluded_dirs)
+    """
+    files = {}
+    excluded_files = set()
+    excluded_dirs = set()
+    matcher = exclude if exclude else None
+    sep = os.sep
+    # (절대 경로, os.sep 구분 상대 접두어, 매칭용 '/' 구분 상대 접두어)
+    stack = [(root_folder, '', match_root + '/' if match_root else '')]
+
+    while stack:
+        if cancel_event is not None and cancel_event.is_set():
+            raise CompareCancelled()
+        dir_path, rel_prefix, match_prefix = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        found_before = len(files)
+        for entry in entries:
+            rel_path = rel_prefix + entry.name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                try:
+                    is_symlink = entry.is_symlink()
+                except OSError:
+                    is_symlink = False
+                if is_symlink:
+                    continue
+                if matcher is not None and matcher.excludes_dir(match_prefix + entry.name):
+                    excluded_dirs.add(rel_path)
+                    continue
+                stack.append((entry.path, rel_path + sep, match_prefix + entry.name + '/'))
+                continue
+
+            if matcher is not None and matcher.excludes_walked_file(match_prefix + entry.name, entry.name):
+                excluded_files.add(rel_path)
+                continue
+
+            try:
+                st = entry.stat()
+            except OSError:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+            files[rel_path] = FileEntry(entry.path, st.st_size, st.st_mtime_ns, st.st_dev, st.st_ino,
+                                        st.st_ctime_ns)
+
+        if on_progress is not None:
+            on_progress(len(files) - found_before)
+
+    return files, excluded_files, excluded_dirs
+
+
+def file_cache_key(entry, algorithm='md5'):
+    """FileEntry로 해시 캐시 키를 만든다. 파일을 식별할 수 없으면 None."""
+    if entry is None or not entry.ino:
+        return None
+    return f"{entry.dev}:{entry.ino}:{entry.size}:{entry.mtime_ns}:{entry.ctime_ns}:{algorithm}"
+
+
+def resolve_file_identity(entry):
+    """Windows의 DirEntry stat은 st_ino/st_dev가 0이므로 필요할 때만 다시 stat."""
+    if entry is None or entry.ino:
+        return entry
+    try:
+        st = os.stat(entry.path)
+    except OSError:
+        return entry
+    return entry._replace(dev=st.st_dev, ino=st.st_ino)
+
+
+class HashCache:
+    """(device, inode, size, mtime_ns, ctime_ns) 키 기반 영구 콘텐츠 해시 캐시.
+
+    SQLite(WAL 모드)에 저장하므로 여러 창이 동시에 써도 안전하다. 조회/저장은
+    메모리에 모았다가 flush()에서 한 트랜잭션으로 기록하고, 새 항목을 넣은 flush는
+    같은 트랜잭션에서 최근 사용한 max_entries개만 남기고 지운다 (다른 프로세스가
+    같은 파일에 넣은 항목까지 포함해 제한이 지켜지고, 테이블 전체를 세지 않는다).
+    디렉토리 Merkle 다이제스트(FolderMerkleTree)도 같은 방식으로 dir_digests
+    테이블에 저장한다.
+    """
+
+    def __init__(self, path, max_entries=DEFAULT_HASH_CACHE_MAX_ENTRIES):
+        self.path = str(path)
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self._pending_puts = {}
+        self._pending_hits = set()
+        self._pending_dir_puts = {}
+        self._pending_dir_hits = set()
+        self._conn = None
+        try:
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS file_hashes ('
+                ' cache_key TEXT PRIMARY KEY,'
+                ' digest TEXT NOT NULL,'
+                ' last_used INTEGER NOT NULL)'
+            )
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS file_hashes_last_used ON file_hashes (last_used)'
+            )
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS dir_digests ('
+                ' signature TEXT PRIMARY KEY,'
+                ' digest TEXT NOT NULL,'
+                ' last_used INTEGER NOT NULL)'
+            )
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS dir_digests_last_used ON dir_digests (last_used)'
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"해시 캐시 열기 실패: {e}")
+            self._close_connection()
+
+    def _close_connection(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def get(self, entry, algorithm='md5'):
+        """캐시된 digest 반환. 없으면 None."""
+        key = file_cache_key(entry, algorithm)
+        if key is None:
+            return None
+        with self._lock:
+            if key in self._pending_puts:
+                return self._pending_puts[key]
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    'SELECT digest FROM file_hashes WHERE cache_key = ?', (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            if row is None:
+                return None
+            self._pending_hits.add(key)
+            return row[0]
+
+    def put(self, entry, digest, algorithm='md5'):
+        """digest 저장 예약. 방금 수정된 파일은 mtime 해상도 문제로 저장하지 않음."""
+        key = file_cache_key(entry, algorithm)
+        if key is None or digest is None:
+            return
+        if time.time_ns() - max(entry.mtime_ns, entry.ctime_ns) < HASH_CACHE_RACY_WINDOW_NS:
+            return
+        with self._lock:
+            self._pending_puts[key] = digest
+            if len(self._pending_puts) >= 1000:
+                self._flush_locked()
+
+    def get_dir(self, signature):
+        """디렉토리 stat 서명에 저장된 Merkle 다이제스트. 없으면 None."""
+        with self._lock:
+            if signature in self._pending_dir_puts:
+                return self._pending_dir_puts[signature]
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    'SELECT digest FROM dir_digests WHERE signature = ?', (signature,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            if row is None:
+                return None
+            self._pending_dir_hits.add(signature)
+            return row[0]
+
+    def put_dir(self, signature, digest):
+        """디렉토리 Merkle 다이제스트 저장 예약"""
+        if digest is None:
+            return
+        with self._lock:
+            self._pending_dir_puts[signature] = digest
+
+    def flush(self):
+        """모아둔 조회/저장 기록을 디스크에 반영하고 크기 제한을 적용."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._conn is None or not (self._pending_puts or self._pending_hits
+                                      or self._pending_dir_puts or self._pending_dir_hits):
+            return
+        now = time.time_ns()
+        try:
+            with self._conn:
+                for table, key_column, puts, hits in (
+                    ('file_hashes', 'cache_key', self._pending_puts, self._pending_hits),
+                    ('dir_digests', 'signature', self._pending_dir_puts, self._pending_dir_hits),
+                ):
+                    if not (puts or hits):
+                        continue
+                    # 새 키만 INSERT되고 (rowcount = 늘어난 항목 수), 이미 있던 키는 UPDATE로 덮어씀
+                    inserted = self._conn.executemany(
+                        f'INSERT OR IGNORE INTO {table} ({key_column}, digest, last_used) VALUES (?, ?, ?)',
+                        [(key, digest, now) for key, digest in puts.items()]
+                    ).rowcount
+                    self._conn.executemany(
+                        f'UPDATE {table} SET digest = ?, last_used = ? WHERE {key_column} = ?',
+                        [(digest, now, key) for key, digest in puts.items()]
+                    )
+                    self._conn.executemany(
+                        f'UPDATE {table} SET last_used = ? WHERE {key_column} = ?',
+                        [(now, key) for key in hits]
+                    )
+                    # 항목이 늘었을 때만 last_used 인덱스를 따라 최근 max_entries개 뒤를 지움
+                    if inserted != 0:
+                        self._conn.execute(
+                            f'DELETE FROM {table} WHERE rowid IN ('
+                            f' SELECT rowid FROM {table} ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                            (self.max_entries,)
+                        )
+        except sqlite3.Error as e:
+            print(f"해시 캐시 저장 실패: {e}")
+        self._pending_puts.clear()
+        self._pending_hits.clear()
+        self._pending_dir_puts.clear()
+        self._pending_dir_hits.clear()
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._pending_puts.clear()
+            self._pending_hits.clear()
+            self._pending_dir_puts.clear()
+            self._pending_dir_hits.clear()
+            if self._conn is None:
+                return
+            try:
+                with self._conn:
+                    self._conn.execute('DELETE FROM file_hashes')
+                    self._conn.execute('DELETE FROM dir_digests')
+            except sqlite3.Error as e:
+                print(f"해시 캐시 삭제 실패: {e}")
+
+    def close(self):
+        """남은 기록을 저장하고 연결 종료"""
+        with self._lock:
+            self._flush_locked()
+            self._close_connection()
+
+
+class HashEngine:
+    """스레드 풀 기반 폴더 비교 해시 엔진.
+
+    hashlib은 해시 계산 중 GIL을 놓기 때문에 여러 파일을 스레드로 동시에
+    읽고 해시할 수 있다. 한 쌍의 왼쪽/오른쪽 파일도 각각 별도 작업으로 제출된다.
+
+    내용 비교는 단계별로 진행한다:
+      1) 크기가 다르면 읽지 않고 바로 '다름'
+      2) 크기가 같으면 앞/중간/끝 블록 지문 비교
+      3) 지문이 같고 파일이 지문 범위보다 크면 전체 해시 비교
+    HashCache가 주어지면 양쪽 전체 해시가 캐시에 있는 쌍은 읽지 않고 판정하고,
+    새로 계산한 전체 해시는 캐시에 저장한다.
+
+    backend='process'이면 해시를 프로세스 풀에서 계산한다 (GIL을 놓지 않는
+    순수 파이썬 해시(crc32 등)나 작은 파일이 매우 많을 때 유리). 작은 파일 쌍은
+    batch_size개씩 묶고, 오래 걸릴 작업(큰 묶음)부터 제출한다.
+    """
+
+    def __init__(self, max_workers=None, block_size=PARTIAL_HASH_BLOCK_SIZE, cache=None,
+                 algorithm=DEFAULT_HASH_ALGORITHM, chunk_size=DEFAULT_HASH_CHUNK_SIZE,
+                 backend=DEFAULT_HASH_BACKEND, process_workers=0,
+                 batch_size=DEFAULT_PROCESS_BATCH_SIZE):
+        self.max_workers = normalize_hash_workers(max_workers)
+        self.backend = normalize_hash_backend(backend)
+        self.process_workers = normalize_process_workers(process_workers)
+        self.batch_size = normalize_process_batch_size(batch_size)
+        self.algorithm = normalize_hash_algorithm(algorithm)
+        self.chunk_size = chunk_size
+        self.block_size = block_size
+        self.cache = cache
+        # 단계별 판정 개수 (size / cache / partial / full)
+        self.stats = {'size': 0, 'cache': 0, 'partial': 0, 'full': 0}
+        # 지금까지 해시하려고 읽은 바이트 수 (진행률 표시용)
+        self.bytes_hashed = 0
+
+    def compare_pairs(self, pairs, cancel_event=None, poll_interval=0.05):
+        """(key, left_entry, right_entry) FileEntry 쌍의 내용이 같은지 판정.
+
+        판정이 끝난 쌍부터 (key, same)을 yield한다.
+        cancel_event가 설정되면 대기 중인 작업을 취소하고 조용히 끝낸다.
+        동시에 제출하는 작업 수는 작업자 수에 비례하도록 제한해 메모리를 아낀다.
+        """
+        if self.backend == 'process':
+            return self._compare_pairs_process(pairs, cancel_event, poll_interval)
+        return self._compare_pairs_threaded(pairs, cancel_event, poll_interval)
+
+    def _lookup_cached_pair(self, left_entry, right_entry):
+        """캐시 조회용으로 파일 식별자를 채우고 양쪽 캐시 digest를 반환."""
+        if self.cache is None:
+            return left_entry, right_entry, {'left': None, 'right': None}
+        left_entry = resolve_file_identity(left_entry)
+        right_entry = resolve_file_identity(right_entry)
+        cached = {
+            'left': self.cache.get(left_entry, self.algorithm),
+            'right': self.cache.get(right_entry, self.algorithm),
+        }
+        return left_entry, right_entry, cached
+
+    def _compare_pairs_threaded(self, pairs, cancel_event, poll_interval):
+        pair_iter = iter(pairs)
+        max_in_flight = self.max_workers * 4
+        pending = {}
+        states = {}
+
+        def submit_stage(key, stage):
+            state = states[key]
+            state['stage'] = stage
+            state['left'] = state['right'] = None
+            state['waiting'] = 0
+            if stage == 'partial':
+                func, args = calculate_partial_fingerprint, (state['size'], self.block_size, self.algorithm)
+                state['read_size'] = min(state['size'], self.block_size * 3)
+            else:
+                func, args = hash_file, (self.algorithm, self.chunk_size)
+            for side in ('left', 'right'):
+                if stage == 'full' and state['cached'][side] is not None:
+                    state[side] = state['cached'][side]
+                    continue
+                future = executor.submit(func, state[side + '_entry'].path, *args)
+                pending[future] = (key, side)
+                state['waiting'] += 1
+
+        def finish_stage(key):
+            """현재 단계 결과로 판정. 결론이 나면 same 값, 다음 단계로 넘기면 None."""
+            state = states[key]
+            left, right = state['left'], state['right']
+            if state['stage'] == 'full':
+                self.stats['full'] += 1
+                return left == right
+            if left is not None and right is not None:
+                if state['size'] <= self.block_size * 3:
+                    # 지문이 파일 전체의 해시이므로 전체 해시처럼 캐시에 저장
+                    if self.cache is not None:
+                        self.cache.put(state['left_entry'], left, self.algorithm)
+                        self.cache.put(state['right_entry'], right, self.algorithm)
+                    self.stats['partial'] += 1
+                    return left == right
+                if left != right:
+                    self.stats['partial'] += 1
+                    return False
+            submit_stage(key, 'full')
+            return None
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                      thread_name_prefix='conferatur-hash')
+        try:
+            exhausted = False
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+
+                # 작업 창 채우기 (크기만으로 판정되는 쌍은 바로 반환)
+                while not exhausted and len(pending) < max_in_flight:
+                    try:
+                        key, left_entry, right_entry = next(pair_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if left_entry.size != right_entry.size:
+                        self.stats['size'] += 1
+                        yield key, False
+                        continue
+                    left_entry, right_entry, cached = self._lookup_cached_pair(left_entry, right_entry)
+                    if cached['left'] is not None and cached['right'] is not None:
+                        self.stats['cache'] += 1
+                        yield key, cached['left'] == cached['right']
+                        continue
+                    states[key] = {
+                        'left_entry': left_entry,
+                        'right_entry': right_entry,
+                        'size': left_entry.size,
+                        'cached': cached,
+                    }
+                    submit_stage(key, 'partial')
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key, side = pending.pop(future)
+                    state = states[key]
+                    state['waiting'] -= 1
+                    if state['stage'] == 'full':
+                        state[side], bytes_read = future.result()
+                        self.bytes_hashed += bytes_read
+                    else:
+                        state[side] = future.result()
+                        self.bytes_hashed += state['read_size']
+                    if state['stage'] == 'full' and self.cache is not None:
+                        self.cache.put(state[side + '_entry'], state[side], self.algorithm)
+                    if state['waiting']:
+                        continue
+                    same = finish_stage(key)
+                    if same is not None:
+                        del states[key]
+                        yield key, same
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            if self.cache is not None:
+                self.cache.flush()
+
+    def _compare_pairs_process(self, pairs, cancel_event, poll_interval):
+        """프로세스 풀 판정. 작업 목록을 먼저 만들어야 하므로 pairs를 끝까지 읽는다."""
+        entries = {}
+        jobs = []
+        small = []
+        for key, left_entry, right_entry in pairs:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            if left_entry.size != right_entry.size:
+                self.stats['size'] += 1
+                yield key, False
+                continue
+            left_entry, right_entry, cached = self._lookup_cached_pair(left_entry, right_entry)
+            if cached['left'] is not None and cached['right'] is not None:
+                self.stats['cache'] += 1
+                yield key, cached['left'] == cached['right']
+                continue
+            entries[key] = (left_entry, right_entry)
+            item = (key, left_entry.path, right_entry.path, left_entry.size)
+            if left_entry.size >= PROCESS_SMALL_FILE_LIMIT:
+                jobs.append([item])
+                continue
+            small.append(item)
+            if len(small) >= self.batch_size:
+                jobs.append(small)
+                small = []
+        if small:
+            jobs.append(small)
+        if not jobs:
+            return
+
+        # 가장 오래 걸릴 작업부터 제출해 마지막에 큰 파일 하나만 남는 상황을 피함
+        jobs.sort(key=lambda batch: sum(item[3] + PROCESS_FILE_COST_BYTES for item in batch),
+                  reverse=True)
+        job_iter = iter(jobs)
+        max_in_flight = self.process_workers * 2
+        pending = {}
+        cancelled = False
+
+        # fork는 GUI 스레드와 함께 쓰면 위험하므로 항상 spawn으로 새 인터프리터를 띄움
+        executor = ProcessPoolExecutor(max_workers=self.process_workers,
+                                       mp_context=multiprocessing.get_context('spawn'))
+        try:
+            exhausted = False
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = True
+                    return
+
+                while not exhausted and len(pending) < max_in_flight:
+                    batch = next(job_iter, None)
+                    if batch is None:
+                        exhausted = True
+                        break
+                    future = executor.submit(compare_pair_batch, batch, self.algorithm,
+                                             self.block_size, self.chunk_size)
+                    pending[future] = batch
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del pending[future]
+                    for key, same, stage, left, right, bytes_read in future.result():
+                        left_entry, right_entry = entries.pop(key)
+                        self.stats[stage] += 1
+                        self.bytes_hashed += bytes_read
+                        if self.cache is not None:
+                            self.cache.put(left_entry, left, self.algorithm)
+                            self.cache.put(right_entry, right, self.algorithm)
+                        yield key, same
+        finally:
+            for future in pending:
+                future.cancel()
+            # 취소 시에는 실행 중인 작업을 기다리지 않음 (프로세스는 작업을 마치고 종료)
+            executor.shutdown(wait=not cancelled)
+            if self.cache is not None:
+                self.cache.flush()
+
+    def digest_entries(self, items, cancel_event=None, poll_interval=0.05):
+        """(key, FileEntry) 각각의 전체 해시를 계산해 끝나는 대로 (key, digest)를 yield.
+
+        캐시에 있으면 읽지 않고, 새로 계산한 해시는 캐시에 저장한다.
+        읽을 수 없는 파일의 digest는 None.
+        """
+        item_iter = iter(items)
+        max_in_flight = self.max_workers * 2
+        pending = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                      thread_name_prefix='conferatur-digest')
+        try:
+            exhausted = False
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+
+                while not exhausted and len(pending) < max_in_flight:
+                    try:
+                        key, entry = next(item_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if self.cache is not None:
+                        entry = resolve_file_identity(entry)
+                        digest = self.cache.get(entry, self.algorithm)
+                        if digest is not None:
+                            self.stats['cache'] += 1
+                            yield key, digest
+                            continue
+                    future = executor.submit(hash_file, entry.path, self.algorithm, self.chunk_size)
+                    pending[future] = (key, entry)
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key, entry = pending.pop(future)
+                    digest, bytes_read = future.result()
+                    self.bytes_hashed += bytes_read
+                    self.stats['full'] += 1
+                    if self.cache is not None:
+                        self.cache.put(entry, digest, self.algorithm)
+                    yield key, digest
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            if self.cache is not None:
+                self.cache.flush()
+
+    def compare_pairs_binary(self, pairs, cancel_event=None, poll_interval=0.05):
+        """compare_pairs와 같지만 해시 대신 바이트를 직접 비교.
+
+        (key, same, first_diff_offset)을 yield한다. 크기가 다른 쌍은 읽지 않고
+        바로 다름(offset None)으로 판정하고, 해시가 없으므로 캐시는 쓰지 않는다.
+        """
+        pair_iter = iter(pairs)
+        max_in_flight = self.max_workers * 2
+        pending = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                      thread_name_prefix='conferatur-binary')
+        try:
+            exhausted = False
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+
+                while not exhausted and len(pending) < max_in_flight:
+                    try:
+                        key, left_entry, right_entry = next(pair_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    if left_entry.size != right_entry.size:
+                        self.stats['size'] += 1
+                        yield key, False, None
+                        continue
+                    future = executor.submit(compare_files_binary, left_entry.path,
+                                             right_entry.path, self.chunk_size)
+                    pending[future] = key
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = pending.pop(future)
+                    same, offset, bytes_read = future.result()
+                    self.bytes_hashed += bytes_read
+                    self.stats['full'] += 1
+                    yield key, same, offset
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+
+class FolderMerkleTree:
+    """한쪽 폴더 스캔 결과로 만든 디렉토리별 Merkle 다이제스트.
+
+    디렉토리 경로는 os.sep 구분 상대 경로이고 루트는 ''이다.
+      signatures: 하위 전체 파일의 이름/크기/mtime_ns/ctime_ns/inode 서명. 파일 하나만
+          바뀌어도 달라지므로 HashCache에 내용 다이제스트를 저장하는 키로 쓴다.
+      contents: 하위 전체 파일의 이름/크기/내용 해시로 만든 다이제스트.
+          해시를 모르는 파일이 있으면 None. 양쪽의 같은 상대 경로 디렉토리
+          값이 같으면 그 아래 파일은 모두 양쪽에 있고 내용도 같다.
+      times: 하위 전체 파일의 이름/mtime_ns 다이제스트 (해시 + 날짜 비교용).
+    """
+
+    def __init__(self, files, algorithm=DEFAULT_HASH_ALGORITHM):
+        self.files = files
+        self.algorithm = normalize_hash_algorithm(algorithm)
+        dir_files = {}
+        dirs = {''}
+        for rel_path in files:
+            parent = rel_path.rpartition(os.sep)[0]
+            dir_files.setdefault(parent, []).append(rel_path)
+            while parent not in dirs:
+                dirs.add(parent)
+                parent = parent.rpartition(os.sep)[0]
+        self.subdirs = {path: [] for path in dirs}
+        for path in dirs:
+            if path:
+                self.subdirs[path.rpartition(os.sep)[0]].append(path)
+        # 디렉토리별 (이름, 종류 'F'/'D', 상대 경로) 목록 (이름 순)
+        self.children = {}
+        for path in dirs:
+            children = [(rel.rpartition(os.sep)[2], 'F', rel) for rel in dir_files.get(path, ())]
+            children.extend((rel.rpartition(os.sep)[2], 'D', rel) for rel in self.subdirs[path])
+            children.sort()
+            self.children[path] = children
+        # 하위 디렉토리가 먼저 오도록 깊은 것부터 (bottom-up 계산 순서)
+        self.bottom_up = sorted(dirs, key=lambda path: path.count(os.sep) + bool(path), reverse=True)
+
+        self.signatures = {}
+        self.times = {}
+        self.contents = {}
+        for path in self.bottom_up:
+            parts = [self.algorithm]
+            time_parts = []
+            for name, kind, rel in self.children[path]:
+                if kind == 'D':
+                    parts += ('D', name, self.signatures[rel])
+                    time_parts += ('D', name, self.times[rel])
+                    continue
+                entry = files[rel]
+                # Windows의 DirEntry stat은 inode가 0이므로 대신 경로를 씀
+                identity = f"{entry.dev}:{entry.ino}" if entry.ino else entry.path
+                parts += ('F', name, str(entry.size), str(entry.mtime_ns), str(entry.ctime_ns), identity)
+                time_parts += ('F', name, str(entry.mtime_ns))
+            self.signatures[path] = self._digest(parts)
+            self.times[path] = self._digest(time_parts)
+
+    @staticmethod
+    def _digest(parts):
+        # 이름에는 NUL이 들어갈 수 없으므로 NUL로 이어 붙이면 경계가 모호하지 않음
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update('\0'.join(parts).encode('utf-8', 'surrogatepass'))
+        return hasher.hexdigest()
+
+    def load_contents(self, cache):
+        """HashCache에 저장된 디렉토리 내용 다이제스트를 서명으로 찾아 채움"""
+        for path, signature in self.signatures.items():
+            self.contents[path] = cache.get_dir(signature)
+
+    def update_contents(self, cache):
+        """아직 모르는 디렉토리 다이제스트를 캐시된 파일 해시로 계산해 저장.
+
+        하위 파일 중 하나라도 캐시에 해시가 없으면 그 디렉토리(와 상위)는 건너뛴다.
+        """
+        for path in self.bottom_up:
+            if self.contents.get(path) is not None:
+                continue
+            parts = []
+            for name, kind, rel in self.children[path]:
+                if kind == 'D':
+                    digest = self.contents.get(rel)
+                    size = ''
+                else:
+                    entry = resolve_file_identity(self.files[rel])
+                    digest = cache.get(entry, self.algorithm)
+                    size = str(entry.size)
+                if digest is None:
+                    break
+                parts += (kind, name, size, digest)
+            else:
+                self.contents[path] = self._digest(parts)
+                cache.put_dir(self.signatures[path], self.contents[path])
+
+    def files_outside(self, skip_dirs):
+        """skip_dirs 하위로는 내려가지 않고 나머지 파일 상대 경로를 yield"""
+        skip_dirs = set(skip_dirs)
+        if '' in skip_dirs:
+            return
+        stack = ['']
+        while stack:
+            path = stack.pop()
+            for _name, kind, rel in self.children[path]:
+                if kind == 'F':
+                    yield rel
+                elif rel not in skip_dirs:
+                    stack.append(rel)
+
+
+def find_identical_subtrees(left_tree, right_tree, compare_times=False):
+    """양쪽 내용 다이제스트가 같은 최상위 디렉토리 목록 (루트면 [''])
+
+    compare_times이면 파일 mtime_ns까지 모두 같아야 한다 (해시 + 날짜 비교).
+    """
+    identical = []
+    stack = ['']
+    while stack:
+        path = stack.pop()
+        digest = left_tree.contents.get(path)
+        if (digest is not None and digest == right_tree.contents.get(path)
+                and (not compare_times or left_tree.times[path] == right_tree.times[path])):
+            identical.append(path)
+            continue
+        stack.extend(sub for sub in left_tree.subdirs[path] if sub in right_tree.subdirs)
+    return sorted(identical)
+
+
+# 폴더 매니페스트: 첫 줄은 JSON 머리글, 이후 한 줄에 한 파일씩
+# ["슬래시 구분 상대 경로", size, mtime_ns, digest] JSON 배열
+MANIFEST_FORMAT = 'conferatur-manifest'
+MANIFEST_VERSION = 1
+MANIFEST_EXTENSION = '.cfmanifest'
+
+
+class ManifestError(Exception):
+    """매니페스트 파일을 읽을 수 없거나 비교에 쓸 수 없음"""
+
+
+def read_manifest_header(path):
+    """매니페스트 머리글(dict). 매니페스트가 아니면 None."""
+    try:
+        if not os.path.isfile(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(header, dict) or header.get('format') != MANIFEST_FORMAT:
+        return None
+    if not isinstance(header.get('algorithm'), str):
+        return None
+    return header
+
+
+def is_folder_manifest(path):
+    """경로가 폴더 대신 쓸 수 있는 매니페스트 파일인지"""
+    return read_manifest_header(path) is not None
+
+
+def write_folder_manifest(root_folder, manifest_path, algorithm=DEFAULT_HASH_ALGORITHM,
+                          exclude=None, hash_workers=None, chunk_size=DEFAULT_HASH_CHUNK_SIZE,
+                          cache=None, cancel_event=None, on_progress=None):
+    """폴더를 스캔/해시해 매니페스트로 저장.
+
+    해시가 끝나는 파일부터 한 줄씩 임시 파일에 바로 기록하므로 전체 목록을
+    메모리에 모으지 않는다. 다 쓰면 manifest_path로 교체하고, 취소되면
+    (CompareCancelled) 임시 파일을 지운다. on_progress(done, total)는 파일
+    하나를 기록할 때마다 호출된다.
+
+    Returns:
+        기록한 파일 수
+    """
+    algorithm = normalize_hash_algorithm(algorithm)
+    files, _excluded_files, _excluded_dirs = scan_folder_tree(root_folder, exclude, cancel_event)
+    header = {
+        'format': MANIFEST_FORMAT,
+        'version': MANIFEST_VERSION,
+        'algorithm': algorithm,
+        'root': os.path.abspath(root_folder),
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'exclude_patterns': list(exclude.patterns) if exclude else [],
+        'files': len(files),
+    }
+    engine = HashEngine(hash_workers, cache=cache, algorithm=algorithm, chunk_size=chunk_size)
+    temp_path = manifest_path + '.tmp'
+    written = 0
+    try:
+        with open(temp_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(json.dumps(header) + '\n')
+            for rel_path, digest in engine.digest_entries(sorted(files.items()), cancel_event):
+                entry = files[rel_path]
+                f.write(json.dumps([rel_path.replace(os.sep, '/'), entry.size, entry.mtime_ns, digest],
+                                   separators=(',', ':')) + '\n')
+                written += 1
+                if on_progress is not None:
+                    on_progress(written, len(files))
+        if cancel_event is not None and cancel_event.is_set():
+            raise CompareCancelled()
+        os.replace(temp_path, manifest_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return written
+
+
+def load_folder_manifest(manifest_path, exclude=None, cancel_event=None):
+    """매니페스트를 scan_folder_tree와 같은 모양으로 읽음.
+
+    FileEntry의 path는 None이고 (실제 파일 없음) 내용 해시는 digests에 담긴다.
+    exclude는 폴더 스캔과 같은 규칙으로 적용한다.
+
+    Returns:
+        (header, files, digests, excluded_files, excluded_dirs)
+    """
+    header = read_manifest_header(manifest_path)
+    if header is None:
+        raise ManifestError(manifest_path)
+    files = {}
+    digests = {}
+    excluded_files = set()
+    excluded_dirs = set()
+    dir_excluded = {}  # 슬래시 구분 폴더 경로 -> 제외 여부 (상위 폴더부터 판정)
+
+    def excluded_ancestor(parts):
+        for index in range(1, len(parts)):
+            folder = '/'.join(parts[:index])
+            if folder not in dir_excluded:
+                dir_excluded[folder] = exclude.excludes_dir(folder)
+            if dir_excluded[folder]:
+                return folder
+        return None
+
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        f.readline()
+        for line_number, line in enumerate(f, 2):
+            if cancel_event is not None and line_number % 10000 == 0 and cancel_event.is_set():
+                raise CompareCancelled()
+            if not line.strip():
+                continue
+            try:
+                slash_path, size, mtime_ns, digest = json.loads(line)
+                rel_path = slash_path.replace('/', os.sep)
+                # JSON으로는 읽혀도 값의 형식이 틀리면 나중에 비교 중에 터지므로 여기서 거름
+                if not isinstance(size, int) or not isinstance(mtime_ns, int) or \
+                        not (digest is None or isinstance(digest, str)):
+                    raise TypeError(line_number)
+            except (ValueError, TypeError, AttributeError):
+                raise ManifestError(f"{manifest_path}:{line_number}")
+            if exclude:
+                parts = slash_path.split('/')
+                folder = excluded_ancestor(parts)
+                if folder is not None:
+                    excluded_dirs.add(folder.replace('/', os.sep))
+                    continue
+                if exclude.excludes_walked_file(slash_path, parts[-1]):
+                    excluded_files.add(rel_path)
+                    continue
+            files[rel_path] = FileEntry(None, size, mtime_ns, 0, 0)
+            digests[rel_path] = digest
+    return header, files, digests, excluded_files, excluded_dirs
+
+
+# 폴더 작업(비교, 일괄 복사)이 on_progress를 호출하는 최소 간격 (초)
+FOLDER_PROGRESS_INTERVAL_S = 0.1
+
+# 폴더 비교 결과 한 행: 상대 경로, 상태 문자열, 양쪽 FileEntry (없으면 None)
+# diff_offset은 바이트 비교에서 찾은 첫 차이 위치 (없으면 None)
+FolderCompareResult = namedtuple('FolderCompareResult', 'rel_path status left right diff_offset',
+                                 defaults=(None,))
+
+
+def decide_folder_status(method, left_entry, right_entry, content_same=None):
+    """비교 방식에 따라 한 파일의 폴더 비교 상태 문자열을 결정.
+
+    content_same은 양쪽 파일 내용이 같은지 여부 (md5/both 방식에서만 사용).
+    """
+    if not left_entry:
+        return "오른쪽만 존재"
+    if not right_entry:
+        return "왼쪽만 존재"
+
+    if method == "binary" and not content_same:
+        return "내용 다름 (바이트)"
+    if method in ("md5", "both") and not content_same:
+        return "내용 다름 (MD5)"
+
+    if method in ("date", "both") and left_entry.mtime_ns != right_entry.mtime_ns:
+        left_newer = left_entry.mtime_ns > right_entry.mtime_ns
+        if method == "date":
+            return "왼쪽이 최신" if left_newer else "오른쪽이 최신"
+        return "내용 같음, 왼쪽이 최신" if left_newer else "내용 같음, 오른쪽이 최신"
+
+    return "동일"
+
+
+def evaluate_folder_paths(left_folder, right_folder, rel_paths, method,
+                          hash_algorithm=DEFAULT_HASH_ALGORITHM, hash_workers=None,
+                          hash_chunk_size=DEFAULT_HASH_CHUNK_SIZE, cache=None, same_content=()):
+    """지정한 상대 경로만 다시 stat해서 판정 (복사/삭제 후 부분 갱신용).
+
+    전체 폴더를 다시 스캔하지 않고 decide_folder_status와 같은 규칙으로 판정한다.
+    same_content는 방금 복사해서 내용이 같다고 알고 있는 경로로, 다시 읽지 않는다.
+
+    Returns:
+        {rel_path: FolderCompareResult 또는 None}. 차이가 없거나 양쪽 모두 없으면 None.
+    """
+    entries = {}
+    pairs = []
+    hash_contents = method in ("md5", "both", "binary")
+    for rel_path in rel_paths:
+        left_entry = stat_file_entry(os.path.join(left_folder, rel_path))
+        right_entry = stat_file_entry(os.path.join(right_folder, rel_path))
+        entries[rel_path] = (left_entry, right_entry)
+        if hash_contents and left_entry and right_entry and rel_path not in same_content:
+            pairs.append((rel_path, left_entry, right_entry))
+
+    content_same = dict.fromkeys(same_content, True)
+    offsets = {}
+    if pairs:
+        if method == "binary":
+            engine = HashEngine(hash_workers, chunk_size=hash_chunk_size)
+            for rel_path, same, offset in engine.compare_pairs_binary(pairs):
+                content_same[rel_path] = same
+                offsets[rel_path] = offset
+        else:
+            engine = HashEngine(hash_workers, cache=cache, algorithm=hash_algorithm,
+                                chunk_size=hash_chunk_size)
+            for rel_path, same in engine.compare_pairs(pairs):
+                content_same[rel_path] = same
+
+    results = {}
+    for rel_path, (left_entry, right_entry) in entries.items():
+        results[rel_path] = None
+        if not left_entry and not right_entry:
+            continue
+        status = decide_folder_status(method, left_entry, right_entry, content_same.get(rel_path))
+        if status != "동일":
+            results[rel_path] = FolderCompareResult(rel_path, status, left_entry, right_entry,
+                                                    offsets.get(rel_path))
+    return results
+
+
+class FolderRefreshJob:
+    """evaluate_folder_paths를 백그라운드 스레드에서 실행 (FolderCompareJob과 같은 방식).
+
+    복사/삭제/동기화 뒤 바뀐 경로만 다시 판정할 때 큰 파일 해시로 GUI가 멈추지
+    않게 한다. 끝나면 results에 {상대 경로: FolderCompareResult 또는 None}이 담기고,
+    cancel()하면 판정은 끝까지 하되 결과를 버린다.
+    """
+
+    def __init__(self, left_folder, right_folder, rel_paths, method,
+                 hash_algorithm=DEFAULT_HASH_ALGORITHM, hash_workers=None,
+                 hash_chunk_size=DEFAULT_HASH_CHUNK_SIZE, cache_factory=None, same_content=()):
+        self.left_folder = left_folder
+        self.right_folder = right_folder
+        self.rel_paths = list(rel_paths)
+        self.method = method
+        self.hash_algorithm = normalize_hash_algorithm(hash_algorithm)
+        self.hash_workers = hash_workers
+        self.hash_chunk_size = hash_chunk_size
+        self.cache_factory = cache_factory
+        self.same_content = frozenset(same_content)
+
+        self.results = None
+        self.cancelled = False
+        self.error = None
+
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='conferatur-folder-refresh', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def run(self):
+        """현재 스레드에서 바로 실행 (CLI/테스트용)"""
+        self._run()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def cancel_requested(self):
+        return self._cancel_event.is_set()
+
+    def is_done(self):
+        return self._done_event.is_set()
+
+    def wait(self, timeout=None):
+        return self._done_event.wait(timeout)
+
+    def _run(self):
+        cache = None
+        try:
+            if self.cache_factory is not None and self.method in ("md5", "both"):
+                cache = self.cache_factory()
+            results = evaluate_folder_paths(
+                self.left_folder, self.right_folder, self.rel_paths, self.method,
+                hash_algorithm=self.hash_algorithm, hash_workers=self.hash_workers,
+                hash_chunk_size=self.hash_chunk_size, cache=cache, same_content=self.same_content)
+            if self._cancel_event.is_set():
+                self.cancelled = True
+            else:
+                self.results = results
+        except Exception as e:
+            self.error = e
+        finally:
+            if cache is not None:
+                cache.close()
+            self._done_event.set()
+
+
+class FolderCompareJob:
+    """폴더 비교(스캔 → 내용 판정 → 상태 결정)를 백그라운드 스레드에서 실행.
+
+    Tk 위젯에는 손대지 않고 진행 카운터와 결과만 채운다. GUI는 root.after로
+    snapshot()을 주기적으로 읽어 진행률을 표시하고, results에 쌓이는 행을
+    작업이 끝나기 전에도 조금씩 트리에 넣는다.
+
+    results는 판정이 끝난 순서대로 뒤에 추가만 되는 목록이다. 한쪽에만 있는
+    파일(과 날짜 비교 결과)은 스캔 직후 바로, 내용 비교 결과는 해시가 끝나는
+    대로 추가되므로 경로 순서가 아니다.
+
+    left_folder/right_folder 대신 폴더 매니페스트 파일을 줄 수 있다. 매니페스트
+    쪽은 저장된 해시를 쓰고 (해시 알고리즘도 매니페스트를 따름), 양쪽 모두
+    매니페스트이면 파일을 전혀 읽지 않는다.
+
+    on_result(result)는 결과 행이 추가될 때마다, on_progress(snapshot)은 진행
+    상태가 바뀔 때 (최대 FOLDER_PROGRESS_INTERVAL_S 간격, 끝날 때는 항상) 작업
+    스레드에서 호출된다. cancel_event를 주면 외부에서 그 이벤트로 취소할 수 있다.
+    """
+
+    def __init__(self, left_folder, right_folder, method, exclude_matcher=None,
+                 hash_workers=None, cache_factory=None, hash_algorithm=DEFAULT_HASH_ALGORITHM,
+                 hash_chunk_size=DEFAULT_HASH_CHUNK_SIZE, hash_backend=DEFAULT_HASH_BACKEND,
+                 process_workers=0, process_batch_size=DEFAULT_PROCESS_BATCH_SIZE,
+                 on_result=None, on_progress=None, cancel_event=None):
+        self.left_folder = left_folder
+        self.right_folder = right_folder
+        self.method = method
+        self.hash_algorithm = normalize_hash_algorithm(hash_algorithm)
+        self.hash_chunk_size = hash_chunk_size
+        self.hash_backend = normalize_hash_backend(hash_backend)
+        self.process_workers = process_workers
+        self.process_batch_size = process_batch_size
+        self.exclude_matcher = exclude_matcher
+        self.hash_workers = hash_workers
+        self.cache_factory = cache_factory
+        self.on_result = on_result
+        self.on_progress = on_progress
+        self._progress_reported_at = 0.0
+
+        self.phase = 'pending'  # pending / scan / hash / done
+        self.files_scanned = 0
+        self.pairs_total = 0
+        self.pairs_done = 0
+        self.started_at = None
+        self.hash_started_at = None
+
+        self.results = []
+        self.excluded_files = set()
+        self.excluded_dirs = set()
+        # Merkle 다이제스트가 같아 통째로 건너뛴 최상위 폴더와 그 안의 파일 수
+        self.identical_dirs = []
+        self.files_skipped = 0
+        self.cancelled = False
+        self.error = None
+
+        self._engine = None
+        self._cancel_event = cancel_event if cancel_event is not None else threading.Event()
+        self._done_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='conferatur-folder-compare', daemon=True)
+
+    def start(self):
+        self.started_at = time.monotonic()
+        self._thread.start()
+
+    def run(self):
+        """start() 대신 호출한 스레드에서 끝까지 실행 (스레드 풀이나 스크립트용)."""
+        self.started_at = time.monotonic()
+        self._run()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def cancel_requested(self):
+        return self._cancel_event.is_set()
+
+    def is_done(self):
+        return self._done_event.is_set()
+
+    def wait(self, timeout=None):
+        """작업이 끝날 때까지 기다림. GUI 없이 쓸 때용. 끝났으면 True."""
+        return self._done_event.wait(timeout)
+
+    def snapshot(self):
+        """진행 상태 사본. 처리량(bytes/s)과 남은 시간(초, 모르면 None)을 포함."""
+        engine = self._engine
+        bytes_hashed = engine.bytes_hashed if engine is not None else 0
+        throughput = 0.0
+        eta = None
+        if self.hash_started_at is not None:
+            elapsed = time.monotonic() - self.hash_started_at
+            if elapsed > 0:
+                throughput = bytes_hashed / elapsed
+                if self.pairs_total and self.pairs_done:
+                    fraction = self.pairs_done / self.pairs_total
+                    eta = elapsed * (1 - fraction) / fraction
+        return {
+            'phase': self.phase,
+            'files_scanned': self.files_scanned,
+            'pairs_total': self.pairs_total,
+            'pairs_done': self.pairs_done,
+            'bytes_hashed': bytes_hashed,
+            'throughput': throughput,
+            'eta': eta,
+        }
+
+    def _count_scanned(self, count):
+        self.files_scanned += count
+        self._report_progress()
+
+    def _count_pair_done(self):
+        self.pairs_done += 1
+        self._report_progress()
+
+    def _report_progress(self, force=False):
+        if self.on_progress is None:
+            return
+        now = time.monotonic()
+        if force or now - self._progress_reported_at >= FOLDER_PROGRESS_INTERVAL_S:
+            self._progress_reported_at = now
+            self.on_progress(self.snapshot())
+
+    def _add_result(self, result):
+        self.results.append(result)
+        if self.on_result is not None:
+            self.on_result(result)
+
+    def _skip_identical_subtrees(self, left_files, right_files, cache):
+        """양쪽 Merkle 다이제스트가 같은 폴더를 찾아 비교할 경로에서 뺌.
+
+        Returns:
+            ((left_tree, right_tree), left_paths, right_paths)
+        """
+        left_tree = FolderMerkleTree(left_files, self.hash_algorithm)
+        right_tree = FolderMerkleTree(right_files, self.hash_algorithm)
+        left_tree.load_contents(cache)
+        right_tree.load_contents(cache)
+        self.identical_dirs = find_identical_subtrees(left_tree, right_tree, self.method == "both")
+        if not self.identical_dirs:
+            return (left_tree, right_tree), left_files.keys(), right_files.keys()
+        left_paths = set(left_tree.files_outside(self.identical_dirs))
+        right_paths = set(right_tree.files_outside(self.identical_dirs))
+        self.files_skipped = len(left_files) - len(left_paths)
+        return (left_tree, right_tree), left_paths, right_paths
+
+    def _load_side(self, folder):
+        """폴더는 스캔하고 매니페스트는 읽음.
+
+        Returns:
+            (files, excluded_files, excluded_dirs, digests, manifest_header)
+            폴더이면 digests와 manifest_header는 None.
+        """
+        if os.path.isfile(folder):
+            header, files, digests, excluded_files, excluded_dirs = load_folder_manifest(
+                folder, self.exclude_matcher, self._cancel_event)
+            self._count_scanned(len(files))
+            return files, excluded_files, excluded_dirs, digests, header
+        files, excluded_files, excluded_dirs = scan_folder_tree(
+            folder, self.exclude_matcher, self._cancel_event, self._count_scanned)
+        return files, excluded_files, excluded_dirs, None, None
+
+    def _compare_with_manifest(self, common_pairs, left_digests, right_digests, cache):
+        """한쪽 이상이 매니페스트인 쌍의 내용 비교. (rel_path, same)을 yield.
+
+        매니페스트 쪽은 저장된 digest를, 폴더 쪽은 전체 해시(캐시 사용)를 쓴다.
+        digest를 모르는 (읽을 수 없던) 파일은 다름으로 본다.
+        """
+        to_hash = []
+        for rel_path, left_entry, right_entry in common_pairs:
+            if left_entry.size != right_entry.size:
+                yield rel_path, False
+            elif left_digests is not None and right_digests is not None:
+                left, right = left_digests[rel_path], right_digests[rel_path]
+                yield rel_path, left is not None and left == right
+            else:
+                to_hash.append((rel_path, right_entry if left_digests is not None else left_entry))
+        if not to_hash:
+            return
+        known = left_digests if left_digests is not None else right_digests
+        self._engine = HashEngine(self.hash_workers, cache=cache, algorithm=self.hash_algorithm,
+                                  chunk_size=self.hash_chunk_size)
+        for rel_path, digest in self._engine.digest_entries(to_hash, self._cancel_event):
+            yield rel_path, digest is not None and digest == known[rel_path]
+
+    def _run(self):
+        cache = None
+        try:
+            self.phase = 'scan'
+            left_files, left_excluded, left_excluded_dirs, left_digests, left_header = \
+                self._load_side(self.left_folder)
+            right_files, right_excluded, right_excluded_dirs, right_digests, right_header = \
+                self._load_side(self.right_folder)
+            self.excluded_files = left_excluded | right_excluded  # 제외된 파일의 고유 경로
+            self.excluded_dirs = left_excluded_dirs | right_excluded_dirs
+
+            # 매니페스트의 해시를 쓰려면 같은 알고리즘으로 비교해야 함
+            hash_contents = self.method in ("md5", "both", "binary")
+            manifest_algorithms = {header['algorithm'] for header in (left_header, right_header) if header}
+            uses_manifest = bool(manifest_algorithms)
+            if uses_manifest and self.method == "binary":
+                raise ManifestError("binary compare needs files on both sides")
+            if uses_manifest and hash_contents:
+                if len(manifest_algorithms) > 1:
+                    raise ManifestError("manifests use different hash algorithms: "
+                                        + ", ".join(sorted(manifest_algorithms)))
+                manifest_algorithm = manifest_algorithms.pop()
+                # 설치되지 않은 알고리즘이면 HashEngine이 md5로 대신해 모든 쌍이 다르게 나옴
+                if manifest_algorithm not in HASH_ALGORITHMS:
+                    raise ManifestError(f"manifest hash algorithm is not available: {manifest_algorithm}")
+                self.hash_algorithm = manifest_algorithm
+
+            # 해시 비교는 지난 비교에서 저장한 폴더 다이제스트로 같은 하위 트리를 통째로 건너뜀
+            left_paths, right_paths = left_files.keys(), right_files.keys()
+            merkle_trees = ()
+            if self.method in ("md5", "both") and self.cache_factory and not uses_manifest:
+                cache = self.cache_factory()
+                merkle_trees, left_paths, right_paths = self._skip_identical_subtrees(
+                    left_files, right_files, cache)
+
+            # 내용 비교가 필요 없는 파일은 바로 판정 (차이가 있는 파일만 표시)
+            for rel_path in sorted(left_paths | right_paths):
+                left_entry = left_files.get(rel_path)
+                right_entry = right_files.get(rel_path)
+                if hash_contents and left_entry and right_entry:
+                    continue
+                status = decide_folder_status(self.method, left_entry, right_entry)
+                if status != "동일":
+                    self._add_result(FolderCompareResult(rel_path, status, left_entry, right_entry))
+
+            common_pairs = [
+                (rel_path, left_files[rel_path], right_files[rel_path])
+                for rel_path in sorted(left_paths & right_paths)
+            ] if hash_contents else []
+            self.pairs_total = len(common_pairs)
+
+            # 바이트 비교: 양쪽 파일을 나란히 읽다가 첫 차이에서 멈춤
+            if self.method == "binary":
+                self._engine = HashEngine(self.hash_workers, chunk_size=self.hash_chunk_size)
+                self.hash_started_at = time.monotonic()
+                self.phase = 'hash'
+                for rel_path, same, offset in self._engine.compare_pairs_binary(common_pairs, self._cancel_event):
+                    self._count_pair_done()
+                    left_entry = left_files[rel_path]
+                    right_entry = right_files[rel_path]
+                    status = decide_folder_status(self.method, left_entry, right_entry, same)
+                    if status != "동일":
+                        self._add_result(FolderCompareResult(rel_path, status, left_entry, right_entry, offset))
+
+            # 매니페스트 비교: 저장된 해시와 비교 (양쪽 모두 매니페스트면 파일 읽기 없음)
+            elif hash_contents and uses_manifest:
+                if self.cache_factory and (left_digests is None or right_digests is None):
+                    cache = self.cache_factory()
+                self.hash_started_at = time.monotonic()
+                self.phase = 'hash'
+                for rel_path, same in self._compare_with_manifest(common_pairs, left_digests,
+                                                                  right_digests, cache):
+                    self._count_pair_done()
+                    left_entry = left_files[rel_path]
+                    right_entry = right_files[rel_path]
+                    status = decide_folder_status(self.method, left_entry, right_entry, same)
+                    if status != "동일":
+                        self._add_result(FolderCompareResult(rel_path, status, left_entry, right_entry))
+
+            # 해시 비교: 크기 → 부분 지문 → 전체 해시 순으로 병렬 판정
+            elif hash_contents:
+                self._engine = HashEngine(self.hash_workers, cache=cache, algorithm=self.hash_algorithm,
+                                          chunk_size=self.hash_chunk_size, backend=self.hash_backend,
+                                          process_workers=self.process_workers,
+                                          batch_size=self.process_batch_size)
+                self.hash_started_at = time.monotonic()
+                self.phase = 'hash'
+                for rel_path, same in self._engine.compare_pairs(common_pairs, self._cancel_event):
+                    self._count_pair_done()
+                    left_entry = left_files[rel_path]
+                    right_entry = right_files[rel_path]
+                    status = decide_folder_status(self.method, left_entry, right_entry, same)
+                    if status != "동일":
+                        self._add_result(FolderCompareResult(rel_path, status, left_entry, right_entry))
+
+            if self._cancel_event.is_set():
+                raise CompareCancelled()
+
+            # 이번에 캐시된 파일 해시로 폴더 다이제스트를 채워 다음 비교에 사용
+            for tree in merkle_trees:
+                tree.update_contents(cache)
+        except CompareCancelled:
+            self.cancelled = True
+        except Exception as e:
+            self.error = e
+        finally:
+            if cache is not None:
+                cache.close()
+            self.phase = 'done'
+            self._report_progress(force=True)
+            self._done_event.set()
+
+
+class FolderManifestExportJob:
+    """폴더 매니페스트 내보내기를 백그라운드 스레드에서 실행 (FolderCompareJob과 같은 방식)"""
+
+    def __init__(self, folder, manifest_path, exclude_matcher=None, hash_workers=None,
+                 cache_factory=None, hash_algorithm=DEFAULT_HASH_ALGORITHM,
+                 hash_chunk_size=DEFAULT_HASH_CHUNK_SIZE):
+        self.folder = folder
+        self.manifest_path = manifest_path
+        self.exclude_matcher = exclude_matcher
+        self.hash_workers = hash_workers
+        self.cache_factory = cache_factory
+        self.hash_algorithm = normalize_hash_algorithm(hash_algorithm)
+        self.hash_chunk_size = hash_chunk_size
+
+        self.files_total = 0
+        self.files_done = 0
+        self.cancelled = False
+        self.error = None
+
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='conferatur-manifest-export', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def cancel_requested(self):
+        return self._cancel_event.is_set()
+
+    def is_done(self):
+        return self._done_event.is_set()
+
+    def _on_progress(self, done, total):
+        self.files_done = done
+        self.files_total = total
+
+    def _run(self):
+        cache = self.cache_factory() if self.cache_factory else None
+        try:
+            write_folder_manifest(self.folder, self.manifest_path, self.hash_algorithm,
+                                  self.exclude_matcher, self.hash_workers, self.hash_chunk_size,
+                                  cache, self._cancel_event, self._on_progress)
+        except CompareCancelled:
+            self.cancelled = True
+        except Exception as e:
+            self.error = e
+        finally:
+            if cache is not None:
+                cache.close()
+            self._done_event.set()
+
+
+# 일괄 복사: 동시에 복사하는 파일 수, 한 번에 넘기는 크기(취소/진행률 확인 단위),
+# 복사 중인 임시 파일 접미사 (다 쓴 뒤 대상 이름으로 교체)
+DEFAULT_COPY_WORKERS = 4
+COPY_CHUNK_SIZE = 8 * 1024 * 1024
+COPY_TEMP_SUFFIX = '.conferatur-part'
+# 커널 복사를 이 파일/파일 시스템 조합이 지원하지 않을 때 나는 오류 (다음 방식으로 넘어감)
+_KERNEL_COPY_FALLBACK_ERRNOS = frozenset(
+    getattr(errno, name)
+    for name in ('EXDEV', 'ENOSYS', 'EINVAL', 'EOPNOTSUPP', 'ENOTSUP', 'EBADF', 'ETXTBSY')
+    if hasattr(errno, name)
+)
+
+
+def _kernel_copy_functions():
+    """(이름, 함수(src_fd, dst_fd, src_offset, count) -> 복사한 바이트) 목록. 앞쪽부터 시도"""
+    functions = []
+    if hasattr(os, 'copy_file_range'):
+        functions.append(('copy_file_range',
+                          lambda src_fd, dst_fd, offset, count: os.copy_file_range(src_fd, dst_fd, count, offset)))
+    if hasattr(os, 'sendfile') and sys.platform.startswith('linux'):
+        # Linux만 일반 파일 -> 일반 파일 sendfile을 지원함
+        functions.append(('sendfile',
+                          lambda src_fd, dst_fd, offset, count: os.sendfile(dst_fd, src_fd, offset, count)))
+    return functions
+
+
+_KERNEL_COPY_FUNCTIONS = _kernel_copy_functions()
+
+
+def copy_file_data(src_file, dst_file, cancel_event=None, on_bytes=None, chunk_size=COPY_CHUNK_SIZE):
+    """열린 두 바이너리 파일(버퍼 없음) 사이에서 내용을 복사.
+
+    가능하면 데이터를 사용자 공간으로 가져오지 않는 커널 복사(copy_file_range,
+    Linux의 sendfile)를 쓰고, 파일 시스템이 지원하지 않으면 읽기/쓰기로 넘어간다.
+    chunk_size마다 cancel_event를 확인하고 on_bytes(이번에 복사한 바이트 수)를 부른다.
+
+    Returns:
+        사용한 방식 ('copy_file_range' / 'sendfile' / 'readwrite')
+    """
+    src_fd = src_file.fileno()
+    dst_fd = dst_file.fileno()
+    for name, kernel_copy in _KERNEL_COPY_FUNCTIONS:
+        offset = 0
+        try:
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise CompareCancelled()
+                count = kernel_copy(src_fd, dst_fd, offset, chunk_size)
+                if count == 0:
+                    return name
+                offset += count
+                if on_bytes is not None:
+                    on_bytes(count)
+        except OSError as e:
+            # 이미 일부를 썼으면 다른 방식으로 이어 쓸 수 없으므로 그대로 실패
+            if offset or e.errno not in _KERNEL_COPY_FALLBACK_ERRNOS:
+                raise
+
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    while True:
+        if cancel_event is not None and cancel_event.is_set():
+            raise CompareCancelled()
+        count = src_file.readinto(buffer)
+        if not count:
+            return 'readwrite'
+        written = 0
+        while written < count:
+            written += dst_file.write(view[written:count])
+        if on_bytes is not None:
+            on_bytes(count)
+
+
+def copy_file_atomic(src_path, dst_path, cancel_event=None, on_bytes=None, chunk_size=COPY_CHUNK_SIZE,
+                     make_dirs=True):
+    """src_path를 dst_path로 복사 (shutil.copy2처럼 수정 시각/권한도 복사).
+
+    대상 폴더의 임시 파일에 다 쓴 뒤 os.replace로 바꾸므로 실패하거나 취소되어도
+    대상이 반쯤 쓰인 채로 남지 않는다 (임시 파일은 지움). make_dirs가 False면
+    대상 폴더가 이미 있다고 보고 만들지 않는다.
+    """
+    dst_dir = os.path.dirname(dst_path)
+    if make_dirs:
+        os.makedirs(dst_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix='.' + os.path.basename(dst_path) + '.',
+                                     suffix=COPY_TEMP_SUFFIX, dir=dst_dir)
+    try:
+        with os.fdopen(fd, 'wb', buffering=0) as dst_file, open(src_path, 'rb', buffering=0) as src_file:
+            copy_file_data(src_file, dst_file, cancel_event, on_bytes, chunk_size)
+        shutil.copystat(src_path, temp_path)
+        os.replace(temp_path, dst_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class FolderCopyJob:
+    """여러 파일을 한쪽 폴더에서 다른 쪽으로 복사하는 작업 (FolderCompareJob과 같은 방식).
+
+    작업 스레드에서 대상 목록을 만든 뒤 workers개 스레드로 나눠 copy_file_atomic으로
+    복사한다. 해시 캐시에 양쪽 다이제스트가 있고 같으면 내용 복사를 건너뛰고
+    수정 시각/권한만 맞춘다. 비교 뒤 원본이 사라진 경로는 failed에 남긴다.
+
+    snapshot()으로 바이트 기준 진행률/처리량/남은 시간을 읽을 수 있고, cancel()하면
+    복사 중이던 파일은 버리고 이미 끝난 파일만 남긴다.
+    """
+
+    def __init__(self, source_folder, target_folder, rel_paths, workers=DEFAULT_COPY_WORKERS,
+                 cache_factory=None, hash_algorithm=DEFAULT_HASH_ALGORITHM, chunk_size=COPY_CHUNK_SIZE,
+                 on_progress=None, cancel_event=None):
+        self.source_folder = source_folder
+        self.target_folder = target_folder
+        self.rel_paths = list(rel_paths)
+        self.workers = max(1, workers)
+        self.cache_factory = cache_factory
+        self.hash_algorithm = normalize_hash_algorithm(hash_algorithm)
+        self.chunk_size = chunk_size
+        self.make_dirs = True  # 파일마다 대상 폴더를 만들지 (FolderSyncJob은 미리 한 번에 만듦)
+        self.on_progress = on_progress
+        self._progress_reported_at = 0.0
+
+        self.phase = 'pending'  # pending / plan / copy / done
+        self.files_total = 0
+        self.files_done = 0
+        self.bytes_total = 0
+        self.bytes_done = 0
+        self.copy_started_at = None
+
+        self.copied = []    # 복사한 상대 경로
+        self.skipped = []   # 캐시된 다이제스트가 같아 내용 복사를 건너뛴 상대 경로
+        self.failed = []    # (상대 경로, 오류 메시지)
+        self.cancelled = False
+        self.error = None
+
+        self._lock = threading.Lock()
+        self._cancel_event = cancel_event if cancel_event is not None else threading.Event()
+        self._done_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='conferatur-folder-copy', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def run(self):
+        """start() 대신 호출한 스레드에서 끝까지 실행"""
+        self._run()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def cancel_requested(self):
+        return self._cancel_event.is_set()
+
+    def is_done(self):
+        return self._done_event.is_set()
+
+    def wait(self, timeout=None):
+        return self._done_event.wait(timeout)
+
+    def snapshot(self):
+        """진행 상태 사본. 처리량(bytes/s)과 남은 시간(초, 모르면 None)을 포함."""
+        with self._lock:
+            bytes_done = self.bytes_done
+            files_done = self.files_done
+        throughput = 0.0
+        eta = None
+        if self.copy_started_at is not None:
+            elapsed = time.monotonic() - self.copy_started_at
+            if elapsed > 0 and bytes_done:
+                throughput = bytes_done / elapsed
+                eta = (self.bytes_total - bytes_done) / throughput
+        return {
+            'phase': self.phase,
+            'files_total': self.files_total,
+            'files_done': files_done,
+            'files_skipped': len(self.skipped),
+            'bytes_total': self.bytes_total,
+            'bytes_done': bytes_done,
+            'throughput': throughput,
+            'eta': eta,
+        }
+
+    def _report_progress(self, force=False):
+        if self.on_progress is None:
+            return
+        now = time.monotonic()
+        if force or now - self._progress_reported_at >= FOLDER_PROGRESS_INTERVAL_S:
+            self._progress_reported_at = now
+            self.on_progress(self.snapshot())
+
+    def _count_bytes(self, count):
+        with self._lock:
+            self.bytes_done += count
+        self._report_progress()
+
+    def _plan(self, cache):
+        """복사할 (상대 경로, 원본, 대상, 크기) 목록. 다이제스트가 같은 파일은 속성만 맞추고 뺌"""
+        copies = []
+        for rel_path in self.rel_paths:
+            if self._cancel_event.is_set():
+                raise CompareCancelled()
+            source_path = os.path.join(self.source_folder, rel_path)
+            target_path = os.path.join(self.target_folder, rel_path)
+            source_entry = stat_file_entry(source_path)
+            if source_entry is None:
+                # 비교 이후 원본이 사라졌으면 조용히 빼지 않고 실패로 남긴다
+                self.failed.append((rel_path, str(FileNotFoundError(
+                    errno.ENOENT, os.strerror(errno.ENOENT), source_path))))
+                continue
+            if self._skip_identical(cache, rel_path, source_path, target_path, source_entry):
+                continue
+            copies.append((rel_path, source_path, target_path, source_entry.size))
+        return copies
+
+    def _skip_identical(self, cache, rel_path, source_path, target_path, source_entry):
+        """해시 캐시상 양쪽 내용이 같으면 수정 시각/권한만 맞추고 True (skipped 또는 failed에 기록)"""
+        if cache is None:
+            return False
+        target_entry = stat_file_entry(target_path)
+        if target_entry is None or target_entry.size != source_entry.size:
+            return False
+        source_digest = cache.get(source_entry, self.hash_algorithm)
+        if source_digest is None or source_digest != cache.get(target_entry, self.hash_algorithm):
+            return False
+        try:
+            shutil.copystat(source_path, target_path)
+            self.skipped.append(rel_path)
+        except OSError as e:
+            self.failed.append((rel_path, str(e)))
+        return True
+
+    def _copy_one(self, rel_path, source_path, target_path):
+        if self._cancel_event.is_set():
+            return
+        try:
+            copy_file_atomic(source_path, target_path, self._cancel_event, self._count_bytes, self.chunk_size,
+                             self.make_dirs)
+        except CompareCancelled:
+            return
+        except OSError as e:
+            with self._lock:
+                self.failed.append((rel_path, str(e)))
+            return
+        with self._lock:
+            self.copied.append(rel_path)
+            self.files_done += 1
+        self._report_progress()
+
+    def _copy_all(self, executor, copies):
+        futures = [executor.submit(self._copy_one, rel_path, source_path, target_path)
+                   for rel_path, source_path, target_path, _ in copies]
+        for future in futures:
+            future.result()
+
+    def _transfer(self, cache):
+        """대상 목록을 만들고 복사 (FolderSyncJob이 바꿔 씀)"""
+        copies = self._plan(cache)
+        self.files_total = len(copies)
+        self.bytes_total = sum(size for _, _, _, size in copies)
+
+        self.phase = 'copy'
+        self.copy_started_at = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='conferatur-copy') as executor:
+            self._copy_all(executor, copies)
+
+    def _run(self):
+        cache = None
+        try:
+            self.phase = 'plan'
+            if self.cache_factory is not None:
+                cache = self.cache_factory()
+            self._transfer(cache)
+            if self._cancel_event.is_set():
+                raise CompareCancelled()
+        except CompareCancelled:
+            self.cancelled = True
+        except Exception as e:
+            self.error = e
+        finally:
+            if cache is not None:
+                cache.close()
+            self.phase = 'done'
+            self._report_progress(force=True)
+            self._done_event.set()
+
+
+class FolderSyncJob(FolderCopyJob):
+    """build_sync_plan이 만든 작업 계획을 실행.
+
+    대상에 없는 폴더(mkdir)를 먼저 한 번에 만들고, copy/overwrite는 계획의 폴더 순서대로
+    작업 스레드에 넘겨 병렬로 복사한 뒤, 마지막으로 delete를 실행한다. 삭제로 비게 된
+    폴더도 지운다 (원래 비어 있던 폴더는 건드리지 않음). 진행률, 취소, 임시 파일 교체는
+    FolderCopyJob과 같다. 삭제한 경로는 deleted에 모은다. overwrite 중 해시 캐시상 내용이
+    같은 파일은 복사하지 않고 수정 시각/권한만 맞춰 skipped에 넣는다.
+    """
+
+    def __init__(self, source_folder, target_folder, operations, workers=DEFAULT_COPY_WORKERS,
+                 cache_factory=None, hash_algorithm=DEFAULT_HASH_ALGORITHM, chunk_size=COPY_CHUNK_SIZE,
+                 on_progress=None, cancel_event=None):
+        super().__init__(source_folder, target_folder, (), workers=workers, cache_factory=cache_factory,
+                         hash_algorithm=hash_algorithm, chunk_size=chunk_size,
+                         on_progress=on_progress, cancel_event=cancel_event)
+        self.operations = list(operations)
+        self.make_dirs = False
+        self.dirs_created = 0
+        self.deleted = []
+
+    def _delete_one(self, rel_path):
+        if self._cancel_event.is_set():
+            return
+        try:
+            os.remove(os.path.join(self.target_folder, rel_path))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            with self._lock:
+                self.failed.append((rel_path, str(e)))
+            return
+        with self._lock:
+            self.deleted.append(rel_path)
+            self.files_done += 1
+        self._report_progress()
+
+    def _transfer(self, cache):
+        mkdirs = []
+        copies = []
+        deletes = []
+        for operation in self.operations:
+            if self._cancel_event.is_set():
+                raise CompareCancelled()
+            if operation.action == 'mkdir':
+                mkdirs.append(operation.rel_path)
+                continue
+            if operation.action == 'delete':
+                deletes.append(operation.rel_path)
+                continue
+            source_path = os.path.join(self.source_folder, operation.rel_path)
+            target_path = os.path.join(self.target_folder, operation.rel_path)
+            if operation.action == 'overwrite':
+                source_entry = stat_file_entry(source_path)
+                if source_entry is not None and self._skip_identical(cache, operation.rel_path, source_path,
+                                                                     target_path, source_entry):
+                    continue
+            copies.append((operation.rel_path, source_path, target_path, operation.size))
+        self.files_total = len(copies) + len(deletes)
+        self.bytes_total = sum(size for _, _, _, size in copies)
+
+        self.phase = 'copy'
+        self.copy_started_at = time.monotonic()
+        # 폴더는 상위부터 정렬되어 있으므로 한 번씩만 mkdir하면 됨
+        for rel_dir in sorted(mkdirs):
+            if self._cancel_event.is_set():
+                raise CompareCancelled()
+            try:
+                os.makedirs(os.path.join(self.target_folder, rel_dir), exist_ok=True)
+                self.dirs_created += 1
+            except OSError as e:
+                self.failed.append((rel_dir, str(e)))
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='conferatur-sync') as executor:
+            self._copy_all(executor, copies)
+            if not self._cancel_event.is_set():
+                for future in [executor.submit(self._delete_one, rel_path) for rel_path in deletes]:
+                    future.result()
+        self._remove_emptied_dirs(self.deleted)
+
+    def _remove_emptied_dirs(self, rel_paths):
+        """지운 파일의 상위 폴더를 깊은 것부터 rmdir (비어 있지 않으면 그대로 둠)"""
+        dirs = set()
+        for rel_path in rel_paths:
+            rel_dir = os.path.dirname(rel_path)
+            while rel_dir and rel_dir not in dirs:
+                dirs.add(rel_dir)
+                rel_dir = os.path.dirname(rel_dir)
+        for rel_dir in sorted(dirs, key=len, reverse=True):
+            try:
+                os.rmdir(os.path.join(self.target_folder, rel_dir))
+            except OSError:
+                pass
+
+
+# 실시간 감시: 마지막 변경 후 반영까지 기다리는 시간(초),
+# 변경이 계속되어도 이 시간(초)이 지나면 반영, 폴링 방식의 디렉토리 확인 주기(초)
+FOLDER_WATCH_DEBOUNCE_S = 0.5
+FOLDER_WATCH_MAX_DELAY_S = 3.0
+FOLDER_WATCH_POLL_INTERVAL_S = 1.0
+# 폴링 감시에서 디렉토리 mtime과 상관없이 전체 목록을 다시 확인하는 주기 (틱 수).
+# 파일을 제자리에서 덮어쓰면 디렉토리 mtime이 바뀌지 않기 때문.
+FOLDER_WATCH_FULL_RESCAN_TICKS = 10
+
+# inotify 이벤트 마스크 (<sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_EXCL_UNLINK = 0x04000000
+IN_ISDIR = 0x40000000
+INOTIFY_WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+                      | IN_CREATE | IN_DELETE | IN_ONLYDIR | IN_EXCL_UNLINK)
+
+
+class InotifyHandle:
+    """ctypes로 감싼 최소한의 Linux inotify 인터페이스"""
+
+    EVENT_HEADER = struct.Struct('iIII')
+
+    def __init__(self, libc, fd):
+        self._libc = libc
+        self._fd = fd
+
+    @classmethod
+    def create(cls):
+        """inotify를 쓸 수 없는 환경이면 None"""
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+            fd = libc.inotify_init1(os.O_NONBLOCK | getattr(os, 'O_CLOEXEC', 0))
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        return cls(libc, fd)
+
+    def add_watch(self, path):
+        """감시 추가. 실패하면 (-1, errno)"""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), INOTIFY_WATCH_MASK)
+        return wd, (ctypes.get_errno() if wd < 0 else 0)
+
+    def rm_watch(self, wd):
+        self._libc.inotify_rm_watch(self._fd, wd)
+
+    def read_events(self, timeout):
+        """timeout(초) 동안 기다려 (wd, mask, name) 목록을 반환"""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        header = self.EVENT_HEADER
+        offset = 0
+        while offset + header.size <= len(data):
+            wd, mask, _cookie, length = header.unpack_from(data, offset)
+            offset += header.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            events.append((wd, mask, os.fsdecode(name)))
+        return events
+
+    def close(self):
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+
+
+class FolderWatcher:
+    """폴더 비교 양쪽 루트의 변경을 감시해 바뀐 상대 경로를 모아 둔다.
+
+    Linux에서는 inotify를 쓰고, 그 외 환경이거나 감시 개수 한도에 걸리면 디렉토리
+    mtime을 주기적으로 확인하는 폴링으로 대신한다. 변경은 작업 스레드에서 모으고,
+    GUI는 changes_ready()로 디바운스 여부를 보고 take_changes()로 한 묶음씩 가져간다.
+    파일 경로와 별도로, 통째로 생기거나 사라진 폴더 경로도 함께 알려 준다.
+    """
+
+    def __init__(self, roots, exclude_matcher=None, poll_interval=FOLDER_WATCH_POLL_INTERVAL_S,
+                 full_rescan_ticks=FOLDER_WATCH_FULL_RESCAN_TICKS):
+        self.roots = list(roots)
+        self.matcher = exclude_matcher if exclude_matcher else None
+        self.poll_interval = poll_interval
+        self.full_rescan_ticks = max(1, full_rescan_ticks)
+        self.backend = None  # 'inotify' / 'polling'
+
+        self._lock = threading.Lock()
+        self._paths = set()
+        self._dirs = set()
+        self._first_change = None
+        self._last_change = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        inotify = InotifyHandle.create()
+        self.backend = 'inotify' if inotify is not None else 'polling'
+        self._thread = threading.Thread(target=self._run, args=(inotify,),
+                                        name='conferatur-folder-watch', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """감시 중지 요청 (스레드는 다음 대기 주기에 스스로 끝남)"""
+        self._stop_event.set()
+
+    def changes_ready(self, debounce, max_delay):
+        """마지막 변경 후 debounce초가 지났거나 첫 변경 후 max_delay초가 지났으면 True"""
+        with self._lock:
+            if self._first_change is None:
+                return False
+            now = time.monotonic()
+            return now - self._last_change >= debounce or now - self._first_change >= max_delay
+
+    def take_changes(self):
+        """모인 변경을 가져가고 비움. Returns: (파일 상대 경로 set, 폴더 상대 경로 set)"""
+        with self._lock:
+            paths, dirs = self._paths, self._dirs
+            self._paths, self._dirs = set(), set()
+            self._first_change = self._last_change = None
+        return paths, dirs
+
+    def _record(self, rel_path, is_dir=False):
+        now = time.monotonic()
+        with self._lock:
+            (self._dirs if is_dir else self._paths).add(rel_path)
+            if self._first_change is None:
+                self._first_change = now
+            self._last_change = now
+
+    def _excluded(self, rel_path, name, is_dir):
+        if self.matcher is None:
+            return False
+        match_path = rel_path.replace(os.sep, '/')
+        if is_dir:
+            return self.matcher.excludes_dir(match_path)
+        return self.matcher.excludes_walked_file(match_path, name)
+
+    def _iter_dirs(self, root, rel_dir):
+        """rel_dir(포함) 아래 감시할 디렉토리 (심볼릭 링크와 제외 폴더는 건너뜀)"""
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            yield current
+            try:
+                with os.scandir(os.path.join(root, current)) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if not entry.is_dir() or entry.is_symlink():
+                        continue
+                except OSError:
+                    continue
+                child = os.path.join(current, entry.name) if current else entry.name
+                if not self._excluded(child, entry.name, True):
+                    stack.append(child)
+
+    def _run(self, inotify):
+        try:
+            if inotify is not None and self._run_inotify(inotify):
+                return
+            self.backend = 'polling'
+            self._run_polling()
+        except Exception as e:
+            print(f"폴더 감시 중 오류: {e}")
+
+    def _run_inotify(self, inotify):
+        """inotify 감시 루프. 감시 개수 한도로 시작하지 못하면 False"""
+        watches = {}  # wd -> (루트 인덱스, 상대 디렉토리)
+
+        def add_tree(root_index, rel_dir):
+            root = self.roots[root_index]
+            for current in self._iter_dirs(root, rel_dir):
+                wd, error = inotify.add_watch(os.path.join(root, current))
+                if wd >= 0:
+                    watches[wd] = (root_index, current)
+                elif error == errno.ENOSPC:
+                    return False
+            return True
+
+        def drop_tree(root_index, rel_dir):
+            prefix = rel_dir + os.sep
+            for wd, (index, current) in list(watches.items()):
+                if index == root_index and (current == rel_dir or current.startswith(prefix)):
+                    inotify.rm_watch(wd)
+                    del watches[wd]
+
+        try:
+            for root_index in range(len(self.roots)):
+                if not add_tree(root_index, ''):
+                    return False
+
+            while not self._stop_event.is_set():
+                for wd, mask, name in inotify.read_events(0.5):
+                    if mask & IN_Q_OVERFLOW:
+                        # 이벤트가 넘쳐 잃어버렸으면 전체를 다시 확인
+                        self._record('', True)
+                        continue
+                    if mask & IN_IGNORED:
+                        watches.pop(wd, None)
+                        continue
+                    location = watches.get(wd)
+                    if location is None or not name:
+                        continue
+                    root_index, rel_dir = location
+                    rel_path = os.path.join(rel_dir, name) if rel_dir else name
+                    if mask & IN_ISDIR:
+                        if self._excluded(rel_path, name, True):
+                            continue
+                        if mask & (IN_CREATE | IN_MOVED_TO):
+                            add_tree(root_index, rel_path)
+                        elif mask & IN_MOVED_FROM:
+                            drop_tree(root_index, rel_path)
+                        self._record(rel_path, True)
+                    elif not self._excluded(rel_path, name, False):
+                        self._record(rel_path)
+            return True
+        finally:
+            inotify.close()
+
+    def _run_polling(self):
+        """디렉토리 mtime 폴링 루프"""
+        # (루트 인덱스, 상대 디렉토리) -> (디렉토리 mtime_ns, {이름: (is_dir, size, mtime_ns)})
+        snapshots = {}
+
+        def list_dir(root_index, rel_dir):
+            path = os.path.join(self.roots[root_index], rel_dir)
+            try:
+                dir_mtime = os.stat(path).st_mtime_ns
+                with os.scandir(path) as it:
+                    entries = list(it)
+            except OSError:
+                return None
+            listing = {}
+            for entry in entries:
+                child = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                try:
+                    is_dir = entry.is_dir() and not entry.is_symlink()
+                    if self._excluded(child, entry.name, is_dir):
+                        continue
+                    if is_dir:
+                        listing[entry.name] = (True, 0, 0)
+                    else:
+                        st = entry.stat()
+                        listing[entry.name] = (False, st.st_size, st.st_mtime_ns)
+                except OSError:
+                    continue
+            return dir_mtime, listing
+
+        def snapshot_tree(root_index, rel_dir):
+            stack = [rel_dir]
+            while stack:
+                current = stack.pop()
+                snapshot = list_dir(root_index, current)
+                if snapshot is None:
+                    continue
+                snapshots[(root_index, current)] = snapshot
+                for name, (is_dir, _, _) in snapshot[1].items():
+                    if is_dir:
+                        stack.append(os.path.join(current, name) if current else name)
+
+        def drop_tree(root_index, rel_dir):
+            prefix = rel_dir + os.sep
+            for key in [key for key in snapshots
+                        if key[0] == root_index and (key[1] == rel_dir or key[1].startswith(prefix))]:
+                del snapshots[key]
+
+        def apply_listing(key, snapshot):
+            root_index, rel_dir = key
+            old_listing = snapshots[key][1]
+            new_listing = snapshot[1]
+            snapshots[key] = snapshot
+            for name in old_listing.keys() | new_listing.keys():
+                old_entry = old_listing.get(name)
+                new_entry = new_listing.get(name)
+                if old_entry == new_entry:
+                    continue
+                child = os.path.join(rel_dir, name) if rel_dir else name
+                was_dir = bool(old_entry and old_entry[0])
+                is_dir = bool(new_entry and new_entry[0])
+                if was_dir or is_dir:
+                    if was_dir and not is_dir:
+                        drop_tree(root_index, child)
+                    if is_dir and not was_dir:
+                        snapshot_tree(root_index, child)
+                    self._record(child, True)
+                if (old_entry and not was_dir) or (new_entry and not is_dir):
+                    self._record(child)
+
+        for root_index in range(len(self.roots)):
+            snapshot_tree(root_index, '')
+
+        tick = 0
+        while not self._stop_event.wait(self.poll_interval):
+            tick += 1
+            full_rescan = tick % self.full_rescan_ticks == 0
+            for key in list(snapshots):
+                if key not in snapshots:
+                    continue
+                if not full_rescan:
+                    try:
+                        dir_mtime = os.stat(os.path.join(self.roots[key[0]], key[1])).st_mtime_ns
+                    except OSError:
+                        dir_mtime = None
+                    if dir_mtime == snapshots[key][0]:
+                        continue
+                snapshot = list_dir(*key)
+                if snapshot is not None:
+                    apply_listing(key, snapshot)
+
+
+def expand_changed_dirs(roots, rel_dirs, exclude_matcher=None):
+    """통째로 바뀐 폴더 아래에 지금 있는 파일 상대 경로를 양쪽 루트에서 모음.
+
+    제외 패턴은 탐색 중에 적용해 제외된 폴더(node_modules 등)에는 내려가지 않는다.
+    """
+    matcher = exclude_matcher if exclude_matcher else None
+    paths = set()
+    for rel_dir in rel_dirs:
+        match_dir = rel_dir.replace(os.sep, '/')
+        if matcher is not None and matcher.excludes_dir_path(match_dir):
+            continue
+        prefix = rel_dir + os.sep if rel_dir else ''
+        for root in roots:
+            files, _, _ = scan_folder_tree(os.path.join(root, rel_dir), matcher, match_root=match_dir)
+            paths.update(prefix + rel_path for rel_path in files)
+    return paths
+
+
+# 폴더 비교 상태 문자열(내부 값)에 대응하는 기계용 코드 (CLI JSON 출력용)
+FOLDER_STATUS_CODES = {
+    "내용 다름 (MD5)": 'content_differs',
+    "내용 다름 (바이트)": 'content_differs_bytes',
+    "왼쪽만 존재": 'left_only',
+    "오른쪽만 존재": 'right_only',
+    "왼쪽이 최신": 'left_newer',
+    "오른쪽이 최신": 'right_newer',
+    "내용 같음, 왼쪽이 최신": 'same_content_left_newer',
+    "내용 같음, 오른쪽이 최신": 'same_content_right_newer',
+    "동일": 'identical',
+}
+
+
+# FolderResultModel.status 배열 값: 폴더, 삭제된 레코드, 그 외는 FOLDER_STATUSES 위치 + 1
+FOLDER_STATUSES = tuple(FOLDER_STATUS_CODES)
+RECORD_FOLDER = 0
+RECORD_REMOVED = -1
+# 루트 폴더를 가리키는 부모 레코드 번호
+ROOT_RECORD = -1
+
+# 폴더 배지 카운트 칸 (FolderResultModel.badges의 순서)
+FOLDER_BADGE_KEYS = ('differ', 'left_only', 'right_only', 'newer')
+_STATUS_BADGE_SLOTS = {
+    "내용 다름 (MD5)": 0,
+    "내용 다름 (바이트)": 0,
+    "왼쪽만 존재": 1,
+    "오른쪽만 존재": 2,
+    "왼쪽이 최신": 3,
+    "오른쪽이 최신": 3,
+    "내용 같음, 왼쪽이 최신": 3,
+    "내용 같음, 오른쪽이 최신": 3,
+}
+# 상태 코드(FolderResultModel.status 값) -> 배지 칸 (배지에 세지 않는 상태는 None)
+_CODE_BADGE_SLOTS = (None,) + tuple(_STATUS_BADGE_SLOTS.get(status) for status in FOLDER_STATUSES)
+
+# FolderResultModel.sort_key가 받는 열 이름
+FOLDER_SORT_COLUMNS = ('name', 'status', 'left_size', 'left_mtime', 'right_size', 'right_mtime')
+
+
+class FolderResultModel:
+    """폴더 비교 결과를 열(배열) 단위로 담는 저장소. 트리 화면과 무관한 원본 데이터.
+
+    레코드 번호 하나가 파일 또는 폴더 하나이고, 값은 레코드 번호를 첨자로 하는
+    배열에 들어 있다. 크기/수정 시각은 가공 전 정수(없으면 -1), 상태는 작은 정수
+    코드, 트리 구조는 parent 배열과 폴더별 자식 목록(경로순)으로 표현한다.
+    삭제된 레코드는 status를 RECORD_REMOVED로 바꿀 뿐 번호를 재사용하지 않는다.
+    """
+
+    def __init__(self):
+        self.paths = []               # 상대 경로 (os.sep 구분)
+        self.names = []               # 마지막 경로 요소
+        self.name_keys = []           # 이름 정렬 키 (소문자, 추가할 때 한 번만 계산)
+        self.path_keys = []           # 경로 검색 키 (소문자, '/' 구분)
+        self.parent = array('i')      # 부모 폴더 레코드 (ROOT_RECORD = 루트)
+        self.status = array('b')      # RECORD_FOLDER / RECORD_REMOVED / 상태 코드
+        self.left_size = array('q')
+        self.left_mtime = array('q')
+        self.right_size = array('q')
+        self.right_mtime = array('q')
+        self.diff_offset = array('q')
+        self.children = {ROOT_RECORD: []}  # 폴더 레코드 -> 자식 레코드 목록 (경로순)
+        self.badges = {}                   # 폴더 레코드 -> 자손 카운트 (FOLDER_BADGE_KEYS 순)
+        self.file_count = 0
+        self._files = {}                   # 파일 상대 경로 -> 레코드
+        self._folders = {'': ROOT_RECORD}  # 폴더 상대 경로 -> 레코드
+        # 상태 코드 -> 그 상태인 파일 레코드 집합 (상태 필터용)
+        self.status_buckets = {code: set() for code in range(1, len(FOLDER_STATUSES) + 1)}
+        # 전위 순서 배치 (파일 레코드, 경로, 파일 레코드 -> 위치, 폴더 -> 구간). 트리 구조가 바뀌면 None
+        self._preorder = None
+
+    def __len__(self):
+        return len(self.status)
+
+    def is_folder(self, record):
+        return self.status[record] == RECORD_FOLDER
+
+    def status_text(self, record):
+        """파일 레코드의 상태 문자열 (폴더/삭제된 레코드는 '')"""
+        code = self.status[record]
+        return FOLDER_STATUSES[code - 1] if code > 0 else ''
+
+    def record_for_path(self, rel_path):
+        return self._files.get(rel_path)
+
+    def folder_record(self, folder_path):
+        return self._folders.get(folder_path)
+
+    def file_paths(self):
+        return self._files.keys()
+
+    def badge_counts(self, folder):
+        return dict(zip(FOLDER_BADGE_KEYS, self.badges[folder]))
+
+    def ancestors(self, record):
+        """레코드의 상위 폴더 레코드 목록 (가까운 쪽부터, 루트 제외)"""
+        folders = []
+        folder = self.parent[record]
+        while folder != ROOT_RECORD:
+            folders.append(folder)
+            folder = self.parent[folder]
+        return folders
+
+    def _build_preorder(self):
+        """모든 파일을 경로순 전위 순서로 한 줄로 늘어놓고 폴더별 [시작, 끝) 구간을 기록.
+
+        폴더의 자손 파일은 이 배치에서 항상 연속 구간이므로 하위 파일 모으기가 슬라이스 하나가 된다.
+        """
+        status = self.status
+        records = array('i')
+        positions = array('i', (-1,)) * len(status)
+        ranges = {}
+        stack = [(ROOT_RECORD, False)]
+        while stack:
+            record, closing = stack.pop()
+            if closing:
+                ranges[record] = (ranges[record], len(records))
+            elif record == ROOT_RECORD or status[record] == RECORD_FOLDER:
+                ranges[record] = len(records)
+                stack.append((record, True))
+                stack.extend((child, False) for child in reversed(self.children[record]))
+            else:
+                positions[record] = len(records)
+                records.append(record)
+        self._preorder = (records, [self.paths[record] for record in records], positions, ranges)
+        return self._preorder
+
+    def subtree_range(self, record):
+        """파일/폴더 레코드 아래 파일이 전위 배치에서 차지하는 [시작, 끝) 구간 (ROOT_RECORD = 전체)"""
+        _, _, positions, ranges = self._preorder or self._build_preorder()
+        if record == ROOT_RECORD or self.status[record] == RECORD_FOLDER:
+            return ranges[record]
+        return positions[record], positions[record] + 1
+
+    def subtree_records(self, start, end):
+        """전위 배치 구간의 파일 레코드"""
+        return (self._preorder or self._build_preorder())[0][start:end]
+
+    def subtree_paths(self, start, end):
+        """전위 배치 구간의 파일 상대 경로 (경로순)"""
+        return (self._preorder or self._build_preorder())[1][start:end]
+
+    def files_under(self, folder):
+        """폴더 아래 모든 파일의 상대 경로 (경로순)"""
+        return self.subtree_paths(*self.subtree_range(folder))
+
+    def _sort_path(self, record):
+        # 폴더는 '경로 + os.sep'으로 비교해 전체를 경로순으로 넣었을 때와 같은 순서를 만듦
+        if self.status[record] == RECORD_FOLDER:
+            return self.paths[record] + os.sep
+        return self.paths[record]
+
+    def child_position(self, folder, record):
+        """자식 목록에서 레코드가 있는 (없으면 들어갈) 위치"""
+        children = self.children[folder]
+        key = self._sort_path(record)
+        low, high = 0, len(children)
+        if high and self._sort_path(children[-1]) < key:
+            return high  # 결과가 대부분 경로순으로 오므로 끝에 붙는 경우를 먼저 확인
+        while low < high:
+            middle = (low + high) // 2
+            if self._sort_path(children[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def sort_key(self, column, status_keys=None):
+        """열 이름(FOLDER_SORT_COLUMNS)의 정렬 키 함수 (레코드 -> 미리 계산된 원시 값).
+
+        status 열은 상태 코드를 첨자로 하는 status_keys(화면 표시 문자열 등)로 비교한다.
+        크기/수정 시각은 배열의 __getitem__을 그대로 써서 파이썬 함수 호출이 없다.
+        """
+        if column == 'name':
+            return self.name_keys.__getitem__
+        if column == 'status':
+            status = self.status
+            return lambda record: status_keys[status[record]]
+        return getattr(self, column).__getitem__
+
+    def sorted_children(self, records, column, reverse=False, status_keys=None):
+        """자식 레코드들을 폴더 우선으로 안정 정렬한 새 목록 (삭제된 레코드는 뺌).
+
+        안정 정렬이므로 키가 같으면 records의 순서가 유지된다. 직전 표시 순서를
+        넘기면 그 순서가 2차 기준이 되고, 이미 정렬된 입력은 거의 선형 시간에 끝난다.
+        """
+        status = self.status
+        key = self.sort_key(column, status_keys)
+        folders = [record for record in records if status[record] == RECORD_FOLDER]
+        files = [record for record in records if status[record] > 0]
+        folders.sort(key=key, reverse=reverse)
+        files.sort(key=key, reverse=reverse)
+        return folders + files
+
+    def filter_files(self, badge_keys=None, path_pattern=''):
+        """상태 버킷과 경로 키로 조건에 맞는 파일 레코드 집합을 만듦.
+
+        badge_keys는 FOLDER_BADGE_KEYS 중 보여 줄 분류 (None이면 모든 상태).
+        path_pattern은 대소문자를 무시하며 '/'로 구분한 상대 경로에 대해 *?[가 있으면
+        glob, 없으면 부분 문자열로 찾는다.
+        """
+        if badge_keys is None:
+            records = self._files.values()
+        else:
+            records = set()
+            for code, slot in enumerate(_CODE_BADGE_SLOTS):
+                if slot is not None and FOLDER_BADGE_KEYS[slot] in badge_keys:
+                    records.update(self.status_buckets[code])
+        pattern = path_pattern.strip().replace('\\', '/').lower()
+        if not pattern:
+            return set(records)
+        keys = self.path_keys
+        if any(ch in pattern for ch in '*?['):
+            match = re.compile(fnmatch.translate(pattern)).match
+            return {record for record in records if match(keys[record])}
+        return {record for record in records if pattern in keys[record]}
+
+    def filter_badges(self, records):
+        """records(파일 레코드)만 셀 때의 폴더별 배지 카운트 {폴더 레코드: array('i', 4)}.
+
+        records가 하나라도 들어 있는 폴더는 모두 키로 들어가므로 필터된 보기에서
+        보일 폴더 집합으로도 쓴다. 파일마다 (부모, 배지 칸)만 세고, 상위 폴더로는
+        그 묶음 단위로 올려 보낸다.
+        """
+        status = self.status
+        direct = Counter(zip(map(self.parent.__getitem__, records),
+                             (_CODE_BADGE_SLOTS[status[record]] for record in records)))
+        badges = {}
+        for (folder, slot), count in direct.items():
+            while folder != ROOT_RECORD:
+                counts = badges.get(folder)
+                if counts is None:
+                    counts = badges[folder] = array('i', (0, 0, 0, 0))
+                if slot is not None:
+                    counts[slot] += count
+                folder = self.parent[folder]
+        return badges
+
+    def _append(self, rel_path, name, parent, status, left_entry, right_entry, diff_offset):
+        record = len(self.status)
+        self.paths.append(rel_path)
+        self.names.append(name)
+        self.name_keys.append(name.lower())
+        self.path_keys.append(rel_path.replace(os.sep, '/').lower())
+        self.parent.append(parent)
+        self.status.append(status)
+        self.left_size.append(left_entry.size if left_entry else -1)
+        self.left_mtime.append(left_entry.mtime_ns if left_entry else -1)
+        self.right_size.append(right_entry.size if right_entry else -1)
+        self.right_mtime.append(right_entry.mtime_ns if right_entry else -1)
+        self.diff_offset.append(-1 if diff_offset is None else diff_offset)
+        return record
+
+    def _count_badges(self, record, delta):
+        slot = _STATUS_BADGE_SLOTS.get(self.status_text(record))
+        if slot is None:
+            return
+        for folder in self.ancestors(record):
+            self.badges[folder][slot] += delta
+
+    def add(self, result):
+        """FolderCompareResult 한 행 추가 (필요한 상위 폴더 레코드도 생성).
+
+        Returns:
+            (파일 레코드, 이번에 새로 만든 가장 위 폴더 레코드 또는 None)
+        """
+        parts = result.rel_path.split(os.sep)
+        parent = ROOT_RECORD
+        new_folder = None
+        for depth in range(len(parts) - 1):
+            folder_path = os.sep.join(parts[:depth + 1])
+            folder = self._folders.get(folder_path)
+            if folder is None:
+                folder = self._append(folder_path, parts[depth], parent, RECORD_FOLDER, None, None, None)
+                self._folders[folder_path] = folder
+                self.children[folder] = []
+                self.badges[folder] = array('i', (0, 0, 0, 0))
+                self.children[parent].insert(self.child_position(parent, folder), folder)
+                if new_folder is None:
+                    new_folder = folder
+            parent = folder
+
+        self._preorder = None
+        record = self._append(result.rel_path, parts[-1], parent,
+                              FOLDER_STATUSES.index(result.status) + 1,
+                              result.left, result.right, result.diff_offset)
+        self._files[result.rel_path] = record
+        self.status_buckets[self.status[record]].add(record)
+        self.children[parent].insert(self.child_position(parent, record), record)
+        self._count_badges(record, 1)
+        self.file_count += 1
+        return record, new_folder
+
+    def update(self, record, result):
+        """기존 파일 레코드의 상태/크기/수정 시각을 새 판정으로 교체"""
+        self._count_badges(record, -1)
+        self.status_buckets[self.status[record]].discard(record)
+        self.status[record] = FOLDER_STATUSES.index(result.status) + 1
+        self.status_buckets[self.status[record]].add(record)
+        self.left_size[record] = result.left.size if result.left else -1
+        self.left_mtime[record] = result.left.mtime_ns if result.left else -1
+        self.right_size[record] = result.right.size if result.right else -1
+        self.right_mtime[record] = result.right.mtime_ns if result.right else -1
+        self.diff_offset[record] = -1 if result.diff_offset is None else result.diff_offset
+        self._count_badges(record, 1)
+
+    def remove(self, record):
+        """파일 레코드 삭제. 비게 된 상위 폴더 레코드도 함께 삭제.
+
+        Returns:
+            함께 삭제된 폴더 레코드 목록 (아래쪽부터)
+        """
+        self._count_badges(record, -1)
+        self.status_buckets[self.status[record]].discard(record)
+        del self._files[self.paths[record]]
+        self._preorder = None
+        self.file_count -= 1
+        removed_folders = []
+        while True:
+            parent = self.parent[record]
+            siblings = self.children[parent]
+            del siblings[self.child_position(parent, record)]
+            self.status[record] = RECORD_REMOVED
+            if parent == ROOT_RECORD or siblings:
+                return removed_folders
+            del self.children[parent]
+            del self.badges[parent]
+            del self._folders[self.paths[parent]]
+            removed_folders.append(parent)
+            record = parent
+
+
+# 동기화 계획의 작업 종류 (실행 순서)
+SYNC_ACTIONS = ('mkdir', 'copy', 'overwrite', 'delete')
+SyncOperation = namedtuple('SyncOperation', 'action rel_path size')
+
+
+def build_sync_plan(model, target_folder, direction, delete_extra=False, records=None):
+    """결과 모델로 한쪽 폴더를 다른 쪽과 같게 만드는 작업 계획 (SyncOperation 목록).
+
+    direction이 'left_to_right'면 오른쪽을 왼쪽과 같게, 'right_to_left'면 그 반대.
+    원본에만 있는 파일은 copy, 내용이나 수정 시각이 다른 파일은 overwrite, 대상에만
+    있는 파일은 delete_extra일 때 delete가 된다. size는 copy/overwrite면 옮길 바이트,
+    delete면 지울 파일 크기다. 대상(target_folder)에 없는 폴더는 mkdir로 맨 앞에
+    모으고, 파일 작업은 폴더별로 묶어 경로순으로 둔다.
+    records를 주면 그 파일 레코드만 (필터된 보기 등) 계획에 넣는다.
+    """
+    left_to_right = direction == 'left_to_right'
+    source_only = "왼쪽만 존재" if left_to_right else "오른쪽만 존재"
+    target_only = "오른쪽만 존재" if left_to_right else "왼쪽만 존재"
+    source_size = model.left_size if left_to_right else model.right_size
+    target_size = model.right_size if left_to_right else model.left_size
+    if records is None:
+        records = model.subtree_records(*model.subtree_range(ROOT_RECORD))
+
+    operations = []
+    for record in records:
+        status = model.status_text(record)
+        if status == source_only:
+            operations.append(SyncOperation('copy', model.paths[record], source_size[record]))
+        elif status == target_only:
+            if delete_extra:
+                operations.append(SyncOperation('delete', model.paths[record], target_size[record]))
+        elif status and status != "동일":
+            operations.append(SyncOperation('overwrite', model.paths[record], source_size[record]))
+    operations.sort(key=lambda operation: (os.path.dirname(operation.rel_path), operation.rel_path))
+
+    # 복사할 파일의 폴더 중 대상에 없는 것 (상위 폴더 포함)
+    missing_dirs = set()
+    checked = set()
+    for operation in operations:
+        if operation.action != 'copy':
+            continue
+        rel_dir = os.path.dirname(operation.rel_path)
+        while rel_dir and rel_dir not in checked:
+            checked.add(rel_dir)
+            if not os.path.isdir(os.path.join(target_folder, rel_dir)):
+                missing_dirs.add(rel_dir)
+            rel_dir = os.path.dirname(rel_dir)
+    return [SyncOperation('mkdir', rel_dir, 0) for rel_dir in sorted(missing_dirs)] + operations
+
+
+def summarize_sync_plan(operations):
+    """작업 종류별 개수와 옮길 총 바이트 {'mkdir': n, 'copy': n, 'overwrite': n, 'delete': n, 'bytes': n}"""
+    summary = dict.fromkeys(SYNC_ACTIONS, 0)
+    summary['bytes'] = 0
+    for operation in operations:
+        summary[operation.action] += 1
+        if operation.action in ('copy', 'overwrite'):
+            summary['bytes'] += operation.size
+    return summary
+
+
+# 미리보기: 이보다 큰 파일은 통째로 읽지 않고 앞에서부터 쪽 단위로 읽는다
+DEFAULT_PREVIEW_THRESHOLD_KB = 1024
+MIN_PREVIEW_THRESHOLD_KB = 64
+MAX_PREVIEW_THRESHOLD_KB = 256 * 1024
+PREVIEW_PAGE_LINES = 2000
+PREVIEW_PAGE_BYTES = 256 * 1024
+
+
+def _utf8_cut(data):
+    """data 끝에서 잘린 UTF-8 문자가 생기지 않는 위치"""
+    cut = len(data)
+    while cut > 0 and len(data) - cut < 3 and (data[cut - 1] & 0xC0) == 0x80:
+        cut -= 1
+    if cut == 0:
+        return len(data)
+    lead = data[cut - 1]
+    if lead < 0x80:
+        return len(data)
+    width = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+    return len(data) if cut - 1 + width <= len(data) else cut - 1
+
+
+class TextFilePager:
+    """큰 텍스트 파일을 앞에서부터 쪽(최대 page_lines줄, page_bytes바이트) 단위로 읽음.
+
+    파일을 열어 두지 않고 쪽마다 offset으로 이동해 읽는다. 줄 끝(\\n, \\r\\n)은 떼어 내고,
+    UTF-8이 아니면 UnicodeDecodeError를 낸다. page_bytes보다 긴 줄은 잘라서 여러 줄로 돌려준다.
+    """
+
+    def __init__(self, path, page_lines=PREVIEW_PAGE_LINES, page_bytes=PREVIEW_PAGE_BYTES):
+        self.path = path
+        self.page_lines = page_lines
+        self.page_bytes = page_bytes
+        self.size = os.path.getsize(path)
+        self.offset = 0  # 다음에 읽을 바이트 위치
+        self.lines_read = 0
+        self._line_split = False  # 앞 쪽이 긴 줄 중간에서 끝났는지
+
+    @property
+    def at_end(self):
+        return self.offset >= self.size
+
+    def read_page(self):
+        """다음 쪽의 줄 목록 (끝이면 빈 목록)"""
+        if self.at_end:
+            return []
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(self.page_bytes)
+        if not data:
+            self.offset = self.size  # 그사이 파일이 줄어듦
+            return []
+        at_eof = self.offset + len(data) >= self.size
+
+        if self._line_split:
+            # 잘린 긴 줄의 남은 줄바꿈: 빈 줄로 보이지 않게 건너뜀
+            self._line_split = False
+            for ending in (b'\n', b'\r\n'):
+                if data.startswith(ending):
+                    self.offset += len(ending)
+                    data = data[len(ending):]
+                    if not data:
+                        return self.read_page()
+                    break
+
+        parts = data.split(b'\n')
+        if at_eof:
+            if not parts[-1]:
+                parts.pop()  # 마지막 줄 끝의 줄바꿈
+        elif len(parts) > 1:
+            parts.pop()  # 다음 쪽에서 마저 읽을 덜 읽힌 줄
+        else:
+            # 쪽보다 긴 한 줄: 줄바꿈 없이 잘라서 돌려줌
+            cut = _utf8_cut(data)
+            if cut > 1 and data[cut - 1:cut] == b'\r':
+                cut -= 1  # \r\n을 다음 쪽에서 함께 읽도록
+            self._line_split = True
+            self.offset += cut
+            self.lines_read += 1
+            return [data[:cut].decode('utf-8')]
+
+        parts = parts[:self.page_lines]
+        consumed = min(sum(len(part) + 1 for part in parts), len(data))
+        lines = [(part[:-1] if part.endswith(b'\r') else part).decode('utf-8') for part in parts]
+        self.offset += consumed
+        self.lines_read += len(lines)
+        return lines
+
+
+def diff_text_lines(left_lines, right_lines):
+    """줄 단위로 비교하고, 한 줄 대 한 줄로 바뀐 곳은 문자 단위로 다시 비교.
+
+    Returns:
+        difflib opcode 중 'equal'이 아닌 것마다 하나씩 블록 dict 목록.
+        줄 번호는 1부터 (left_end/right_end는 끝 줄 번호, 포함),
+        left_spans/right_spans는 강조할 (줄 번호, 시작 열, 끝 열) 목록.
+    """
+    blocks = []
+    matcher = difflib.SequenceMatcher(None, left_lines, right_lines)
+
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            continue
+
+        left_spans = []
+        right_spans = []
+        if tag == 'replace' and i2 - i1 == 1 and j2 - j1 == 1:
+            # 단일 라인 대 단일 라인 비교인 경우 문자 단위 비교
+            left_line = left_lines[i1]
+            right_line = right_lines[j1]
+            char_matcher = difflib.SequenceMatcher(None, left_line, right_line)
+            for char_tag, c_i1, c_i2, c_j1, c_j2 in char_matcher.get_opcodes():
+                if char_tag in ('replace', 'delete'):
+                    left_spans.append((i1 + 1, c_i1, c_i2))
+                if char_tag in ('replace', 'insert'):
+                    right_spans.append((j1 + 1, c_j1, c_j2))
+        else:
+            # 삭제/추가되었거나 여러 라인이 변경된 경우 라인 전체를 표시
+            left_spans = [(i + 1, 0, len(left_lines[i])) for i in range(i1, i2)]
+            right_spans = [(j + 1, 0, len(right_lines[j])) for j in range(j1, j2)]
+
+        blocks.append({
+            'tag': tag,
+            'left_start': i1 + 1,  # 1-based line number
+            'left_end': i2,         # exclusive
+            'right_start': j1 + 1,  # 1-based line number
+            'right_end': j2,        # exclusive
+            'left_lines': left_lines[i1:i2],
+            'right_lines': right_lines[j1:j2],
+            'left_spans': left_spans,
+            'right_spans': right_spans,
+        })
+    return blocks
+
+
+# ---------------------------------------------------------------------------
+# 공개 API: GUI 없이 스크립트/서비스/스레드 풀에서 바로 호출하는 함수들
+# ---------------------------------------------------------------------------
+
+# compare_folders() 결과. results는 FolderCompareResult 목록 (차이가 있는 파일만, 경로순)
+FolderCompareReport = namedtuple(
+    'FolderCompareReport',
+    'results method hash_algorithm files_scanned pairs_compared files_skipped '
+    'identical_dirs excluded_files excluded_dirs elapsed')
+
+
+def should_exclude(rel_path, patterns):
+    """상대 경로가 제외 패턴(.gitignore 스타일)에 매칭되는지 확인"""
+    if not patterns:
+        return False
+    return compile_exclude_patterns(tuple(patterns)).excludes(rel_path.replace(os.sep, '/'))
+
+
+def folder_result_to_dict(result):
+    """FolderCompareResult → JSON으로 쓸 수 있는 dict.
+
+    경로는 '/' 구분, 상태는 FOLDER_STATUS_CODES의 코드, 양쪽 파일은
+    {'size', 'mtime_ns'} (없으면 None).
+    """
+    def entry_dict(entry):
+        if entry is None:
+            return None
+        return {'size': entry.size, 'mtime_ns': entry.mtime_ns}
+
+    return {
+        'path': result.rel_path.replace(os.sep, '/'),
+        'status': FOLDER_STATUS_CODES.get(result.status, result.status),
+        'left': entry_dict(result.left),
+        'right': entry_dict(result.right),
+        'diff_offset': result.diff_offset,
+    }
+
+
+def compare_folders(left_folder, right_folder, method='md5', exclude_patterns=(),
+                    hash_algorithm=DEFAULT_HASH_ALGORITHM, hash_workers=None,
+                    cache_path=None, hash_chunk_size=DEFAULT_HASH_CHUNK_SIZE,
+                    hash_backend=DEFAULT_HASH_BACKEND, process_workers=0,
+                    on_result=None, on_progress=None, cancel_event=None):
+    """두 폴더(또는 매니페스트)를 비교하고 끝날 때까지 기다려 결과를 반환.
+
+    GUI와 같은 FolderCompareJob을 호출한 스레드에서 실행한다.
+
+    Args:
+        method: 'md5'(해시) / 'date' / 'both' / 'binary'
+        exclude_patterns: .gitignore 스타일 제외 패턴 목록
+        cache_path: 영구 해시 캐시 파일 경로 (None이면 캐시 없이 비교)
+        on_result: 결과 행이 나올 때마다 FolderCompareResult로 호출 (판정 순서)
+        on_progress: 진행 상태 dict로 주기적으로 호출 (FolderCompareJob.snapshot 참고)
+        cancel_event: set()하면 중단하고 CompareCancelled 발생
+
+    Returns:
+        FolderCompareReport
+
+    Raises:
+        CompareCancelled: 취소된 경우
+        FileNotFoundError: 폴더(또는 매니페스트)가 없는 경우
+        OSError, ManifestError 등: 스캔/비교 중 발생한 오류
+    """
+    for folder in (left_folder, right_folder):
+        if not os.path.exists(folder):
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), folder)
+
+    cache_factory = None
+    if cache_path is not None:
+        def cache_factory():
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+            return HashCache(cache_path)
+
+    job = FolderCompareJob(
+        left_folder, right_folder, method,
+        exclude_matcher=compile_exclude_patterns(tuple(exclude_patterns)),
+        hash_workers=hash_workers, cache_factory=cache_factory,
+        hash_algorithm=hash_algorithm, hash_chunk_size=hash_chunk_size,
+        hash_backend=hash_backend, process_workers=process_workers,
+        on_result=on_result, on_progress=on_progress, cancel_event=cancel_event)
+    job.run()
+    if job.error is not None:
+        raise job.error
+    if job.cancelled:
+        raise CompareCancelled()
+    return FolderCompareReport(
+        results=sorted(job.results, key=lambda result: result.rel_path),
+        method=method,
+        hash_algorithm=job.hash_algorithm,
+        files_scanned=job.files_scanned,
+        pairs_compared=job.pairs_done,
+        files_skipped=job.files_skipped,
+        identical_dirs=list(job.identical_dirs),
+        excluded_files=sorted(job.excluded_files),
+        excluded_dirs=sorted(job.excluded_dirs),
+        elapsed=time.monotonic() - job.started_at,
+    )
+
+
+def compare_texts(left_text, right_text):
+    """두 문자열을 줄/문자 단위로 비교해 diff_text_lines 블록 목록 반환"""
+    return diff_text_lines(left_text.splitlines(), right_text.splitlines())
+
+
+def compare_text_files(left_path, right_path, encoding='utf-8'):
+    """두 텍스트 파일을 읽어 compare_texts()로 비교"""
+    with open(left_path, 'r', encoding=encoding) as f:
+        left_text = f.read()
+    with open(right_path, 'r', encoding=encoding) as f:
+        right_text = f.read()
+    return compare_texts(left_text, right_text)
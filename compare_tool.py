@@ -16,15 +16,69 @@ import tkinter.font as tkfont
 import os
 import sys
 import platform as _platform_mod
-import hashlib
-import difflib
 import shutil
 import json
-import fnmatch
-import re
+import ctypes
+import threading
+import time
+import multiprocessing
 from datetime import datetime
 from pathlib import Path
 
+from compare_engine import (
+    DEFAULT_CONFIG_DIR,
+    DEFAULT_COPY_WORKERS,
+    DEFAULT_HASH_ALGORITHM,
+    DEFAULT_HASH_BACKEND,
+    DEFAULT_HASH_CACHE_MAX_ENTRIES,
+    DEFAULT_HASH_CHUNK_SIZE,
+    DEFAULT_HASH_WORKERS,
+    DEFAULT_PREVIEW_THRESHOLD_KB,
+    DEFAULT_PROCESS_BATCH_SIZE,
+    FOLDER_BADGE_KEYS,
+    FOLDER_STATUSES,
+    FOLDER_WATCH_DEBOUNCE_S,
+    FOLDER_WATCH_MAX_DELAY_S,
+    HASH_ALGORITHMS,
+    HASH_BACKENDS,
+    HASH_CACHE_FILENAME,
+    MANIFEST_EXTENSION,
+    MAX_HASH_CHUNK_KB,
+    MAX_HASH_WORKERS,
+    MAX_PREVIEW_THRESHOLD_KB,
+    MAX_PROCESS_BATCH_SIZE,
+    MIN_HASH_CHUNK_KB,
+    MIN_PREVIEW_THRESHOLD_KB,
+    PREVIEW_PAGE_LINES,
+    ROOT_RECORD,
+    FolderCompareJob,
+    FolderCopyJob,
+    FolderManifestExportJob,
+    FolderRefreshJob,
+    FolderResultModel,
+    FolderSyncJob,
+    FolderWatcher,
+    HashCache,
+    TextFilePager,
+    benchmark_hash_algorithms,
+    build_sync_plan,
+    calculate_file_md5,
+    compile_exclude_patterns,
+    diff_text_lines,
+    evaluate_folder_paths,
+    expand_changed_dirs,
+    format_byte_size,
+    format_duration,
+    format_mtime_ns,
+    hash_algorithm_label,
+    normalize_hash_algorithm,
+    normalize_hash_backend,
+    normalize_process_batch_size,
+    read_manifest_header,
+    should_exclude,
+    summarize_sync_plan,
+)
+
 
 PRETENDARD_FONT_DIR = Path(__file__).resolve().parent / 'font' / 'PretendardStd'
 APP_ICON_PATH = Path(__file__).resolve().parent / 'assets' / 'logo' / 'conferatur-icon.png'
@@ -66,6 +120,14 @@ UI_STRINGS = {
         'copy_right_to_left': '오른쪽 → 왼쪽 복사',
         'expand_all': '모두 펼치기',
         'collapse_all': '모두 접기',
+        'sync': '동기화',
+        'filter_label': '필터',
+        'filter_differ': '내용 다름',
+        'filter_left_only': '왼쪽만',
+        'filter_right_only': '오른쪽만',
+        'filter_newer': '최신',
+        'filter_search': '경로 검색',
+        'filter_clear': '필터 해제',
         'delete_selected': '선택 항목 삭제',
         'left_block_copy': '왼쪽 블록 복사',
         'right_block_copy': '오른쪽 블록 복사',
@@ -86,9 +148,13 @@ UI_STRINGS = {
         'right_folder': '오른쪽 폴더:',
         'left_file': '왼쪽 파일:',
         'right_file': '오른쪽 파일:',
-        'method_md5': 'MD5 비교',
+        'method_md5': '해시 비교',
         'method_date': '날짜 비교',
-        'method_both': 'MD5 + 날짜',
+        'method_both': '해시 + 날짜',
+        'method_binary': '바이트 비교',
+        'hash_algorithm': '알고리즘:',
+        'watch_mode': '실시간 감시',
+        'watch_requires_compare': '먼저 폴더 비교를 실행한 뒤 실시간 감시를 켜주세요.',
         'file_path': '파일 경로',
         'status': '상태',
         'left_size': '왼쪽 크기',
@@ -108,7 +174,9 @@ UI_STRINGS = {
         'select_all': '전체 선택',
         'copy_current_block_to_left': '◀ 왼쪽으로 복사 (현재 블록)',
         'copy_current_block_to_right': '오른쪽으로 복사 ▶ (현재 블록)',
-        'status_content_diff_md5': '내용 다름 (MD5)',
+        'status_content_diff_md5': '내용 다름 (해시)',
+        'status_content_diff_bytes': '내용 다름 (바이트)',
+        'first_diff_offset': ' @ {offset}',
         'status_left_only': '왼쪽만 존재',
         'status_right_only': '오른쪽만 존재',
         'status_left_newer': '왼쪽이 최신',
@@ -126,6 +194,53 @@ UI_STRINGS = {
         'selected_folder_missing': '선택한 폴더가 존재하지 않습니다.',
         'folder_compare_done': '비교가 완료되었습니다.\n차이가 있는 파일: {count}개',
         'excluded_files_count': '제외된 파일: {count}개',
+        'excluded_dirs_count': '제외된 폴더: {count}개 (하위 탐색 생략)',
+        'identical_dirs_skipped': '내용이 같아 건너뛴 폴더: {count}개 (파일 {files}개)',
+        'cancel_compare': '비교 취소',
+        'progress_scanning': '폴더 스캔 중... 파일 {count}개',
+        'progress_hashing': '내용 비교 중... {done}/{total}개 · {size} 해시 · {rate}/s · 남은 시간 {eta}',
+        'browse_manifest': '매니페스트',
+        'export_manifest': '매니페스트 내보내기',
+        'manifest_filetype': '폴더 매니페스트',
+        'manifest_exporting': '매니페스트 기록 중... {done}/{total}개 파일',
+        'manifest_export_done': '매니페스트를 저장했습니다. (파일 {count}개)\n{path}',
+        'manifest_export_cancelled': '매니페스트 내보내기를 취소했습니다.',
+        'manifest_export_failed': '매니페스트를 저장하지 못했습니다:\n{error}',
+        'not_a_manifest': '폴더나 매니페스트 파일이 아닙니다:\n{path}',
+        'manifest_binary_unsupported': '바이트 비교는 양쪽 모두 폴더여야 합니다. 매니페스트는 해시나 날짜로 비교하세요.',
+        'manifest_algorithm_mismatch': '두 매니페스트의 해시 알고리즘이 다릅니다. ({left} / {right})',
+        'manifest_algorithm_unavailable': '매니페스트의 해시 알고리즘({algorithm})을 이 환경에서 쓸 수 없습니다.',
+        'manifest_read_only': '매니페스트 쪽에는 복사, 삭제, 실시간 감시를 할 수 없습니다.',
+        'progress_finishing': '결과 정리 중...',
+        'progress_cancelling': '취소하는 중...',
+        'progress_copy_preparing': '복사 준비 중...',
+        'progress_refreshing': '바뀐 항목 다시 확인 중... {count}개',
+        'progress_copying': '복사 중... {done}/{total}개 · {size}/{total_size} · {rate}/s · 남은 시간 {eta}',
+        'copy_skipped_identical': '내용이 같아 {count}개 파일은 복사하지 않고 수정 시각만 맞췄습니다.',
+        'copy_cancelled': '복사를 취소했습니다. 끝난 {count}개 파일만 복사되었습니다.',
+        'sync_title': '폴더 동기화',
+        'sync_direction': '방향',
+        'sync_left_to_right': '오른쪽을 왼쪽과 같게 (왼쪽 → 오른쪽)',
+        'sync_right_to_left': '왼쪽을 오른쪽과 같게 (오른쪽 → 왼쪽)',
+        'sync_delete_extra': '대상에만 있는 파일 삭제',
+        'sync_filtered_note': '필터에 보이는 파일만 동기화합니다.',
+        'sync_dry_run': '미리 보기 (아직 아무것도 바꾸지 않았습니다)',
+        'sync_summary': '폴더 생성 {mkdir}개 · 복사 {copy}개 · 덮어쓰기 {overwrite}개 · 삭제 {delete}개 · 전송 {size}',
+        'sync_action_mkdir': '폴더 생성',
+        'sync_action_copy': '복사',
+        'sync_action_overwrite': '덮어쓰기',
+        'sync_action_delete': '삭제',
+        'sync_more': '... 외 {count}개 작업',
+        'sync_run': '동기화 실행',
+        'sync_nothing': '동기화할 작업이 없습니다.',
+        'sync_delete_confirm': '대상 폴더에서 파일 {count}개를 삭제합니다. 계속하시겠습니까?',
+        'sync_failed_count': '{count}개 작업 실패.',
+        'sync_requires_compare': '먼저 폴더 비교를 실행한 뒤 동기화하세요.',
+        'progress_syncing': '동기화 중... {done}/{total}개 · {size}/{total_size} · {rate}/s · 남은 시간 {eta}',
+        'sync_result': '동기화를 마쳤습니다. 복사 {copied}개, 삭제 {deleted}개, 폴더 생성 {dirs}개',
+        'sync_cancelled': '동기화를 취소했습니다. 끝난 작업(복사 {copied}개, 삭제 {deleted}개)만 반영되었습니다.',
+        'folder_compare_cancelled': '폴더 비교가 취소되었습니다.',
+        'folder_compare_failed': '폴더 비교 중 오류가 발생했습니다:\n{error}',
         'select_file_or_folder_to_copy': '복사할 파일 또는 폴더를 선택해주세요.',
         'no_files_to_copy': '복사할 파일이 없습니다.',
         'copy_confirm': '{count}개의 파일을 {direction} 복사하시겠습니까?',
@@ -142,6 +257,7 @@ UI_STRINGS = {
         'deleted_files_result': '{count}개 파일이 삭제되었습니다.',
         'file_unreadable_marker': '[파일을 읽을 수 없습니다]',
         'file_missing_marker': '[파일이 존재하지 않습니다]',
+        'preview_truncated': '⋯ 처음 {lines}줄만 표시 중 ({size} / {total}) · 아래로 스크롤하면 더 읽습니다 ⋯',
         'text_compare_done': '텍스트 비교가 완료되었습니다.\n차이나는 부분이 연한 붉은색으로 표시됩니다.',
         'text_applied': '텍스트가 적용되었습니다.',
         'select_both_files': '두 파일을 모두 선택해주세요.',
@@ -203,6 +319,31 @@ UI_STRINGS = {
         'exclude_default_examples': '# 일반적으로 제외되는 폴더/파일 예시\n# node_modules/\n# .git/\n# __pycache__/\n# *.pyc\n# .DS_Store\n# Thumbs.db',
         'pattern_saved': '{count}개의 제외 패턴이 저장되었습니다.',
         'clear_patterns_confirm': '모든 제외 패턴을 삭제하시겠습니까?',
+        'menu_performance_settings': '성능 설정',
+        'performance_settings': '성능 설정',
+        'performance_settings_desc': '폴더 비교 시 파일 해시 계산에 사용할 리소스를 설정합니다.',
+        'hash_workers': '해시 작업자 수:',
+        'hash_workers_hint': '0 = 자동 ({count}개)',
+        'performance_settings_applied': '성능 설정이 적용되었습니다.',
+        'hash_cache_max_entries': '해시 캐시 크기:',
+        'hash_cache_max_entries_hint': '최대 항목 수',
+        'clear_hash_cache': '해시 캐시 비우기',
+        'clear_hash_cache_confirm': '저장된 파일 해시 캐시를 모두 삭제하시겠습니까?',
+        'hash_cache_cleared': '해시 캐시를 비웠습니다.',
+        'hash_chunk_kb': '읽기 버퍼 (KB):',
+        'hash_chunk_kb_hint': '기본 {default} KB, 큰 파일이 많은 SSD/NAS는 크게',
+        'preview_threshold_kb': '미리보기 한도 (KB):',
+        'preview_threshold_kb_hint': '이보다 큰 파일은 {lines}줄씩 나눠 읽음 (기본 {default} KB)',
+        'hash_backend': '해시 실행 방식:',
+        'hash_backend_thread': '스레드',
+        'hash_backend_process': '프로세스',
+        'hash_backend_hint': '작은 파일이 매우 많거나 CRC32처럼 느린 해시는 프로세스가 유리',
+        'process_workers': '프로세스 수:',
+        'process_batch_size': '묶음 크기:',
+        'process_workers_hint': '0 = CPU 수 ({count})',
+        'hash_benchmark': '해시 속도 측정',
+        'hash_benchmark_running': '측정 중...',
+        'hash_benchmark_result': '이 컴퓨터에서의 알고리즘별 해시 속도 (메모리 기준, 디스크 속도 제외):\n\n{results}',
     },
     'en': {
         'app_title': 'File/Folder Compare Tool',
@@ -239,6 +380,14 @@ UI_STRINGS = {
         'copy_right_to_left': 'Copy Right → Left',
         'expand_all': 'Expand All',
         'collapse_all': 'Collapse All',
+        'sync': 'Synchronize',
+        'filter_label': 'Filter',
+        'filter_differ': 'Differ',
+        'filter_left_only': 'Left only',
+        'filter_right_only': 'Right only',
+        'filter_newer': 'Newer',
+        'filter_search': 'Path search',
+        'filter_clear': 'Clear Filter',
         'delete_selected': 'Delete Selected',
         'left_block_copy': 'Copy Left Block',
         'right_block_copy': 'Copy Right Block',
@@ -259,9 +408,13 @@ UI_STRINGS = {
         'right_folder': 'Right Folder:',
         'left_file': 'Left File:',
         'right_file': 'Right File:',
-        'method_md5': 'MD5 Compare',
+        'method_md5': 'Hash Compare',
         'method_date': 'Date Compare',
-        'method_both': 'MD5 + Date',
+        'method_both': 'Hash + Date',
+        'method_binary': 'Byte Compare',
+        'hash_algorithm': 'Algorithm:',
+        'watch_mode': 'Watch',
+        'watch_requires_compare': 'Run a folder compare first, then turn on watch mode.',
         'file_path': 'File Path',
         'status': 'Status',
         'left_size': 'Left Size',
@@ -281,7 +434,9 @@ UI_STRINGS = {
         'select_all': 'Select All',
         'copy_current_block_to_left': '◀ Copy to Left (Current Block)',
         'copy_current_block_to_right': 'Copy to Right ▶ (Current Block)',
-        'status_content_diff_md5': 'Content differs (MD5)',
+        'status_content_diff_md5': 'Content differs (hash)',
+        'status_content_diff_bytes': 'Content differs (bytes)',
+        'first_diff_offset': ' @ {offset}',
         'status_left_only': 'Left only',
         'status_right_only': 'Right only',
         'status_left_newer': 'Left is newer',
@@ -299,6 +454,53 @@ UI_STRINGS = {
         'selected_folder_missing': 'The selected folder does not exist.',
         'folder_compare_done': 'Compare complete.\nFiles with differences: {count}',
         'excluded_files_count': 'Excluded files: {count}',
+        'excluded_dirs_count': 'Excluded folders: {count} (not scanned)',
+        'identical_dirs_skipped': 'Identical folders skipped: {count} ({files} files)',
+        'cancel_compare': 'Cancel',
+        'progress_scanning': 'Scanning folders... {count} files',
+        'progress_hashing': 'Comparing contents... {done}/{total} · {size} hashed · {rate}/s · {eta} left',
+        'browse_manifest': 'Manifest',
+        'export_manifest': 'Export Manifest',
+        'manifest_filetype': 'Folder manifest',
+        'manifest_exporting': 'Writing manifest... {done}/{total} files',
+        'manifest_export_done': 'Manifest saved ({count} files).\n{path}',
+        'manifest_export_cancelled': 'Manifest export was cancelled.',
+        'manifest_export_failed': 'Could not save the manifest:\n{error}',
+        'not_a_manifest': 'Not a folder or manifest file:\n{path}',
+        'manifest_binary_unsupported': 'Byte compare needs folders on both sides. Compare manifests by hash or date.',
+        'manifest_algorithm_mismatch': 'The two manifests use different hash algorithms ({left} / {right}).',
+        'manifest_algorithm_unavailable': "The manifest's hash algorithm ({algorithm}) is not available here.",
+        'manifest_read_only': 'Copy, delete and watch mode are not available for a manifest side.',
+        'progress_finishing': 'Preparing results...',
+        'progress_cancelling': 'Cancelling...',
+        'progress_copy_preparing': 'Preparing copy...',
+        'progress_refreshing': 'Rechecking changed items... {count}',
+        'progress_copying': 'Copying... {done}/{total} · {size}/{total_size} · {rate}/s · {eta} left',
+        'copy_skipped_identical': '{count} files already had the same content; only their timestamps were updated.',
+        'copy_cancelled': 'Copy was cancelled. Only the {count} finished files were copied.',
+        'sync_title': 'Synchronize Folders',
+        'sync_direction': 'Direction',
+        'sync_left_to_right': 'Make right match left (Left → Right)',
+        'sync_right_to_left': 'Make left match right (Right → Left)',
+        'sync_delete_extra': 'Delete files that exist only in the target',
+        'sync_filtered_note': 'Only files visible through the filter are synchronized.',
+        'sync_dry_run': 'Dry run (nothing has been changed yet)',
+        'sync_summary': '{mkdir} folders to create · {copy} to copy · {overwrite} to overwrite · {delete} to delete · {size} to transfer',
+        'sync_action_mkdir': 'Create folder',
+        'sync_action_copy': 'Copy',
+        'sync_action_overwrite': 'Overwrite',
+        'sync_action_delete': 'Delete',
+        'sync_more': '... and {count} more operations',
+        'sync_run': 'Run Sync',
+        'sync_nothing': 'There is nothing to synchronize.',
+        'sync_delete_confirm': '{count} files will be deleted from the target folder. Continue?',
+        'sync_failed_count': '{count} operations failed.',
+        'sync_requires_compare': 'Run a folder compare first, then synchronize.',
+        'progress_syncing': 'Synchronizing... {done}/{total} · {size}/{total_size} · {rate}/s · {eta} left',
+        'sync_result': 'Synchronization finished. {copied} copied, {deleted} deleted, {dirs} folders created.',
+        'sync_cancelled': 'Synchronization was cancelled. Only finished operations ({copied} copied, {deleted} deleted) were applied.',
+        'folder_compare_cancelled': 'Folder comparison was cancelled.',
+        'folder_compare_failed': 'An error occurred while comparing folders:\n{error}',
         'select_file_or_folder_to_copy': 'Please select a file or folder to copy.',
         'no_files_to_copy': 'There are no files to copy.',
         'copy_confirm': 'Copy {count} files {direction}?',
@@ -315,6 +517,7 @@ UI_STRINGS = {
         'deleted_files_result': '{count} files deleted.',
         'file_unreadable_marker': '[Unable to read file]',
         'file_missing_marker': '[File does not exist]',
+        'preview_truncated': '⋯ Showing the first {lines} lines ({size} / {total}) · scroll down to load more ⋯',
         'text_compare_done': 'Text compare complete.\nDifferences are highlighted in light red.',
         'text_applied': 'Text has been applied.',
         'select_both_files': 'Please select both files.',
@@ -376,6 +579,31 @@ UI_STRINGS = {
         'exclude_default_examples': '# Commonly excluded folder/file examples\n# node_modules/\n# .git/\n# __pycache__/\n# *.pyc\n# .DS_Store\n# Thumbs.db',
         'pattern_saved': '{count} exclude patterns saved.',
         'clear_patterns_confirm': 'Clear all exclude patterns?',
+        'menu_performance_settings': 'Performance Settings',
+        'performance_settings': 'Performance Settings',
+        'performance_settings_desc': 'Set the resources used to hash files during folder compare.',
+        'hash_workers': 'Hash workers:',
+        'hash_workers_hint': '0 = auto ({count})',
+        'performance_settings_applied': 'Performance settings have been applied.',
+        'hash_cache_max_entries': 'Hash cache size:',
+        'hash_cache_max_entries_hint': 'maximum entries',
+        'clear_hash_cache': 'Clear Hash Cache',
+        'clear_hash_cache_confirm': 'Delete all cached file hashes?',
+        'hash_cache_cleared': 'The hash cache has been cleared.',
+        'hash_chunk_kb': 'Read buffer (KB):',
+        'hash_chunk_kb_hint': 'Default {default} KB; raise for large files on SSD/NAS',
+        'preview_threshold_kb': 'Preview limit (KB):',
+        'preview_threshold_kb_hint': 'Larger files are read {lines} lines at a time (default {default} KB)',
+        'hash_backend': 'Hash runs in:',
+        'hash_backend_thread': 'Threads',
+        'hash_backend_process': 'Processes',
+        'hash_backend_hint': 'Processes help with very many small files or slow hashes like CRC32',
+        'process_workers': 'Processes:',
+        'process_batch_size': 'Batch size:',
+        'process_workers_hint': '0 = CPU count ({count})',
+        'hash_benchmark': 'Hash Benchmark',
+        'hash_benchmark_running': 'Measuring...',
+        'hash_benchmark_result': 'Hash speed per algorithm on this machine (in memory, excluding disk speed):\n\n{results}',
     },
 }
 
@@ -940,12 +1168,53 @@ def configure_notion_listbox(listbox, font=None):
     listbox.config(**options)
 
 
+# 백그라운드 폴더 비교 진행률을 확인하는 주기 (ms)
+FOLDER_JOB_POLL_MS = 100
+# 결과를 트리에 넣을 때 한 번에 쓰는 최대 시간 (ms)과 시간 확인 단위 (행 수)
+FOLDER_STREAM_SLICE_MS = 30
+FOLDER_STREAM_BATCH = 50
+# 트리에 넣은 행이 이 수보다 적을 때만 새 폴더를 바로 채워 펼침. 넘으면 폴더는
+# 접힌 채 자리표시 자식 하나만 두고, 펼칠 때(<<TreeviewOpen>>) 결과 모델에서 채움
+FOLDER_TREE_EAGER_ROWS = 2000
+
+# 필터 바 상태 체크박스 (FOLDER_BADGE_KEYS 분류, UI 문자열 키)
+FOLDER_FILTER_SPECS = (
+    ('differ', 'filter_differ'),
+    ('left_only', 'filter_left_only'),
+    ('right_only', 'filter_right_only'),
+    ('newer', 'filter_newer'),
+)
+# 경로 검색 입력이 멈춘 뒤 필터를 적용할 때까지 기다리는 시간 (ms)
+FOLDER_FILTER_DELAY_MS = 250
+# 동기화 미리 보기 목록에 보여 줄 최대 작업 수 (나머지는 개수만)
+SYNC_PREVIEW_LIMIT = 500
+# 큰 파일 미리보기: 스크롤이 이 비율을 넘으면 다음 쪽을 읽음
+FOLDER_PREVIEW_PAGE_TRIGGER = 0.9
+# 쪽을 더 읽을 때 앞 쪽 끝의 같은 줄을 이만큼 겹쳐 다시 비교
+FOLDER_PREVIEW_DIFF_OVERLAP = 50
+
+# 폴더 트리 열 ID -> FolderResultModel 정렬 열 이름
+FOLDER_SORT_COLUMN_KEYS = {
+    '#0': 'name',
+    '상태': 'status',
+    '왼쪽_크기': 'left_size',
+    '왼쪽_수정일': 'left_mtime',
+    '오른쪽_크기': 'right_size',
+    '오른쪽_수정일': 'right_mtime',
+}
+
+# 실시간 감시 결과를 GUI가 확인하는 주기 (ms)
+FOLDER_WATCH_TICK_MS = 250
+
+
+
 class DataManager:
     """히스토리 및 즐겨찾기 데이터 관리"""
 
     def __init__(self):
-        self.config_dir = Path.home() / '.conferatur'
+        self.config_dir = DEFAULT_CONFIG_DIR
         self.config_file = self.config_dir / 'config.json'
+        self.hash_cache_file = self.config_dir / HASH_CACHE_FILENAME
         self.max_history = 20
 
         # 디렉토리 생성
@@ -962,7 +1231,15 @@ class DataManager:
             'font_family': 'Pretendard Std',  # 기본 폰트 (PretendardStd OTF 번들)
             'font_size': DEFAULT_TEXT_FONT_SIZE,  # 신규 사용자 기본 폰트 크기
             'language': 'ko',
-            'exclude_patterns': []       # 폴더 비교 제외 패턴
+            'exclude_patterns': [],      # 폴더 비교 제외 패턴
+            'hash_workers': 0,           # 해시 작업자 수 (0 = 자동)
+            'hash_algorithm': DEFAULT_HASH_ALGORITHM,  # 마지막으로 사용한 폴더 비교 해시 알고리즘
+            'hash_chunk_kb': DEFAULT_HASH_CHUNK_SIZE // 1024,  # 해시 읽기 버퍼 크기 (KB)
+            'hash_backend': DEFAULT_HASH_BACKEND,  # 해시 계산 방식 (thread / process)
+            'process_workers': 0,        # 프로세스 풀 크기 (0 = CPU 수)
+            'process_batch_size': DEFAULT_PROCESS_BATCH_SIZE,  # 작은 파일 묶음 크기
+            'hash_cache_max_entries': DEFAULT_HASH_CACHE_MAX_ENTRIES,  # 해시 캐시 최대 항목 수
+            'preview_threshold_kb': DEFAULT_PREVIEW_THRESHOLD_KB  # 이보다 큰 파일은 미리보기를 쪽 단위로 읽음
         }
 
         self.load()
@@ -986,12 +1263,13 @@ class DataManager:
         except Exception as e:
             print(f"설정 파일 저장 실패: {e}")
 
-    def add_folder_history(self, left, right, method):
+    def add_folder_history(self, left, right, method, algorithm=DEFAULT_HASH_ALGORITHM):
         """폴더 비교 히스토리 추가"""
         item = {
             'left': left,
             'right': right,
             'method': method,
+            'algorithm': algorithm,
             'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
         # 중복 제거
@@ -1031,13 +1309,14 @@ class DataManager:
         self.data['text_history'] = self.data['text_history'][:self.max_history]
         self.save()
 
-    def add_folder_favorite(self, name, left, right, method):
+    def add_folder_favorite(self, name, left, right, method, algorithm=DEFAULT_HASH_ALGORITHM):
         """폴더 비교 즐겨찾기 추가"""
         item = {
             'name': name,
             'left': left,
             'right': right,
-            'method': method
+            'method': method,
+            'algorithm': algorithm
         }
         self.data['folder_favorites'].append(item)
         self.save()
@@ -1138,6 +1417,100 @@ class DataManager:
         self.data['exclude_patterns'] = patterns
         self.save()
 
+    def get_hash_workers(self):
+        """해시 작업자 수 설정 가져오기 (0 = 자동)"""
+        try:
+            return max(0, int(self.data.get('hash_workers', 0)))
+        except (TypeError, ValueError):
+            return 0
+
+    def set_hash_workers(self, workers):
+        """해시 작업자 수 설정 저장"""
+        self.data['hash_workers'] = max(0, min(int(workers), MAX_HASH_WORKERS))
+        self.save()
+
+    def get_hash_chunk_kb(self):
+        """해시 읽기 버퍼 크기(KB) 가져오기"""
+        try:
+            chunk_kb = int(self.data.get('hash_chunk_kb', DEFAULT_HASH_CHUNK_SIZE // 1024))
+        except (TypeError, ValueError):
+            chunk_kb = DEFAULT_HASH_CHUNK_SIZE // 1024
+        return max(MIN_HASH_CHUNK_KB, min(chunk_kb, MAX_HASH_CHUNK_KB))
+
+    def set_hash_chunk_kb(self, chunk_kb):
+        """해시 읽기 버퍼 크기(KB) 저장"""
+        self.data['hash_chunk_kb'] = max(MIN_HASH_CHUNK_KB, min(int(chunk_kb), MAX_HASH_CHUNK_KB))
+        self.save()
+
+    def get_hash_backend(self):
+        """해시 계산 방식 가져오기 (thread / process)"""
+        return normalize_hash_backend(self.data.get('hash_backend', DEFAULT_HASH_BACKEND))
+
+    def set_hash_backend(self, backend):
+        """해시 계산 방식 저장"""
+        self.data['hash_backend'] = normalize_hash_backend(backend)
+        self.save()
+
+    def get_process_workers(self):
+        """프로세스 풀 크기 가져오기 (0 = CPU 수)"""
+        try:
+            return max(0, int(self.data.get('process_workers', 0)))
+        except (TypeError, ValueError):
+            return 0
+
+    def set_process_workers(self, workers):
+        """프로세스 풀 크기 저장"""
+        self.data['process_workers'] = max(0, min(int(workers), MAX_HASH_WORKERS))
+        self.save()
+
+    def get_process_batch_size(self):
+        """프로세스 풀에 한 번에 보내는 작은 파일 쌍 수 가져오기"""
+        return normalize_process_batch_size(self.data.get('process_batch_size', DEFAULT_PROCESS_BATCH_SIZE))
+
+    def set_process_batch_size(self, batch_size):
+        """작은 파일 묶음 크기 저장"""
+        self.data['process_batch_size'] = normalize_process_batch_size(batch_size)
+        self.save()
+
+    def get_hash_algorithm(self):
+        """마지막으로 사용한 해시 알고리즘 (설치되지 않았으면 기본값)"""
+        return normalize_hash_algorithm(self.data.get('hash_algorithm', DEFAULT_HASH_ALGORITHM))
+
+    def set_hash_algorithm(self, algorithm):
+        """해시 알고리즘 설정 저장"""
+        self.data['hash_algorithm'] = normalize_hash_algorithm(algorithm)
+        self.save()
+
+    def get_hash_cache_max_entries(self):
+        """해시 캐시 최대 항목 수 가져오기"""
+        try:
+            return max(1, int(self.data.get('hash_cache_max_entries', DEFAULT_HASH_CACHE_MAX_ENTRIES)))
+        except (TypeError, ValueError):
+            return DEFAULT_HASH_CACHE_MAX_ENTRIES
+
+    def set_hash_cache_max_entries(self, max_entries):
+        """해시 캐시 최대 항목 수 저장"""
+        self.data['hash_cache_max_entries'] = max(1, int(max_entries))
+        self.save()
+
+    def get_preview_threshold_kb(self):
+        """미리보기를 통째로 읽을 최대 파일 크기(KB) 가져오기"""
+        try:
+            threshold_kb = int(self.data.get('preview_threshold_kb', DEFAULT_PREVIEW_THRESHOLD_KB))
+        except (TypeError, ValueError):
+            threshold_kb = DEFAULT_PREVIEW_THRESHOLD_KB
+        return max(MIN_PREVIEW_THRESHOLD_KB, min(threshold_kb, MAX_PREVIEW_THRESHOLD_KB))
+
+    def set_preview_threshold_kb(self, threshold_kb):
+        """미리보기를 통째로 읽을 최대 파일 크기(KB) 저장"""
+        self.data['preview_threshold_kb'] = max(MIN_PREVIEW_THRESHOLD_KB,
+                                                min(int(threshold_kb), MAX_PREVIEW_THRESHOLD_KB))
+        self.save()
+
+    def open_hash_cache(self):
+        """config.json 옆의 영구 해시 캐시 열기"""
+        return HashCache(self.hash_cache_file, self.get_hash_cache_max_entries())
+
 
 class CompareToolApp:
     def __init__(self, root):
@@ -1180,9 +1553,20 @@ class CompareToolApp:
         # 파일 비교 차이점 블록 정보 저장
         self.file_diff_blocks = []  # 파일 비교 모드의 차이점 블록 정보
         self.text_diff_blocks = []  # 텍스트 비교 모드의 차이점 블록 정보
-        self._folder_tree_raw_names = {}
         self._folder_sort_state = {'col': None, 'reverse': False}
         self._folder_tree_heading_labels = {}
+        self._folder_job = None
+        self._folder_job_after = None
+        self._folder_filter_after = None
+        self._folder_stream = self._new_folder_stream()
+        self._folder_watch = None
+        self._manifest_job = None
+        self._manifest_job_after = None
+        self._copy_job = None
+        self._copy_job_after = None
+        self._refresh_job = None
+        self._refresh_job_after = None
+        self._folder_preview = None  # 큰 파일 미리보기의 쪽 단위 읽기 상태
 
         self.create_menubar()
         self.create_tabs()
@@ -1209,11 +1593,24 @@ class CompareToolApp:
             'md5': self.t('method_md5'),
             'date': self.t('method_date'),
             'both': self.t('method_both'),
+            'binary': self.t('method_binary'),
         }.get(method, method)
 
+    def _selected_hash_algorithm(self):
+        """알고리즘 콤보박스의 표시 이름을 내부 이름으로 변환"""
+        label = self.hash_algorithm_var.get()
+        for name, (display, _) in HASH_ALGORITHMS.items():
+            if label in (name, display):
+                return name
+        return label
+
+    def _set_selected_hash_algorithm(self, algorithm):
+        self.hash_algorithm_var.set(hash_algorithm_label(normalize_hash_algorithm(algorithm)))
+
     def _folder_status_label(self, status):
         return {
             '내용 다름 (MD5)': self.t('status_content_diff_md5'),
+            '내용 다름 (바이트)': self.t('status_content_diff_bytes'),
             '왼쪽만 존재': self.t('status_left_only'),
             '오른쪽만 존재': self.t('status_right_only'),
             '왼쪽이 최신': self.t('status_left_newer'),
@@ -1228,7 +1625,7 @@ class CompareToolApp:
         for attr in (
             'left_folder_var', 'right_folder_var',
             'file_left_var', 'file_right_var',
-            'compare_method_var',
+            'compare_method_var', 'hash_algorithm_var',
         ):
             if hasattr(self, attr):
                 state[attr] = getattr(self, attr).get()
@@ -1251,7 +1648,7 @@ class CompareToolApp:
         for attr in (
             'left_folder_var', 'right_folder_var',
             'file_left_var', 'file_right_var',
-            'compare_method_var',
+            'compare_method_var', 'hash_algorithm_var',
         ):
             if attr in state and hasattr(self, attr):
                 getattr(self, attr).set(state[attr])
@@ -1273,6 +1670,8 @@ class CompareToolApp:
 
     def rebuild_ui(self, preserve_state=True):
         state = self._snapshot_ui_state() if preserve_state else {}
+        self._stop_folder_compare_job()
+        self._stop_folder_watch()
         if hasattr(self, 'notebook'):
             self.notebook.destroy()
         self.create_menubar()
@@ -1334,6 +1733,7 @@ class CompareToolApp:
         settings_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label=self.t('menu_settings'), menu=settings_menu)
         settings_menu.add_command(label=self.t('menu_font_settings'), command=self.show_font_settings)
+        settings_menu.add_command(label=self.t('menu_performance_settings'), command=self.show_performance_settings)
         settings_menu.add_separator()
 
         language_menu = tk.Menu(settings_menu, tearoff=0)
@@ -1362,7 +1762,7 @@ class CompareToolApp:
 
         # 히스토리 및 즐겨찾기 버튼
         history_fav_frame = ttk.Frame(control_frame)
-        history_fav_frame.grid(row=0, column=0, columnspan=3, sticky='w', pady=(0, 12))
+        history_fav_frame.grid(row=0, column=0, columnspan=4, sticky='w', pady=(0, 12))
         build_history_favorite_row(history_fav_frame, self, 'folder')
 
         # 왼쪽 폴더 선택
@@ -1373,6 +1773,9 @@ class CompareToolApp:
         create_action_button(control_frame, self.t('browse'),
                              command=lambda: self.browse_folder(self.left_folder_var, self.left_folder_entry),
                              role='secondary', icon='📁').grid(row=1, column=2, padx=0, pady=5)
+        create_action_button(control_frame, self.t('browse_manifest'),
+                             command=lambda: self.browse_manifest(self.left_folder_var, self.left_folder_entry),
+                             role='ghost', icon='📋').grid(row=1, column=3, padx=(8, 0), pady=5)
 
         # 오른쪽 폴더 선택
         ttk.Label(control_frame, text=self.t('right_folder')).grid(row=2, column=0, sticky='w', padx=(0, 8), pady=5)
@@ -1382,28 +1785,59 @@ class CompareToolApp:
         create_action_button(control_frame, self.t('browse'),
                              command=lambda: self.browse_folder(self.right_folder_var, self.right_folder_entry),
                              role='secondary', icon='📁').grid(row=2, column=2, padx=0, pady=5)
+        create_action_button(control_frame, self.t('browse_manifest'),
+                             command=lambda: self.browse_manifest(self.right_folder_var, self.right_folder_entry),
+                             role='ghost', icon='📋').grid(row=2, column=3, padx=(8, 0), pady=5)
 
         # Entry 위젯이 확장되도록 column 1에 weight 설정
         control_frame.columnconfigure(1, weight=1)
 
         # 비교 옵션
         option_frame = ttk.Frame(control_frame)
-        option_frame.grid(row=3, column=0, columnspan=3, sticky='ew', pady=(12, 0))
+        option_frame.grid(row=3, column=0, columnspan=4, sticky='ew', pady=(12, 0))
 
         self.compare_method_var = tk.StringVar(value="md5")
         method_frame = ttk.Frame(option_frame)
         method_frame.pack(side='left', fill='x', expand=True)
         ttk.Radiobutton(method_frame, text=f"🔍 {self.t('method_md5')}", variable=self.compare_method_var, value="md5").pack(side='left', padx=(0, 12))
         ttk.Radiobutton(method_frame, text=f"📅 {self.t('method_date')}", variable=self.compare_method_var, value="date").pack(side='left', padx=(0, 12))
-        ttk.Radiobutton(method_frame, text=f"🔍📅 {self.t('method_both')}", variable=self.compare_method_var, value="both").pack(side='left')
+        ttk.Radiobutton(method_frame, text=f"🔍📅 {self.t('method_both')}", variable=self.compare_method_var, value="both").pack(side='left', padx=(0, 12))
+        ttk.Radiobutton(method_frame, text=f"🧮 {self.t('method_binary')}", variable=self.compare_method_var, value="binary").pack(side='left', padx=(0, 16))
+
+        # 해시 알고리즘 (해시 비교/해시 + 날짜에서 사용)
+        ttk.Label(method_frame, text=self.t('hash_algorithm')).pack(side='left', padx=(0, 6))
+        self.hash_algorithm_var = tk.StringVar()
+        self._set_selected_hash_algorithm(self.data_manager.get_hash_algorithm())
+        ttk.Combobox(method_frame, textvariable=self.hash_algorithm_var, state='readonly', width=14,
+                     values=[display for display, _ in HASH_ALGORITHMS.values()]).pack(side='left')
+
+        # 실시간 감시 (비교 후 바뀐 파일만 다시 판정)
+        self.folder_watch_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(method_frame, text=f"👁 {self.t('watch_mode')}", variable=self.folder_watch_var,
+                        command=self.toggle_folder_watch).pack(side='left', padx=(16, 0))
 
         action_frame = ttk.Frame(option_frame)
         action_frame.pack(side='right')
-        build_button_row(action_frame, [
+        _, action_buttons = build_button_row(action_frame, [
             {'label': self.t('reset'), 'icon': '↻', 'command': self.clear_folder_comparison, 'role': 'ghost'},
             {'label': self.t('exclude_patterns'), 'icon': '⚙️', 'command': self.open_exclude_patterns_dialog, 'role': 'secondary'},
+            {'label': self.t('export_manifest'), 'icon': '💾', 'command': self.export_folder_manifest, 'role': 'secondary'},
             {'label': self.t('start_compare'), 'icon': '▶', 'command': self.compare_folders, 'role': 'primary'},
         ], align='right', pady=(0, 0))
+        self.folder_compare_button = action_buttons[3]
+
+        # 진행률 (비교 중에만 표시)
+        self.folder_progress_frame = ttk.Frame(control_frame)
+        self.folder_progress_frame.grid(row=4, column=0, columnspan=4, sticky='ew', pady=(10, 0))
+        self.folder_progress_frame.columnconfigure(1, weight=1)
+        self.folder_progress_label = ttk.Label(self.folder_progress_frame, text='')
+        self.folder_progress_label.grid(row=0, column=0, columnspan=2, sticky='w')
+        self.folder_progress_bar = ttk.Progressbar(self.folder_progress_frame, mode='determinate', maximum=100)
+        self.folder_progress_bar.grid(row=1, column=0, columnspan=2, sticky='ew', pady=(4, 0))
+        create_action_button(self.folder_progress_frame, self.t('cancel_compare'),
+                             command=self.cancel_folder_compare, icon='■',
+                             role='ghost').grid(row=1, column=2, padx=(8, 0), pady=(4, 0))
+        self.folder_progress_frame.grid_remove()
 
         # 결과 영역
         result_frame = ttk.Frame(frame)
@@ -1422,6 +1856,8 @@ class CompareToolApp:
                            'command': lambda: self.copy_file('left_to_right'), 'role': 'secondary'},
                           {'label': self.t('copy_right_to_left'), 'icon': '📥',
                            'command': lambda: self.copy_file('right_to_left'), 'role': 'secondary'},
+                          {'label': self.t('sync'), 'icon': '🔄',
+                           'command': self.open_folder_sync_dialog, 'role': 'secondary'},
                           {'label': self.t('expand_all'), 'icon': '⊞',
                            'command': self.expand_all_folder_tree, 'role': 'ghost'},
                           {'label': self.t('collapse_all'), 'icon': '⊟',
@@ -1433,6 +1869,24 @@ class CompareToolApp:
                       ],
                       pady=(0, 8))
 
+        # 필터 바 (상태 분류 + 경로 검색)
+        filter_bar = ttk.Frame(tree_frame)
+        filter_bar.pack(fill='x', pady=(0, 8))
+        ttk.Label(filter_bar, text=self.t('filter_label')).pack(side='left', padx=(0, 8))
+        self.folder_filter_vars = {}
+        for key, label_key in FOLDER_FILTER_SPECS:
+            self.folder_filter_vars[key] = tk.BooleanVar(value=True)
+            ttk.Checkbutton(filter_bar, text=self.t(label_key), variable=self.folder_filter_vars[key],
+                            command=self.apply_folder_filter).pack(side='left', padx=(0, 12))
+        ttk.Label(filter_bar, text=self.t('filter_search')).pack(side='left', padx=(4, 6))
+        self.folder_search_var = tk.StringVar()
+        search_entry = ttk.Entry(filter_bar, textvariable=self.folder_search_var, width=28)
+        search_entry.pack(side='left', fill='x', expand=True)
+        search_entry.bind('<KeyRelease>', self._schedule_folder_filter)
+        search_entry.bind('<Return>', self.apply_folder_filter)
+        create_action_button(filter_bar, self.t('filter_clear'), command=self.clear_folder_filter,
+                             role='ghost', icon='✕').pack(side='left', padx=(8, 0))
+
         # 스크롤바
         tree_scroll_y = ttk.Scrollbar(tree_frame, orient='vertical')
         tree_scroll_y.pack(side='right', fill='y')
@@ -1463,7 +1917,7 @@ class CompareToolApp:
         self._update_folder_tree_headings()
 
         self.folder_tree.column('#0', width=360, minwidth=220)
-        self.folder_tree.column('상태', width=150, minwidth=120)
+        self.folder_tree.column('상태', width=190, minwidth=120)
         self.folder_tree.column('왼쪽_크기', width=85, minwidth=70, anchor='e')
         self.folder_tree.column('오른쪽_크기', width=85, minwidth=70, anchor='e')
         self.folder_tree.column('왼쪽_수정일', width=155, minwidth=135)
@@ -1471,6 +1925,7 @@ class CompareToolApp:
 
         # 트리뷰 선택 이벤트 바인딩
         self.folder_tree.bind('<<TreeviewSelect>>', self.on_folder_tree_select)
+        self.folder_tree.bind('<<TreeviewOpen>>', self.on_folder_tree_open)
 
         # 컨텍스트 메뉴 생성 (루트 윈도우에 연결)
         self.folder_tree_context_menu = tk.Menu(self.root, tearoff=0)
@@ -1538,6 +1993,12 @@ class CompareToolApp:
         # 스크롤 동기화
         self.setup_scroll_sync(self.folder_preview_left, self.folder_preview_right)
 
+        # 잘린 미리보기 표시, 끝 근처까지 스크롤하면 다음 쪽 읽기
+        for widget in (self.folder_preview_left, self.folder_preview_right):
+            widget.tag_configure('preview_truncated', foreground=NOTION_COLORS['slate'], justify='center')
+            widget.config(yscrollcommand=lambda first, last, widget=widget:
+                          self._on_folder_preview_yscroll(widget, first, last))
+
     def _configure_folder_tree_tags(self):
         """폴더 비교 트리의 상태별 시각 태그를 등록."""
         self.folder_tree.tag_configure('diff',
@@ -1560,18 +2021,34 @@ class CompareToolApp:
                                        foreground=NOTION_COLORS['ink'],
                                        font=(self.font_family, DEFAULT_TEXT_FONT_SIZE, 'bold'))
 
-    def _set_folder_tree_open_state(self, open_state, parent=''):
-        """폴더 비교 Treeview의 자식 노드를 재귀적으로 펼치거나 접음.
+    def _set_folder_tree_open_state(self, open_state):
+        """폴더 비교 Treeview의 모든 폴더 노드를 펼치거나 접음.
 
-        파일 노드(상태 values 있음)는 자식이 없으므로 open 상태 변경 효과 없음.
+        펼칠 때는 아직 채우지 않은 폴더도 결과 모델에서 채운다. 상위 폴더부터
+        차례로 채우므로 한 번에 전체 트리가 만들어진다.
         item text/values/tags는 건드리지 않고 open 속성만 수정한다.
         """
         tree = getattr(self, 'folder_tree', None)
         if tree is None:
             return
-        for child in tree.get_children(parent):
-            tree.item(child, open=open_state)
-            self._set_folder_tree_open_state(open_state, child)
+        stream = self._folder_stream
+        model = stream['model']
+        if not open_state:
+            for record, item in stream['items'].items():
+                if model.is_folder(record):
+                    tree.item(item, open=False)
+            return
+        pending = [ROOT_RECORD]
+        while pending:
+            folder = pending.pop()
+            if folder != ROOT_RECORD:
+                if folder not in stream['loaded']:
+                    self._load_folder_children(stream, folder)
+                tree.item(stream['items'][folder], open=True)
+            pending.extend(record for record in self._folder_children(stream, folder) if model.is_folder(record))
+        # 접혀 있던 동안 정렬이 바뀐 단계도 이제 보이므로 순서 반영
+        if stream['stale_orders']:
+            self._emit_folder_orders(stream, ROOT_RECORD)
 
     def expand_all_folder_tree(self):
         """폴더 비교 트리의 모든 폴더 노드를 펼침."""
@@ -1585,6 +2062,7 @@ class CompareToolApp:
         """상태 텍스트를 Treeview tag와 경로 아이콘으로 변환."""
         status_visuals = {
             '내용 다름 (MD5)': ('diff', '≠ '),
+            '내용 다름 (바이트)': ('diff', '≠ '),
             '왼쪽만 존재': ('left_only', '◀ '),
             '오른쪽만 존재': ('right_only', '▶ '),
             '왼쪽이 최신': ('left_newer', '⏱ '),
@@ -1594,55 +2072,37 @@ class CompareToolApp:
         }
         return status_visuals.get(status, ('', ''))
 
-    def _get_folder_diff_count_key(self, status):
-        """폴더 배지에서 사용할 상태 카운트 키를 반환."""
-        if status == '내용 다름 (MD5)':
-            return 'differ'
-        if status == '왼쪽만 존재':
-            return 'left_only'
-        if status == '오른쪽만 존재':
-            return 'right_only'
-        if status in (
-            '왼쪽이 최신',
-            '오른쪽이 최신',
-            '내용 같음, 왼쪽이 최신',
-            '내용 같음, 오른쪽이 최신',
-        ):
-            return 'newer'
-        return None
+    def _annotate_folder_diff_counts(self, stream, folders):
+        """폴더 노드 #0 텍스트에 하위 차이 요약 배지를 붙임 (Tk에 있는 노드만)."""
+        for folder in folders:
+            item = stream['items'].get(folder)
+            if item is not None:
+                self.folder_tree.item(item, text=self._folder_record_text(stream, folder))
+
+    def _folder_record_text(self, stream, folder):
+        """모델의 폴더 레코드로 폴더 노드 #0 텍스트를 만듦"""
+        model = stream['model']
+        if stream['filter'] is not None:
+            stats = dict(zip(FOLDER_BADGE_KEYS, stream['filter']['badges'][folder]))
+        else:
+            stats = model.badge_counts(folder)
+        return self._folder_node_text(model.names[folder], stats)
 
-    def _annotate_folder_diff_counts(self, folder_nodes, folder_stats):
-        """폴더 노드 #0 텍스트에 하위 차이 요약 배지를 붙임."""
+    def _folder_node_text(self, folder_name, stats):
+        """폴더 노드 #0 텍스트 (아이콘 + 이름 + 하위 차이 요약 배지)"""
         label_specs = (
             ('differ', 'differ'),
             ('left_only', 'left-only'),
             ('right_only', 'right-only'),
             ('newer', 'newer'),
         )
-        for folder_path, item_id in folder_nodes.items():
-            stats = folder_stats.get(folder_path, {})
-            label_parts = [
-                f"{stats[key]} {label}"
-                for key, label in label_specs
-                if stats.get(key)
-            ]
-            badge = f" ({', '.join(label_parts)})" if label_parts else ''
-            folder_name = self._folder_tree_raw_names.get(item_id, os.path.basename(folder_path))
-            self.folder_tree.item(item_id, text=f"📁 {folder_name}{badge}")
-
-    def _clean_folder_tree_text(self, text):
-        """raw name dict가 없을 때 표시용 아이콘/배지를 제거하는 fallback."""
-        clean_text = text
-        for prefix in ('📁 ', '≠ ', '◀ ', '▶ ', '⏱ '):
-            if clean_text.startswith(prefix):
-                clean_text = clean_text[len(prefix):]
-                break
-        return re.sub(
-            r'\s+\(\d+ (?:differ|left-only|right-only|newer)'
-            r'(?:, \d+ (?:differ|left-only|right-only|newer))*\)$',
-            '',
-            clean_text
-        )
+        label_parts = [
+            f"{stats[key]} {label}"
+            for key, label in label_specs
+            if stats.get(key)
+        ]
+        badge = f" ({', '.join(label_parts)})" if label_parts else ''
+        return f"📁 {folder_name}{badge}"
 
     def _update_folder_tree_headings(self):
         """정렬 상태 화살표를 포함해 폴더 Treeview heading을 갱신."""
@@ -1667,58 +2127,137 @@ class CompareToolApp:
                 )
             )
 
-    def _get_folder_sort_value(self, item, col):
-        """컬럼별 정렬 값을 반환. 크기 컬럼은 숫자로 비교."""
-        if col == '#0':
-            value = self._folder_tree_raw_names.get(
-                item,
-                self._clean_folder_tree_text(self.folder_tree.item(item, 'text'))
-            )
-        else:
-            column_indexes = {
-                '상태': 0,
-                '왼쪽_크기': 1,
-                '왼쪽_수정일': 2,
-                '오른쪽_크기': 3,
-                '오른쪽_수정일': 4,
-            }
-            values = self.folder_tree.item(item, 'values')
-            index = column_indexes.get(col)
-            value = values[index] if index is not None and len(values) > index else ''
-
-        if col in ('왼쪽_크기', '오른쪽_크기'):
-            try:
-                return int(value)
-            except (TypeError, ValueError):
-                return 0
-        return str(value).lower()
-
-    def _sort_folder_tree_children(self, parent, col, reverse):
-        """폴더 우선 그룹을 유지하면서 자식 노드를 재귀 정렬."""
-        children = list(self.folder_tree.get_children(parent))
-        folders = []
-        files = []
-
-        for child in children:
-            values = self.folder_tree.item(child, 'values')
-            if values and values[0]:
-                files.append(child)
-            else:
-                folders.append(child)
-
-        folders.sort(key=lambda item: self._get_folder_sort_value(item, col), reverse=reverse)
-        files.sort(key=lambda item: self._get_folder_sort_value(item, col), reverse=reverse)
-
-        for index, child in enumerate(folders + files):
-            self.folder_tree.move(child, parent, index)
-            self._sort_folder_tree_children(child, col, reverse)
+    def _folder_children(self, stream, folder):
+        """트리에 보일 폴더의 자식 레코드 (경로순, 필터 중이면 조건에 맞는 것만)"""
+        model = stream['model']
+        view_filter = stream['filter']
+        if view_filter is None:
+            return model.children[folder]
+        children = view_filter['children'].get(folder)
+        if children is None:
+            files = view_filter['files']
+            folders = view_filter['badges']
+            children = [record for record in model.children[folder] if record in files or record in folders]
+            view_filter['children'][folder] = children
+        return children
+
+    def _folder_view_order(self, stream, folder):
+        """폴더의 자식 레코드를 현재 정렬 상태 순서로 반환 (정렬 전이면 모델의 경로순).
+
+        직전 표시 순서를 입력으로 안정 정렬하므로 같은 열을 다시 누르면 거의 선형
+        시간에 끝나고, 다른 열로 바꾸면 직전 순서가 2차 기준으로 남는다.
+        """
+        model = stream['model']
+        col = self._folder_sort_state.get('col')
+        if not col:
+            return self._folder_children(stream, folder)
+        previous = stream['view_orders'].get(folder)
+        if previous is None:
+            previous = self._folder_children(stream, folder)
+        status_keys = None
+        if col == '상태':
+            status_keys = [''] + [self._folder_status_label(status).lower() for status in FOLDER_STATUSES]
+        return model.sorted_children(previous, FOLDER_SORT_COLUMN_KEYS[col],
+                                     reverse=self._folder_sort_state.get('reverse', False),
+                                     status_keys=status_keys)
+
+    def _emit_folder_orders(self, stream, folder):
+        """folder부터 보이는 단계(채워지고 펼쳐진 폴더)를 따라가며 순서가 낡은 단계만 Tk에 반영.
+
+        바뀐 단계마다 set_children 한 번으로 자식 순서를 통째로 바꾼다. 접혀 있는
+        단계는 stale_orders에 남겨 두었다가 펼칠 때 반영한다.
+        """
+        items = stream['items']
+        pending = [folder]
+        while pending:
+            folder = pending.pop()
+            order = stream['view_orders'].get(folder)
+            if folder in stream['stale_orders']:
+                stream['stale_orders'].discard(folder)
+                new_order = self._folder_view_order(stream, folder)
+                if new_order != order:
+                    stream['view_orders'][folder] = new_order
+                    self.folder_tree.set_children(items.get(folder, ''), *[items[record] for record in new_order])
+                order = new_order
+            for record in order if order is not None else self._folder_children(stream, folder):
+                if record in stream['loaded'] and self.folder_tree.item(items[record], 'open'):
+                    pending.append(record)
 
     def _sort_folder_tree(self, col, reverse=False):
-        """폴더 비교 트리를 컬럼 기준으로 정렬."""
+        """폴더 비교 트리를 컬럼 기준으로 정렬.
+
+        순서는 결과 모델에서 계산하고 Tk에는 지금 보이는 단계만 다시 내보낸다.
+        """
+        stream = self._folder_stream
+        # 정렬 후에는 새 행을 끝에 붙이고, 스트리밍이 끝나면 다시 정렬
+        stream['resort'] = True
         self._folder_sort_state = {'col': col, 'reverse': reverse}
-        self._sort_folder_tree_children('', col, reverse)
+        for folder in stream['loaded']:
+            if folder not in stream['view_orders']:
+                stream['view_orders'][folder] = list(self._folder_children(stream, folder))
+        stream['stale_orders'] = set(stream['loaded'])
+        self._emit_folder_orders(stream, ROOT_RECORD)
         self._update_folder_tree_headings()
 
+    def _folder_filter_spec(self):
+        """필터 바 조건 (보여 줄 배지 분류 또는 None, 경로 검색어). 조건이 없으면 None"""
+        filter_vars = getattr(self, 'folder_filter_vars', None)
+        if not filter_vars:
+            return None
+        badge_keys = tuple(key for key, var in filter_vars.items() if var.get())
+        pattern = self.folder_search_var.get().strip()
+        if len(badge_keys) == len(filter_vars) and not pattern:
+            return None
+        return (None if len(badge_keys) == len(filter_vars) else badge_keys), pattern
+
+    def _build_folder_filter(self, stream):
+        """현재 필터 조건을 결과 모델의 상태 버킷/경로 키로 계산 (조건이 없으면 None).
+
+        files는 조건에 맞는 파일 레코드, badges는 그 파일만 센 폴더별 배지(보일 폴더
+        목록 겸용), children은 폴더를 펼칠 때 채우는 걸러진 자식 목록 캐시다.
+        """
+        spec = self._folder_filter_spec()
+        if spec is None:
+            return None
+        model = stream['model']
+        files = model.filter_files(*spec)
+        return {'files': files, 'badges': model.filter_badges(files), 'children': {}}
+
+    def _rebuild_folder_view(self, stream):
+        """Tk 행을 모두 지우고 결과 모델(필터 중이면 걸러진 보기)의 최상위 단계부터 다시 만듦"""
+        self.folder_tree.delete(*self.folder_tree.get_children())
+        stream.update(items={}, item_records={}, loaded={ROOT_RECORD}, placeholders={},
+                      rows_inserted=0, view_orders={}, stale_orders=set())
+        self._load_folder_children(stream, ROOT_RECORD)
+
+    def _schedule_folder_filter(self, event=None):
+        """경로 검색 입력이 FOLDER_FILTER_DELAY_MS 동안 멈추면 필터 적용"""
+        if self._folder_filter_after is not None:
+            self.root.after_cancel(self._folder_filter_after)
+        self._folder_filter_after = self.root.after(FOLDER_FILTER_DELAY_MS, self.apply_folder_filter)
+
+    def apply_folder_filter(self, event=None):
+        """필터 바 조건으로 폴더 트리를 다시 그림.
+
+        비교가 진행 중이면 조건만 바꾸고, 새 결과는 비교가 끝날 때 한 번에 반영한다.
+        """
+        if self._folder_filter_after is not None:
+            self.root.after_cancel(self._folder_filter_after)
+            self._folder_filter_after = None
+        stream = self._folder_stream
+        view_filter = self._build_folder_filter(stream)
+        if view_filter is None and stream['filter'] is None:
+            return
+        stream['filter'] = view_filter
+        self._rebuild_folder_view(stream)
+
+    def clear_folder_filter(self):
+        """필터 바를 기본값(모든 상태, 검색어 없음)으로 되돌림"""
+        for var in self.folder_filter_vars.values():
+            var.set(True)
+        self.folder_search_var.set('')
+        self.apply_folder_filter()
+
     def setup_text_compare_tab(self):
         """두 번째 모드: 텍스트 직접 비교"""
         frame = self.text_compare_tab
@@ -2182,35 +2721,47 @@ class CompareToolApp:
         widget2.vbar.config(command=on_scrollbar)
 
     def get_tree_item_path(self, item):
-        """트리 아이템의 전체 경로를 가져오기"""
-        path_parts = []
-        current = item
-
-        while current:
-            raw_name = self._folder_tree_raw_names.get(current)
-            if raw_name is None:
-                raw_name = self._clean_folder_tree_text(self.folder_tree.item(current, 'text'))
-            path_parts.insert(0, raw_name)
-            current = self.folder_tree.parent(current)
-
-        return os.path.join(*path_parts) if path_parts else ""
+        """트리 아이템의 전체 경로를 가져오기 (결과 모델의 상대 경로)"""
+        stream = self._folder_stream
+        record = stream['item_records'].get(item)
+        return stream['model'].paths[record] if record is not None else ""
 
-    def get_all_files_from_tree_item(self, item):
-        """트리 아이템(폴더 포함)에서 모든 파일 아이템을 재귀적으로 가져오기"""
-        file_items = []
+    def get_file_paths_from_tree_items(self, items):
+        """트리 아이템들(폴더 포함) 아래 모든 파일의 상대 경로를 경로순으로 가져오기
 
-        # 현재 아이템이 파일인지 폴더인지 확인
-        item_values = self.folder_tree.item(item, 'values')
-
-        if item_values and item_values[0]:  # 상태가 있으면 파일
-            file_items.append(item)
-        else:  # 폴더인 경우
-            # 자식 아이템들을 재귀적으로 처리
-            children = self.folder_tree.get_children(item)
-            for child in children:
-                file_items.extend(self.get_all_files_from_tree_item(child))
+        Tk를 거치지 않고 결과 모델의 전위 배치에서 아이템마다 구간 하나를 잘라 온다.
+        겹치는 선택(폴더와 그 안의 파일 등)은 구간을 합쳐 중복 없이 모은다.
+        아직 펼치지 않아 Tk에 행이 없는 파일도 포함된다.
+        """
+        stream = self._folder_stream
+        model = stream['model']
+        spans = sorted(model.subtree_range(stream['item_records'][item])
+                       for item in items if item in stream['item_records'])  # 자리표시 행 제외
+        merged = []
+        for start, end in spans:
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
 
-        return file_items
+        view_filter = stream['filter']
+        file_paths = []
+        for start, end in merged:
+            if view_filter is None:
+                file_paths.extend(model.subtree_paths(start, end))
+            else:
+                # 필터 중에는 보기에 남은 파일만 대상
+                files = view_filter['files']
+                file_paths.extend(model.paths[record] for record in model.subtree_records(start, end)
+                                  if record in files)
+        return file_paths
+
+    def _selected_file_record(self, item):
+        """트리 아이템이 파일 행이면 결과 모델 레코드, 폴더/자리표시 행이면 None"""
+        record = self._folder_stream['item_records'].get(item)
+        if record is None or self._folder_stream['model'].is_folder(record):
+            return None
+        return record
 
     def browse_folder(self, var, entry_widget=None):
         """폴더 선택 대화상자"""
@@ -2230,72 +2781,91 @@ class CompareToolApp:
             if entry_widget:
                 entry_widget.xview_moveto(1.0)
 
+    def browse_manifest(self, var, entry_widget=None):
+        """폴더 대신 비교할 매니페스트 파일 선택"""
+        file = filedialog.askopenfilename(filetypes=[
+            (self.t('manifest_filetype'), '*' + MANIFEST_EXTENSION),
+            ('*', '*'),
+        ])
+        if file:
+            var.set(file)
+            if entry_widget:
+                entry_widget.xview_moveto(1.0)
+
+    def export_folder_manifest(self):
+        """폴더를 골라 매니페스트 파일로 내보내기 (백그라운드 작업)"""
+        if self._folder_task_running():
+            return
+        initial_folder = self.left_folder_var.get()
+        folder = filedialog.askdirectory(initialdir=initial_folder if os.path.isdir(initial_folder) else None)
+        if not folder:
+            return
+        manifest_path = filedialog.asksaveasfilename(
+            defaultextension=MANIFEST_EXTENSION,
+            initialfile=(os.path.basename(os.path.normpath(folder)) or 'folder') + MANIFEST_EXTENSION,
+            filetypes=[(self.t('manifest_filetype'), '*' + MANIFEST_EXTENSION)],
+        )
+        if not manifest_path:
+            return
+
+        job = FolderManifestExportJob(
+            folder, manifest_path,
+            exclude_matcher=compile_exclude_patterns(tuple(self.data_manager.get_exclude_patterns())),
+            hash_workers=self.data_manager.get_hash_workers(),
+            cache_factory=self.data_manager.open_hash_cache,
+            hash_algorithm=self._selected_hash_algorithm(),
+            hash_chunk_size=self.data_manager.get_hash_chunk_kb() * 1024,
+        )
+        self._manifest_job = job
+        self._show_folder_progress(True)
+        job.start()
+        self._manifest_job_after = self.root.after(FOLDER_JOB_POLL_MS, self._poll_manifest_export_job)
+
+    def _poll_manifest_export_job(self):
+        """root.after로 호출되어 매니페스트 내보내기 진행률을 표시"""
+        self._manifest_job_after = None
+        job = self._manifest_job
+        if job is None:
+            return
+        if not job.is_done():
+            if job.cancel_requested():
+                self.folder_progress_label.config(text=self.t('progress_cancelling'))
+            elif job.files_total:
+                self.folder_progress_bar.stop()
+                self.folder_progress_bar.config(mode='determinate', value=job.files_done * 100 / job.files_total)
+                self.folder_progress_label.config(
+                    text=self.t('manifest_exporting', done=job.files_done, total=job.files_total))
+            self._manifest_job_after = self.root.after(FOLDER_JOB_POLL_MS, self._poll_manifest_export_job)
+            return
+
+        self._manifest_job = None
+        self._show_folder_progress(False)
+        if job.cancelled:
+            messagebox.showinfo(self.t('title_notice'), self.t('manifest_export_cancelled'))
+        elif job.error is not None:
+            messagebox.showerror(self.t('title_error'), self.t('manifest_export_failed', error=job.error))
+        else:
+            messagebox.showinfo(self.t('title_done'),
+                                self.t('manifest_export_done', count=job.files_done, path=job.manifest_path))
+
+    def _manifest_side_in_use(self):
+        """마지막 폴더 비교의 한쪽 이상이 매니페스트였는지"""
+        context = self._folder_stream.get('context')
+        return bool(context) and (context['left_manifest'] or context['right_manifest'])
+
     def calculate_md5(self, filepath):
         """파일의 MD5 해시 계산"""
-        hash_md5 = hashlib.md5()
-        try:
-            with open(filepath, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
-        except Exception as e:
-            return None
-
-    def get_file_info(self, filepath):
-        """파일 정보 가져오기"""
-        try:
-            stat = os.stat(filepath)
-            return {
-                'size': stat.st_size,
-                'mtime': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                'mtime_raw': stat.st_mtime
-            }
-        except Exception as e:
-            return None
+        return calculate_file_md5(filepath)
 
     def should_exclude(self, rel_path, patterns):
         """제외 패턴에 매칭되는지 확인"""
-        if not patterns:
-            return False
-
-        # 경로를 정규화 (슬래시로 통일)
-        normalized_path = rel_path.replace(os.sep, '/')
-
-        for pattern in patterns:
-            # 패턴도 슬래시로 통일
-            normalized_pattern = pattern.replace(os.sep, '/')
-
-            # 폴더 패턴 (끝에 /가 있는 경우)
-            if normalized_pattern.endswith('/'):
-                # 폴더 이름이나 경로가 매칭되는지 확인
-                folder_pattern = normalized_pattern.rstrip('/')
-                # 경로의 일부분이 폴더 패턴과 매칭되는지 확인
-                path_parts = normalized_path.split('/')
-                for part in path_parts[:-1]:  # 마지막 부분(파일명)을 제외한 모든 폴더
-                    if fnmatch.fnmatch(part, folder_pattern):
-                        return True
-                # 전체 경로가 폴더 패턴으로 시작하는지 확인
-                if normalized_path.startswith(folder_pattern + '/'):
-                    return True
-            else:
-                # 파일 패턴
-                # 전체 경로 매칭
-                if fnmatch.fnmatch(normalized_path, normalized_pattern):
-                    return True
-                # 파일 이름만 매칭
-                filename = os.path.basename(normalized_path)
-                if fnmatch.fnmatch(filename, normalized_pattern):
-                    return True
-                # 경로의 일부분이 매칭되는지 확인
-                path_parts = normalized_path.split('/')
-                for part in path_parts:
-                    if fnmatch.fnmatch(part, normalized_pattern):
-                        return True
-
-        return False
+        return should_exclude(rel_path, patterns)
 
     def compare_folders(self):
-        """폴더 비교 실행"""
+        """폴더 비교 실행 (스캔과 해시는 백그라운드 작업으로 진행)"""
+        if self._folder_task_running():
+            return
+
         left_folder = self.left_folder_var.get()
         right_folder = self.right_folder_var.get()
 
@@ -2307,261 +2877,841 @@ class CompareToolApp:
             messagebox.showerror(self.t('title_error'), self.t('selected_folder_missing'))
             return
 
+        # 폴더 대신 매니페스트 파일을 고른 경우
+        manifest_headers = {}
+        for side, path in (('left', left_folder), ('right', right_folder)):
+            if os.path.isdir(path):
+                continue
+            header = read_manifest_header(path)
+            if header is None:
+                messagebox.showerror(self.t('title_error'), self.t('not_a_manifest', path=path))
+                return
+            manifest_headers[side] = header
+        if manifest_headers and self.compare_method_var.get() == "binary":
+            messagebox.showwarning(self.t('title_warning'), self.t('manifest_binary_unsupported'))
+            return
+        if len(manifest_headers) == 2 and \
+                manifest_headers['left']['algorithm'] != manifest_headers['right']['algorithm']:
+            messagebox.showwarning(self.t('title_warning'), self.t(
+                'manifest_algorithm_mismatch',
+                left=hash_algorithm_label(manifest_headers['left']['algorithm']),
+                right=hash_algorithm_label(manifest_headers['right']['algorithm'])))
+            return
+        if self.compare_method_var.get() in ("md5", "both"):
+            for header in manifest_headers.values():
+                if header['algorithm'] not in HASH_ALGORITHMS:
+                    messagebox.showwarning(self.t('title_warning'), self.t(
+                        'manifest_algorithm_unavailable', algorithm=header['algorithm']))
+                    return
+
         # 히스토리에 추가
-        self.data_manager.add_folder_history(left_folder, right_folder, self.compare_method_var.get())
+        hash_algorithm = normalize_hash_algorithm(self._selected_hash_algorithm())
+        self.data_manager.set_hash_algorithm(hash_algorithm)
+        self.data_manager.add_folder_history(left_folder, right_folder, self.compare_method_var.get(),
+                                             hash_algorithm)
 
         # 트리뷰 초기화
         for item in self.folder_tree.get_children():
             self.folder_tree.delete(item)
-        self._folder_tree_raw_names.clear()
-
-        compare_method = self.compare_method_var.get()
 
         # 제외 패턴 가져오기
         exclude_patterns = self.data_manager.get_exclude_patterns()
 
-        # 파일 목록 수집
-        left_files = {}
-        right_files = {}
-        excluded_files = set()  # 제외된 파일의 고유 경로 추적
+        job = FolderCompareJob(
+            left_folder, right_folder, self.compare_method_var.get(),
+            exclude_matcher=compile_exclude_patterns(tuple(exclude_patterns)),
+            hash_workers=self.data_manager.get_hash_workers(),
+            cache_factory=self.data_manager.open_hash_cache,
+            hash_algorithm=hash_algorithm,
+            hash_chunk_size=self.data_manager.get_hash_chunk_kb() * 1024,
+            hash_backend=self.data_manager.get_hash_backend(),
+            process_workers=self.data_manager.get_process_workers(),
+            process_batch_size=self.data_manager.get_process_batch_size(),
+        )
+        self._stop_folder_watch()
+        self._folder_job = job
+        self._folder_stream = self._new_folder_stream()
+        # 필터 바 조건이 있으면 결과를 모두 받은 뒤 걸러서 그림
+        self._folder_stream['filter'] = self._build_folder_filter(self._folder_stream)
+        # 복사/삭제 후 부분 갱신에서 같은 조건으로 다시 판정하기 위한 비교 설정
+        self._folder_stream['context'] = {
+            'left_folder': left_folder,
+            'right_folder': right_folder,
+            'left_manifest': 'left' in manifest_headers,
+            'right_manifest': 'right' in manifest_headers,
+            'method': job.method,
+            'hash_algorithm': job.hash_algorithm,
+            'hash_workers': job.hash_workers,
+            'hash_chunk_size': job.hash_chunk_size,
+            'exclude_matcher': job.exclude_matcher,
+        }
+        self._show_folder_progress(True)
+        job.start()
+        self._folder_job_after = self.root.after(FOLDER_JOB_POLL_MS, self._poll_folder_compare_job)
+
+    def cancel_folder_compare(self):
+        """진행 중인 폴더 비교 (또는 매니페스트 내보내기, 일괄 복사, 부분 갱신) 취소 요청"""
+        for job in (self._folder_job, self._manifest_job, self._copy_job, self._refresh_job):
+            if job is not None:
+                job.cancel()
+                self.folder_progress_label.config(text=self.t('progress_cancelling'))
+
+    def _folder_task_running(self):
+        """폴더 탭의 백그라운드 작업(비교, 매니페스트 내보내기, 일괄 복사, 부분 갱신)이 진행 중인지"""
+        return any(job is not None
+                   for job in (self._folder_job, self._manifest_job, self._copy_job, self._refresh_job))
+
+    def _stop_folder_compare_job(self):
+        """진행 중인 작업을 취소하고 폴링을 멈춤 (결과는 버림)"""
+        for job_attr, after_attr in (('_folder_job', '_folder_job_after'),
+                                     ('_manifest_job', '_manifest_job_after'),
+                                     ('_copy_job', '_copy_job_after'),
+                                     ('_refresh_job', '_refresh_job_after')):
+            job = getattr(self, job_attr)
+            if job is None:
+                continue
+            job.cancel()
+            after_id = getattr(self, after_attr)
+            if after_id is not None:
+                try:
+                    self.root.after_cancel(after_id)
+                except tk.TclError:
+                    pass
+            setattr(self, job_attr, None)
+            setattr(self, after_attr, None)
+
+    def _show_folder_progress(self, running):
+        """진행률 영역 표시/숨김과 시작 버튼 상태 전환"""
+        if running:
+            self.folder_progress_label.config(text=self.t('progress_scanning', count=0))
+            self.folder_progress_bar.config(mode='indeterminate', value=0)
+            self.folder_progress_bar.start(FOLDER_JOB_POLL_MS)
+            self.folder_progress_frame.grid()
+            self.folder_compare_button.config(state='disabled')
+        else:
+            self.folder_progress_bar.stop()
+            self.folder_progress_frame.grid_remove()
+            self.folder_compare_button.config(state='normal')
+
+    def _update_folder_progress(self, progress):
+        """작업 스냅샷으로 진행률 라벨/바 갱신"""
+        phase = progress['phase']
+        if phase in ('pending', 'scan'):
+            text = self.t('progress_scanning', count=progress['files_scanned'])
+        elif phase == 'hash':
+            if str(self.folder_progress_bar.cget('mode')) != 'determinate':
+                self.folder_progress_bar.stop()
+                self.folder_progress_bar.config(mode='determinate', maximum=100)
+            total = progress['pairs_total']
+            self.folder_progress_bar.config(
+                value=(progress['pairs_done'] * 100.0 / total) if total else 100)
+            eta = progress['eta']
+            text = self.t('progress_hashing',
+                          done=progress['pairs_done'], total=total,
+                          size=format_byte_size(progress['bytes_hashed']),
+                          rate=format_byte_size(progress['throughput']),
+                          eta=format_duration(eta) if eta is not None else '--:--')
+        else:
+            text = self.t('progress_finishing')
+        if self._folder_job.cancel_requested():
+            text = self.t('progress_cancelling')
+        self.folder_progress_label.config(text=text)
 
-        for root, dirs, files in os.walk(left_folder):
-            for file in files:
-                full_path = os.path.join(root, file)
-                rel_path = os.path.relpath(full_path, left_folder)
+    def _poll_folder_compare_job(self):
+        """root.after로 호출되어 새 결과를 트리에 반영하고 진행률을 갱신.
 
-                # 제외 패턴 확인
-                if self.should_exclude(rel_path, exclude_patterns):
-                    excluded_files.add(rel_path)
-                    continue
+        한 번에 FOLDER_STREAM_SLICE_MS 동안만 행을 넣고 다음 호출로 넘겨 UI가
+        멈추지 않게 한다. 작업이 끝나고 남은 행까지 모두 넣으면 완료 처리.
+        """
+        self._folder_job_after = None
+        job = self._folder_job
+        if job is None:
+            return
 
-                left_files[rel_path] = full_path
+        done = job.is_done()
+        caught_up = self._stream_folder_results(job.results)
+        if not (done and caught_up):
+            self._update_folder_progress(job.snapshot())
+            delay = FOLDER_JOB_POLL_MS if caught_up else 1
+            self._folder_job_after = self.root.after(delay, self._poll_folder_compare_job)
+            return
 
-        for root, dirs, files in os.walk(right_folder):
-            for file in files:
-                full_path = os.path.join(root, file)
-                rel_path = os.path.relpath(full_path, right_folder)
+        self._folder_job = None
+        self._show_folder_progress(False)
+        if self._folder_stream['filter'] is not None:
+            # 필터 중에 들어온 결과까지 포함해 보기를 다시 만듦 (정렬도 이때 적용됨)
+            self._folder_stream['filter'] = self._build_folder_filter(self._folder_stream)
+            self._rebuild_folder_view(self._folder_stream)
+        elif self._folder_stream['resort'] and self._folder_sort_state.get('col'):
+            self._sort_folder_tree(self._folder_sort_state['col'],
+                                   reverse=self._folder_sort_state.get('reverse', False))
+
+        if job.cancelled:
+            messagebox.showinfo(self.t('title_notice'), self.t('folder_compare_cancelled'))
+            return
+        if job.error is not None:
+            messagebox.showerror(self.t('title_error'), self.t('folder_compare_failed', error=job.error))
+            return
 
-                # 제외 패턴 확인
-                if self.should_exclude(rel_path, exclude_patterns):
-                    excluded_files.add(rel_path)
-                    continue
+        if self.folder_watch_var.get():
+            if self._manifest_side_in_use():
+                self.folder_watch_var.set(False)
+            else:
+                self._start_folder_watch()
 
-                right_files[rel_path] = full_path
+        # 완료 메시지
+        message = self.t('folder_compare_done', count=len(job.results))
+        if len(job.excluded_files) > 0:
+            message += f"\n{self.t('excluded_files_count', count=len(job.excluded_files))}"
+        if len(job.excluded_dirs) > 0:
+            message += f"\n{self.t('excluded_dirs_count', count=len(job.excluded_dirs))}"
+        if job.files_skipped > 0:
+            message += "\n" + self.t('identical_dirs_skipped', count=len(job.identical_dirs),
+                                     files=job.files_skipped)
+        messagebox.showinfo(self.t('title_done'), message)
 
-        # 모든 파일 경로 합치기
-        all_paths = set(left_files.keys()) | set(right_files.keys())
+    def _new_folder_stream(self):
+        """스트리밍 삽입 상태: 결과 모델과 그 중 Tk에 만든 행"""
+        return {
+            'cursor': 0,          # 작업 results 중 모델에 넣은 개수
+            'model': FolderResultModel(),  # 결과 원본 (정렬/배지/복사·삭제 대상)
+            # Tk에 실제로 만든 행 (펼친 단계만)
+            'items': {},          # 레코드 -> 트리 아이템 ID
+            'item_records': {},   # 트리 아이템 ID -> 레코드
+            'loaded': {ROOT_RECORD},  # 자식 행을 Tk에 채운 폴더 레코드
+            'placeholders': {},   # 채우기 전 폴더 레코드 -> 자리표시 아이템 ID
+            'rows_inserted': 0,   # 이번 비교에서 Tk에 넣은 행 수 (FOLDER_TREE_EAGER_ROWS 비교용)
+            'resort': False,      # 사용자가 열 정렬을 해서 경로 순서가 아닌지
+            'view_orders': {},    # 정렬 후 채워진 폴더 레코드 -> Tk에 보이는 자식 순서
+            'stale_orders': set(),  # 정렬이 바뀌었지만 접혀 있어 아직 Tk 순서를 안 바꾼 폴더
+            'filter': None,       # 필터 바 조건으로 거른 보기 (_build_folder_filter) 또는 None
+            'context': None,      # 마지막 비교 설정 (부분 갱신용)
+        }
+
+    def _stream_folder_results(self, results):
+        """results의 새 항목을 시간 제한 안에서 모델과 트리에 삽입.
 
-        # 트리 구조를 위한 딕셔너리 (폴더 경로 -> 트리 아이템 ID)
-        folder_nodes = {}
-        folder_stats = {}
-        diff_count = 0
+        Returns:
+            현재까지의 결과를 모두 넣었으면 True
+        """
+        stream = self._folder_stream
+        deadline = time.monotonic() + FOLDER_STREAM_SLICE_MS / 1000.0
+        total = len(results)
+        dirty_folders = set()
+        while stream['cursor'] < total:
+            batch_end = min(stream['cursor'] + FOLDER_STREAM_BATCH, total)
+            for result in results[stream['cursor']:batch_end]:
+                self._insert_folder_result(result, stream, dirty_folders)
+            stream['cursor'] = batch_end
+            if time.monotonic() >= deadline:
+                break
 
-        for rel_path in sorted(all_paths):
-            left_path = left_files.get(rel_path)
-            right_path = right_files.get(rel_path)
+        # 이번에 바뀐 폴더 노드만 배지 갱신
+        if dirty_folders:
+            self._annotate_folder_diff_counts(stream, dirty_folders)
+        return stream['cursor'] >= total
 
-            status = ""
-            left_info = self.get_file_info(left_path) if left_path else None
-            right_info = self.get_file_info(right_path) if right_path else None
+    def _insert_folder_child(self, stream, record, index=None, **kwargs):
+        """채워진 부모 폴더 아래에 레코드의 행 삽입.
 
-            if not left_path:
-                status = "오른쪽만 존재"
-            elif not right_path:
-                status = "왼쪽만 존재"
+        index를 주지 않으면 모델의 자식 순서(경로순)에 맞는 위치에 넣는다.
+        채워진 폴더는 모델의 자식이 모두 Tk에 있으므로 모델 위치가 곧 Tk 위치다.
+        정렬한 뒤라면 표시 순서 끝에 붙이고, 다음 정렬 때 제자리로 간다.
+        """
+        model = stream['model']
+        parent = model.parent[record]
+        if index is None:
+            view_order = stream['view_orders'].get(parent)
+            if view_order is not None:
+                view_order.append(record)
+                index = 'end'
             else:
-                # 비교 수행
-                different = False
-
-                if compare_method == "md5":
-                    left_md5 = self.calculate_md5(left_path)
-                    right_md5 = self.calculate_md5(right_path)
-                    if left_md5 != right_md5:
-                        different = True
-                        status = "내용 다름 (MD5)"
-
-                elif compare_method == "date":
-                    if left_info and right_info:
-                        if left_info['mtime_raw'] != right_info['mtime_raw']:
-                            different = True
-                            if left_info['mtime_raw'] > right_info['mtime_raw']:
-                                status = "왼쪽이 최신"
-                            else:
-                                status = "오른쪽이 최신"
-
-                elif compare_method == "both":
-                    left_md5 = self.calculate_md5(left_path)
-                    right_md5 = self.calculate_md5(right_path)
-                    if left_md5 != right_md5:
-                        different = True
-                        status = "내용 다름 (MD5)"
-                    elif left_info and right_info and left_info['mtime_raw'] != right_info['mtime_raw']:
-                        different = True
-                        if left_info['mtime_raw'] > right_info['mtime_raw']:
-                            status = "내용 같음, 왼쪽이 최신"
-                        else:
-                            status = "내용 같음, 오른쪽이 최신"
-
-                if not different and status == "":
-                    status = "동일"
-
-            # 차이가 있는 파일만 표시
-            if status != "동일":
-                status_tag, status_icon = self._get_folder_status_visual(status)
-                diff_count += 1
-                left_size = left_info['size'] if left_info else ""
-                left_mtime = left_info['mtime'] if left_info else ""
-                right_size = right_info['size'] if right_info else ""
-                right_mtime = right_info['mtime'] if right_info else ""
-
-                # 경로를 분리하여 트리 구조 생성
-                path_parts = rel_path.split(os.sep)
-
-                # 폴더가 있는 경우 폴더 노드 생성
-                if len(path_parts) > 1:
-                    parent_id = ''
-                    cumulative_path = ''
-                    count_key = self._get_folder_diff_count_key(status)
-
-                    # 폴더 경로 생성 + 자손 stats 누적
-                    for i, part in enumerate(path_parts[:-1]):
-                        if cumulative_path:
-                            cumulative_path = os.path.join(cumulative_path, part)
-                        else:
-                            cumulative_path = part
-
-                        # 폴더 노드가 없으면 생성
-                        if cumulative_path not in folder_nodes:
-                            folder_nodes[cumulative_path] = self.folder_tree.insert(
-                                parent_id, 'end', text=f"📁 {part}",
-                                values=('', '', '', '', ''), open=True, tags=('folder',)
-                            )
-                            self._folder_tree_raw_names[folder_nodes[cumulative_path]] = part
-                        parent_id = folder_nodes[cumulative_path]
-
-                        if count_key:
-                            bucket = folder_stats.setdefault(cumulative_path, {
-                                'differ': 0, 'left_only': 0, 'right_only': 0, 'newer': 0
-                            })
-                            bucket[count_key] += 1
-
-                    # 파일을 폴더 노드 아래에 추가
-                    file_name = path_parts[-1]
-                    file_item = self.folder_tree.insert(
-                        parent_id, 'end', text=f"{status_icon}{file_name}",
-                        values=(self._folder_status_label(status), left_size, left_mtime, right_size, right_mtime),
-                        tags=(status_tag,) if status_tag else ()
-                    )
-                    self._folder_tree_raw_names[file_item] = file_name
-                else:
-                    # 루트에 있는 파일
-                    file_item = self.folder_tree.insert(
-                        '', 'end', text=f"{status_icon}{rel_path}",
-                        values=(self._folder_status_label(status), left_size, left_mtime, right_size, right_mtime),
-                        tags=(status_tag,) if status_tag else ()
-                    )
-                    self._folder_tree_raw_names[file_item] = rel_path
+                index = model.child_position(parent, record)
+                if index == len(model.children[parent]) - 1:
+                    index = 'end'
+        stream['rows_inserted'] += 1
+        item = self.folder_tree.insert(stream['items'].get(parent, ''), index, **kwargs)
+        stream['items'][record] = item
+        stream['item_records'][item] = record
+        return item
+
+    def _show_folder_node(self, stream, folder, index=None):
+        """부모가 채워진 폴더 레코드의 노드를 Tk에 만듦.
+
+        행 예산(FOLDER_TREE_EAGER_ROWS) 안이면 바로 채워 펼치고, 아니면 접힌 채
+        자리표시 자식만 둔다.
+        """
+        item = self._insert_folder_child(
+            stream, folder, index,
+            text=self._folder_record_text(stream, folder), values=('', '', '', '', ''), tags=('folder',)
+        )
+        if stream['rows_inserted'] < FOLDER_TREE_EAGER_ROWS:
+            self._load_folder_children(stream, folder)
+            self.folder_tree.item(item, open=True)
+        else:
+            stream['placeholders'][folder] = self.folder_tree.insert(
+                item, 'end', text='…', values=('', '', '', '', ''), tags=('placeholder',))
+        return item
 
-        # 폴더 노드에 자손 diff 카운트 배지 적용
-        self._annotate_folder_diff_counts(folder_nodes, folder_stats)
+    def _show_file_row(self, stream, record, index=None):
+        """부모가 채워진 파일 레코드의 행을 Tk에 만듦"""
+        text, values, tags = self._folder_record_row(stream['model'], record)
+        return self._insert_folder_child(stream, record, index, text=text, values=values, tags=tags)
 
-        # 완료 메시지
-        message = self.t('folder_compare_done', count=diff_count)
-        if len(excluded_files) > 0:
-            message += f"\n{self.t('excluded_files_count', count=len(excluded_files))}"
-        messagebox.showinfo(self.t('title_done'), message)
+    def _load_folder_children(self, stream, folder):
+        """모델에 있는 폴더의 자식들을 Tk 행으로 채움 (자리표시 행은 제거).
+
+        사용자가 열 정렬을 했다면 모델에서 정렬한 순서대로 바로 넣는다.
+        """
+        placeholder = stream['placeholders'].pop(folder, None)
+        if placeholder is not None:
+            self.folder_tree.delete(placeholder)
+        stream['loaded'].add(folder)
+        model = stream['model']
+        order = self._folder_view_order(stream, folder)
+        if self._folder_sort_state.get('col'):
+            stream['view_orders'][folder] = order
+        for record in order:
+            if model.is_folder(record):
+                self._show_folder_node(stream, record, index='end')
+            else:
+                self._show_file_row(stream, record, index='end')
+
+    def on_folder_tree_open(self, event=None):
+        """<<TreeviewOpen>>: 아직 채우지 않은 폴더를 펼치면 결과 모델에서 자식 행을 만듦.
+
+        이미 채운 폴더면 접혀 있는 동안 바뀐 정렬 순서만 반영한다.
+        """
+        stream = self._folder_stream
+        record = stream['item_records'].get(self.folder_tree.focus())
+        if record is None or not stream['model'].is_folder(record):
+            return
+        if record not in stream['loaded']:
+            self._load_folder_children(stream, record)
+        elif stream['stale_orders']:
+            self._emit_folder_orders(stream, record)
+
+    def _folder_record_row(self, model, record):
+        """결과 모델의 파일 레코드를 트리 행의 (#0 텍스트, values, tags)로 변환"""
+        status = model.status_text(record)
+        status_tag, status_icon = self._get_folder_status_visual(status)
+        left_size = model.left_size[record]
+        right_size = model.right_size[record]
+        left_mtime = format_mtime_ns(model.left_mtime[record]) if left_size >= 0 else ""
+        right_mtime = format_mtime_ns(model.right_mtime[record]) if right_size >= 0 else ""
+
+        status_label = self._folder_status_label(status)
+        diff_offset = model.diff_offset[record]
+        if diff_offset >= 0:
+            status_label += self.t('first_diff_offset', offset=f"{diff_offset:,}")
+        return (f"{status_icon}{model.names[record]}",
+                (status_label,
+                 left_size if left_size >= 0 else "", left_mtime,
+                 right_size if right_size >= 0 else "", right_mtime),
+                (status_tag,) if status_tag else ())
+
+    def _mark_folder_result(self, stream, record, dirty_folders):
+        """결과가 바뀐 레코드의 상위 폴더를 배지 갱신 대상으로 표시"""
+        dirty_folders.update(stream['model'].ancestors(record))
+
+    def _insert_folder_result(self, result, stream, dirty_folders):
+        """FolderCompareResult 한 행을 결과 모델에 추가하고 보이는 단계면 트리에도 표시
+
+        Returns:
+            파일 행의 트리 아이템 ID (부모 폴더를 아직 채우지 않았으면 None)
+        """
+        model = stream['model']
+        record, new_folder = model.add(result)
+        self._mark_folder_result(stream, record, dirty_folders)
+
+        # 필터 중에는 모델에만 넣고 보기는 나중에 필터를 다시 계산할 때 만듦
+        if stream['filter'] is not None:
+            return None
+        # Tk에는 부모가 채워진 경우에만 (새 폴더면 그 폴더 노드부터) 추가
+        if new_folder is not None:
+            if model.parent[new_folder] in stream['loaded']:
+                self._show_folder_node(stream, new_folder)
+        elif model.parent[record] in stream['loaded']:
+            self._show_file_row(stream, record)
+        return stream['items'].get(record)
+
+    def _remove_folder_record(self, stream, record):
+        """파일 레코드를 모델/트리에서 삭제하고 비게 된 상위 폴더도 정리"""
+        removed_folders = stream['model'].remove(record)
+        for removed in [record] + removed_folders:
+            stream['loaded'].discard(removed)
+            stream['placeholders'].pop(removed, None)
+            stream['view_orders'].pop(removed, None)
+            stream['stale_orders'].discard(removed)
+            item = stream['items'].pop(removed, None)
+            if item is not None:
+                del stream['item_records'][item]
+                self.folder_tree.delete(item)
+
+    def _apply_folder_results(self, results):
+        """{rel_path: FolderCompareResult 또는 None}을 현재 모델과 트리에 반영.
+
+        바뀐 행만 갱신/추가/삭제하고 관련 상위 폴더 배지만 다시 계산한다.
+        히스토리나 나머지 행, 사용자가 정한 정렬 순서는 그대로 둔다.
+        """
+        stream = self._folder_stream
+        model = stream['model']
+        dirty_folders = set()
+        touched_parents = set()
+
+        for rel_path, result in results.items():
+            record = model.record_for_path(rel_path)
+            if record is not None:
+                dirty_folders.update(model.ancestors(record))
+
+            if result is None:
+                if record is not None:
+                    self._remove_folder_record(stream, record)
+                continue
+
+            if record is not None:
+                # 같은 행을 제자리에서 갱신 (Tk에 행이 있을 때만)
+                model.update(record, result)
+                self._mark_folder_result(stream, record, dirty_folders)
+                item = stream['items'].get(record)
+                if item is not None:
+                    text, values, tags = self._folder_record_row(model, record)
+                    self.folder_tree.item(item, text=text, values=values, tags=tags)
+                touched_parents.add(model.parent[record])
+            else:
+                self._insert_folder_result(result, stream, dirty_folders)
+                # 새로 만든 상위 폴더 노드도 끝에 붙었을 수 있으므로 상위 단계 전체
+                touched_parents.update(model.ancestors(model.record_for_path(rel_path)))
+                touched_parents.add(ROOT_RECORD)
+
+        # 필터 중이면 바뀐 판정으로 조건/배지를 다시 계산해 보기를 새로 그림
+        if stream['filter'] is not None:
+            stream['filter'] = self._build_folder_filter(stream)
+            self._rebuild_folder_view(stream)
+            return
+
+        self._annotate_folder_diff_counts(stream, dirty_folders)
+
+        # 사용자가 열 정렬을 했다면 바뀐 행이 있는 폴더만 다시 정렬
+        if self._folder_sort_state.get('col'):
+            for parent in touched_parents:
+                if parent in stream['loaded']:
+                    stream['stale_orders'].add(parent)
+                    self._emit_folder_orders(stream, parent)
+
+    def refresh_folder_paths(self, rel_paths, same_content=()):
+        """복사/삭제한 경로만 다시 판정해 트리를 부분 갱신 (same_content: 내용이 같다고 아는 경로).
+
+        판정은 FolderRefreshJob이 백그라운드에서 하고, 끝나면 root.after 폴링에서 트리에 반영한다.
+        """
+        context = self._folder_stream.get('context')
+        if context is None or self._folder_task_running() or not rel_paths:
+            return
+        job = FolderRefreshJob(
+            context['left_folder'], context['right_folder'], rel_paths, context['method'],
+            hash_algorithm=context['hash_algorithm'], hash_workers=context['hash_workers'],
+            hash_chunk_size=context['hash_chunk_size'], cache_factory=self.data_manager.open_hash_cache,
+            same_content=same_content)
+        self._refresh_job = job
+        self._show_folder_progress(True)
+        self.folder_progress_label.config(text=self.t('progress_refreshing', count=len(job.rel_paths)))
+        job.start()
+        self._refresh_job_after = self.root.after(FOLDER_JOB_POLL_MS, self._poll_folder_refresh_job)
+
+    def _poll_folder_refresh_job(self):
+        """root.after로 호출되어 부분 갱신이 끝나면 결과를 트리에 반영"""
+        self._refresh_job_after = None
+        job = self._refresh_job
+        if job is None:
+            return
+        if not job.is_done():
+            if job.cancel_requested():
+                self.folder_progress_label.config(text=self.t('progress_cancelling'))
+            self._refresh_job_after = self.root.after(FOLDER_JOB_POLL_MS, self._poll_folder_refresh_job)
+            return
+
+        self._refresh_job = None
+        self._show_folder_progress(False)
+        if job.error is not None:
+            messagebox.showerror(self.t('title_error'), str(job.error))
+        elif job.results is not None:
+            self._apply_folder_results(job.results)
+
+    def toggle_folder_watch(self):
+        """실시간 감시 체크박스 처리"""
+        if not self.folder_watch_var.get():
+            self._stop_folder_watch()
+            return
+        if self._folder_job is not None:
+            return  # 진행 중인 비교가 끝나면 시작
+        if self._folder_stream.get('context') is None:
+            messagebox.showwarning(self.t('title_warning'), self.t('watch_requires_compare'))
+            self.folder_watch_var.set(False)
+            return
+        if self._manifest_side_in_use():
+            messagebox.showwarning(self.t('title_warning'), self.t('manifest_read_only'))
+            self.folder_watch_var.set(False)
+            return
+        self._start_folder_watch()
+
+    def _start_folder_watch(self):
+        """마지막 비교의 양쪽 루트 감시 시작"""
+        self._stop_folder_watch()
+        context = self._folder_stream['context']
+        watcher = FolderWatcher((context['left_folder'], context['right_folder']),
+                                context['exclude_matcher'])
+        watcher.start()
+        self._folder_watch = {'watcher': watcher, 'context': context, 'pending': None, 'after': None}
+        self._folder_watch['after'] = self.root.after(FOLDER_WATCH_TICK_MS, self._folder_watch_tick)
+
+    def _stop_folder_watch(self):
+        watch = self._folder_watch
+        if watch is None:
+            return
+        self._folder_watch = None
+        watch['watcher'].stop()
+        if watch['after'] is not None:
+            try:
+                self.root.after_cancel(watch['after'])
+            except tk.TclError:
+                pass
+
+    def _folder_watch_tick(self):
+        """root.after 주기로 호출: 디바운스된 변경을 백그라운드에서 판정하고 결과를 반영"""
+        watch = self._folder_watch
+        if watch is None:
+            return
+        watch['after'] = None
+        pending = watch['pending']
+        if pending is not None:
+            if pending['done'].is_set():
+                watch['pending'] = None
+                if pending['results'] is not None and self._folder_stream.get('context') is watch['context']:
+                    self._apply_folder_results(pending['results'])
+        # 일괄 복사 중에는 임시 파일이 보이지 않도록 변경을 모아 두었다가 끝난 뒤 반영
+        elif self._copy_job is None and watch['watcher'].changes_ready(FOLDER_WATCH_DEBOUNCE_S,
+                                                                        FOLDER_WATCH_MAX_DELAY_S):
+            paths, dirs = watch['watcher'].take_changes()
+            watch['pending'] = self._evaluate_watch_changes(watch['context'], paths, dirs)
+        watch['after'] = self.root.after(FOLDER_WATCH_TICK_MS, self._folder_watch_tick)
+
+    def _evaluate_watch_changes(self, context, paths, dirs):
+        """감시로 모인 경로를 작업 스레드에서 다시 판정. 진행 상태 dict를 반환"""
+        paths = set(paths)
+        # 폴더가 통째로 바뀌었으면 지금 표시 중인 그 아래 행도 다시 확인
+        for rel_dir in dirs:
+            prefix = rel_dir + os.sep if rel_dir else ''
+            paths.update(rel_path for rel_path in self._folder_stream['model'].file_paths()
+                         if rel_path.startswith(prefix))
+        pending = {'done': threading.Event(), 'results': None}
+
+        def worker():
+            cache = None
+            try:
+                candidates = paths | expand_changed_dirs(
+                    (context['left_folder'], context['right_folder']), dirs, context['exclude_matcher'])
+                if context['method'] in ("md5", "both"):
+                    cache = self.data_manager.open_hash_cache()
+                pending['results'] = evaluate_folder_paths(
+                    context['left_folder'], context['right_folder'], candidates, context['method'],
+                    hash_algorithm=context['hash_algorithm'], hash_workers=context['hash_workers'],
+                    hash_chunk_size=context['hash_chunk_size'], cache=cache)
+            except Exception as e:
+                print(f"실시간 감시 판정 실패: {e}")
+            finally:
+                if cache is not None:
+                    cache.close()
+                pending['done'].set()
+
+        threading.Thread(target=worker, name='conferatur-watch-eval', daemon=True).start()
+        return pending
 
     def copy_file(self, direction):
-        """파일 복사 (폴더 선택 시 하위 모든 파일 복사)"""
+        """파일 복사 (폴더 선택 시 하위 모든 파일 복사).
+
+        복사는 FolderCopyJob이 백그라운드에서 병렬로 하고, 진행률 영역에서 취소할 수 있다.
+        양쪽 폴더는 트리를 만든 비교 context에서 가져온다 (입력란이 그 뒤 바뀌었어도 같은 폴더).
+        """
+        if self._folder_task_running():
+            return
         selected = self.folder_tree.selection()
-        if not selected:
+        context = self._folder_stream.get('context')
+        if not selected or context is None:
             messagebox.showwarning(self.t('title_warning'), self.t('select_file_or_folder_to_copy'))
             return
-
-        left_folder = self.left_folder_var.get()
-        right_folder = self.right_folder_var.get()
-
-        copied_count = 0
-        error_count = 0
-        error_messages = []
+        if self._manifest_side_in_use():
+            messagebox.showwarning(self.t('title_warning'), self.t('manifest_read_only'))
+            return
 
         # 선택된 모든 항목에서 파일 수집 (폴더인 경우 하위 파일 모두 수집)
-        all_file_items = []
-        for item in selected:
-            files = self.get_all_files_from_tree_item(item)
-            all_file_items.extend(files)
+        all_file_paths = self.get_file_paths_from_tree_items(selected)
 
-        # 중복 제거
-        all_file_items = list(set(all_file_items))
-
-        if not all_file_items:
+        if not all_file_paths:
             messagebox.showwarning(self.t('title_warning'), self.t('no_files_to_copy'))
             return
 
         # 확인 메시지
-        if len(all_file_items) > 1:
+        if len(all_file_paths) > 1:
             direction_key = 'direction_left_to_right' if direction == 'left_to_right' else 'direction_right_to_left'
             direction_text = self.t(direction_key)
             if not messagebox.askyesno(
                 self.t('title_confirm'),
-                self.t('copy_confirm', count=len(all_file_items), direction=direction_text)
+                self.t('copy_confirm', count=len(all_file_paths), direction=direction_text)
             ):
                 return
 
-        # 파일 복사
-        for item in all_file_items:
-            rel_path = self.get_tree_item_path(item)
-            left_path = os.path.join(left_folder, rel_path)
-            right_path = os.path.join(right_folder, rel_path)
+        # 파일 복사 (백그라운드 작업, 끝나면 복사한 경로만 다시 비교)
+        source_folder, target_folder = context['left_folder'], context['right_folder']
+        if direction == 'right_to_left':
+            source_folder, target_folder = target_folder, source_folder
+        job = FolderCopyJob(
+            source_folder, target_folder, all_file_paths,
+            workers=DEFAULT_COPY_WORKERS,
+            cache_factory=self.data_manager.open_hash_cache,
+            hash_algorithm=context['hash_algorithm'],
+        )
+        self._copy_job = job
+        self._show_folder_progress(True)
+        self.folder_progress_label.config(text=self.t('progress_copy_preparing'))
+        job.start()
+        self._copy_job_after = self.root.after(FOLDER_JOB_POLL_MS, self._poll_folder_copy_job)
+
+    def _update_folder_copy_progress(self, progress):
+        """복사 작업 스냅샷으로 진행률 라벨/바 갱신"""
+        if progress['phase'] != 'copy':
+            return
+        if str(self.folder_progress_bar.cget('mode')) != 'determinate':
+            self.folder_progress_bar.stop()
+            self.folder_progress_bar.config(mode='determinate', maximum=100)
+        total_bytes = progress['bytes_total']
+        self.folder_progress_bar.config(
+            value=(progress['bytes_done'] * 100.0 / total_bytes) if total_bytes else 100)
+        eta = progress['eta']
+        text = self.t('progress_syncing' if isinstance(self._copy_job, FolderSyncJob) else 'progress_copying',
+                      done=progress['files_done'], total=progress['files_total'],
+                      size=format_byte_size(progress['bytes_done']),
+                      total_size=format_byte_size(total_bytes),
+                      rate=format_byte_size(progress['throughput']),
+                      eta=format_duration(eta) if eta is not None else '--:--')
+        if self._copy_job.cancel_requested():
+            text = self.t('progress_cancelling')
+        self.folder_progress_label.config(text=text)
+
+    def _poll_folder_copy_job(self):
+        """root.after로 호출되어 일괄 복사 진행률을 표시하고, 끝나면 결과를 반영"""
+        self._copy_job_after = None
+        job = self._copy_job
+        if job is None:
+            return
+        if not job.is_done():
+            self._update_folder_copy_progress(job.snapshot())
+            self._copy_job_after = self.root.after(FOLDER_JOB_POLL_MS, self._poll_folder_copy_job)
+            return
 
-            try:
-                if direction == 'left_to_right':
-                    if os.path.exists(left_path):
-                        os.makedirs(os.path.dirname(right_path), exist_ok=True)
-                        shutil.copy2(left_path, right_path)
-                        copied_count += 1
-                elif direction == 'right_to_left':
-                    if os.path.exists(right_path):
-                        os.makedirs(os.path.dirname(left_path), exist_ok=True)
-                        shutil.copy2(right_path, left_path)
-                        copied_count += 1
-            except Exception as e:
-                error_count += 1
-                error_messages.append(f"{rel_path}: {str(e)}")
+        self._copy_job = None
+        self._show_folder_progress(False)
+        if isinstance(job, FolderSyncJob):
+            self._finish_folder_sync(job)
+            return
+        # 복사했거나 내용이 같아 건너뛴 경로는 다시 읽지 않고 '내용 같음'으로 판정,
+        # 실패한 경로(비교 뒤 원본이 사라진 경우 등)는 현재 상태로 다시 판정
+        changed_paths = job.copied + job.skipped
+        refresh_paths = changed_paths + [rel_path for rel_path, _ in job.failed]
+        if refresh_paths:
+            self.refresh_folder_paths(refresh_paths, same_content=set(changed_paths))
+
+        if job.error is not None:
+            messagebox.showerror(self.t('title_error'), str(job.error))
+            return
+        if job.cancelled:
+            messagebox.showinfo(self.t('title_notice'), self.t('copy_cancelled', count=len(job.copied)))
+            return
 
         # 결과 메시지
-        result_msg = self.t('copied_files_result', count=copied_count)
+        error_count = len(job.failed)
+        result_msg = self.t('copied_files_result', count=len(job.copied))
+        if job.skipped:
+            result_msg += f"\n{self.t('copy_skipped_identical', count=len(job.skipped))}"
         if error_count > 0:
             result_msg += f"\n{self.t('copy_failed_count', count=error_count)}"
-            if len(error_messages) <= 5:
-                result_msg += f"\n\n{self.t('failed_files')}\n" + "\n".join(error_messages)
-            else:
-                result_msg += (
-                    f"\n\n{self.t('failed_files')}\n"
-                    + "\n".join(error_messages[:5])
-                    + f"\n{self.t('failed_files_more', count=len(error_messages) - 5)}"
-                )
+            result_msg += self._format_failed_files(job.failed)
 
-        if copied_count > 0:
+        if changed_paths:
             messagebox.showinfo(self.t('title_done'), result_msg)
-            # 비교 다시 실행
-            self.compare_folders()
         elif error_count > 0:
             messagebox.showerror(self.t('title_error'), result_msg)
 
+    def _format_failed_files(self, failed):
+        """[(경로, 오류)] 목록을 결과 메시지 끝에 붙일 '실패한 파일' 문단으로 (최대 5개)"""
+        error_messages = [f"{rel_path}: {message}" for rel_path, message in failed]
+        text = f"\n\n{self.t('failed_files')}\n" + "\n".join(error_messages[:5])
+        if len(error_messages) > 5:
+            text += f"\n{self.t('failed_files_more', count=len(error_messages) - 5)}"
+        return text
+
+    def open_folder_sync_dialog(self):
+        """동기화 다이얼로그: 방향/삭제 여부에 따른 작업 계획을 미리 보여 주고 실행"""
+        if self._folder_task_running():
+            return
+        context = self._folder_stream.get('context')
+        if context is None:
+            messagebox.showwarning(self.t('title_warning'), self.t('sync_requires_compare'))
+            return
+        if self._manifest_side_in_use():
+            messagebox.showwarning(self.t('title_warning'), self.t('manifest_read_only'))
+            return
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title(self.t('sync_title'))
+        dialog.geometry("760x560")
+
+        direction_var = tk.StringVar(value='left_to_right')
+        delete_extra_var = tk.BooleanVar(value=False)
+        # 필터 중이면 보기에 남은 파일만 (일괄 복사와 같음)
+        view_filter = self._folder_stream['filter']
+        records = view_filter['files'] if view_filter is not None else None
+        plan = {'operations': []}
+
+        option_frame = ttk.Frame(dialog)
+        option_frame.pack(fill='x', padx=10, pady=10)
+        ttk.Label(option_frame, text=self.t('sync_direction')).pack(anchor='w')
+        for direction in ('left_to_right', 'right_to_left'):
+            ttk.Radiobutton(option_frame, text=self.t('sync_' + direction), value=direction,
+                            variable=direction_var, command=lambda: update_plan()).pack(anchor='w', padx=(12, 0))
+        ttk.Checkbutton(option_frame, text=self.t('sync_delete_extra'), variable=delete_extra_var,
+                        command=lambda: update_plan()).pack(anchor='w', pady=(6, 0))
+        if view_filter is not None:
+            ttk.Label(option_frame, text=self.t('sync_filtered_note'),
+                      font=(self.font_family, DEFAULT_TEXT_FONT_SIZE - 2)).pack(anchor='w', pady=(6, 0))
+
+        ttk.Label(dialog, text=self.t('sync_dry_run')).pack(anchor='w', padx=10)
+        summary_label = ttk.Label(dialog, text='', justify='left')
+        summary_label.pack(anchor='w', padx=10, pady=(2, 6))
+
+        text_frame = ttk.Frame(dialog)
+        text_frame.pack(fill='both', expand=True, padx=10, pady=5)
+        scrollbar = ttk.Scrollbar(text_frame, orient='vertical')
+        scrollbar.pack(side='right', fill='y')
+        plan_text = tk.Text(text_frame, wrap='none', yscrollcommand=scrollbar.set,
+                            font=(self.font_family, self.font_size))
+        plan_text.pack(fill='both', expand=True)
+        configure_notion_text_widget(plan_text, (self.font_family, self.font_size))
+        scrollbar.config(command=plan_text.yview)
+
+        def update_plan():
+            """선택한 방향/옵션으로 계획을 다시 세워 요약과 목록(앞 SYNC_PREVIEW_LIMIT개)을 표시"""
+            direction = direction_var.get()
+            target_folder = context['right_folder'] if direction == 'left_to_right' else context['left_folder']
+            operations = build_sync_plan(self._folder_stream['model'], target_folder, direction,
+                                         delete_extra=delete_extra_var.get(), records=records)
+            plan['operations'] = operations
+            summary = summarize_sync_plan(operations)
+            summary_label.config(text=self.t('sync_summary', mkdir=summary['mkdir'], copy=summary['copy'],
+                                             overwrite=summary['overwrite'], delete=summary['delete'],
+                                             size=format_byte_size(summary['bytes'])))
+            lines = []
+            for operation in operations[:SYNC_PREVIEW_LIMIT]:
+                line = f"{self.t('sync_action_' + operation.action)}\t{operation.rel_path}"
+                if operation.action != 'mkdir':
+                    line += f"  ({format_byte_size(operation.size)})"
+                lines.append(line)
+            if len(operations) > SYNC_PREVIEW_LIMIT:
+                lines.append(self.t('sync_more', count=len(operations) - SYNC_PREVIEW_LIMIT))
+            plan_text.config(state='normal')
+            plan_text.delete('1.0', 'end')
+            plan_text.insert('1.0', '\n'.join(lines) if lines else self.t('sync_nothing'))
+            plan_text.config(state='disabled')
+
+        def run_sync():
+            operations = plan['operations']
+            if not operations:
+                messagebox.showinfo(self.t('title_notice'), self.t('sync_nothing'), parent=dialog)
+                return
+            delete_count = summarize_sync_plan(operations)['delete']
+            if delete_count and not messagebox.askyesno(
+                    self.t('title_confirm'), self.t('sync_delete_confirm', count=delete_count), parent=dialog):
+                return
+            direction = direction_var.get()
+            dialog.destroy()
+            self.start_folder_sync(context, direction, operations)
+
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(fill='x', padx=10, pady=10)
+        build_button_row(
+            button_frame,
+            [
+                {'label': self.t('cancel'), 'command': dialog.destroy, 'role': 'ghost'},
+                {'label': self.t('sync_run'), 'icon': '🔄', 'command': run_sync, 'role': 'primary'},
+            ],
+            align='right',
+            pady=(0, 0),
+        )
+
+        update_plan()
+        dialog.transient(self.root)
+        dialog.grab_set()
+
+    def start_folder_sync(self, context, direction, operations):
+        """build_sync_plan의 작업 계획을 FolderSyncJob으로 실행 (진행률/취소는 일괄 복사와 같은 영역).
+
+        양쪽 폴더는 계획을 세운 비교 context에서 가져온다 (입력란이 그 뒤 바뀌었어도 같은 폴더).
+        """
+        if self._folder_task_running():
+            return
+        source_folder, target_folder = context['left_folder'], context['right_folder']
+        if direction == 'right_to_left':
+            source_folder, target_folder = target_folder, source_folder
+        job = FolderSyncJob(source_folder, target_folder, operations, workers=DEFAULT_COPY_WORKERS,
+                            cache_factory=self.data_manager.open_hash_cache,
+                            hash_algorithm=context['hash_algorithm'])
+        self._copy_job = job
+        self._show_folder_progress(True)
+        self.folder_progress_label.config(text=self.t('progress_copy_preparing'))
+        job.start()
+        self._copy_job_after = self.root.after(FOLDER_JOB_POLL_MS, self._poll_folder_copy_job)
+
+    def _finish_folder_sync(self, job):
+        """동기화가 끝나면 바뀐 경로를 한 번에 다시 판정하고 결과를 알림"""
+        # 복사했거나 내용이 같아 건너뛴 파일은 내용이 같다고 보고, 지운 파일은 남은 쪽만 다시 확인
+        same_paths = job.copied + job.skipped
+        changed_paths = same_paths + job.deleted
+        if changed_paths:
+            self.refresh_folder_paths(changed_paths, same_content=set(same_paths))
+
+        if job.error is not None:
+            messagebox.showerror(self.t('title_error'), str(job.error))
+            return
+        if job.cancelled:
+            messagebox.showinfo(self.t('title_notice'),
+                                self.t('sync_cancelled', copied=len(job.copied), deleted=len(job.deleted)))
+            return
+
+        result_msg = self.t('sync_result', copied=len(job.copied), deleted=len(job.deleted), dirs=job.dirs_created)
+        if job.skipped:
+            result_msg += f"\n{self.t('copy_skipped_identical', count=len(job.skipped))}"
+        if job.failed:
+            result_msg += f"\n{self.t('sync_failed_count', count=len(job.failed))}"
+            result_msg += self._format_failed_files(job.failed)
+            messagebox.showerror(self.t('title_error'), result_msg)
+        else:
+            messagebox.showinfo(self.t('title_done'), result_msg)
+
     def delete_selected(self):
-        """선택한 항목 삭제"""
+        """선택한 항목 삭제 (양쪽 폴더는 트리를 만든 비교 context에서 가져옴)"""
+        if self._folder_task_running():
+            return
         selected = self.folder_tree.selection()
-        if not selected:
+        context = self._folder_stream.get('context')
+        if not selected or context is None:
             messagebox.showwarning(self.t('title_warning'), self.t('select_files_to_delete'))
             return
+        if self._manifest_side_in_use():
+            messagebox.showwarning(self.t('title_warning'), self.t('manifest_read_only'))
+            return
 
         # 파일만 카운트
-        file_count = 0
-        for item in selected:
-            item_values = self.folder_tree.item(item, 'values')
-            if item_values and item_values[0]:  # 상태가 있으면 파일
-                file_count += 1
+        file_records = [record for record in map(self._selected_file_record, selected) if record is not None]
+        file_count = len(file_records)
 
         if file_count == 0:
             messagebox.showwarning(self.t('title_warning'), self.t('select_files_to_delete_no_folder'))
@@ -2570,26 +3720,24 @@ class CompareToolApp:
         if not messagebox.askyesno(self.t('title_confirm'), self.t('delete_files_confirm', count=file_count)):
             return
 
-        left_folder = self.left_folder_var.get()
-        right_folder = self.right_folder_var.get()
+        left_folder, right_folder = context['left_folder'], context['right_folder']
 
         deleted_count = 0
+        deleted_paths = []
 
-        for item in selected:
-            # 폴더 노드는 스킵
-            item_values = self.folder_tree.item(item, 'values')
-            if not item_values or not item_values[0]:  # 상태가 없으면 폴더
-                continue
-
-            rel_path = self.get_tree_item_path(item)
+        model = self._folder_stream['model']
+        for record in file_records:
+            rel_path = model.paths[record]
             left_path = os.path.join(left_folder, rel_path)
             right_path = os.path.join(right_folder, rel_path)
 
             try:
                 if os.path.exists(left_path):
+                    deleted_paths.append(rel_path)
                     os.remove(left_path)
                     deleted_count += 1
                 if os.path.exists(right_path):
+                    deleted_paths.append(rel_path)
                     os.remove(right_path)
                     deleted_count += 1
             except Exception as e:
@@ -2598,9 +3746,11 @@ class CompareToolApp:
                     self.t('delete_failed', path=rel_path, error=str(e))
                 )
 
+        if deleted_paths:
+            # 삭제한 경로만 다시 비교 (한쪽만 지워졌어도 상태가 바뀜)
+            self.refresh_folder_paths(set(deleted_paths))
         if deleted_count > 0:
             messagebox.showinfo(self.t('title_done'), self.t('deleted_files_result', count=deleted_count))
-            self.compare_folders()
 
     def show_folder_tree_context_menu(self, event):
         """폴더 트리 우클릭 시 컨텍스트 메뉴 표시"""
@@ -2630,22 +3780,22 @@ class CompareToolApp:
         item = selected[0]
 
         # 폴더 노드인 경우 미리보기 표시 안 함
-        item_values = self.folder_tree.item(item, 'values')
-        if not item_values or not item_values[0]:  # 상태가 없으면 폴더
+        record = self._selected_file_record(item)
+        if record is None:
             return
 
-        rel_path = self.get_tree_item_path(item)
-
-        left_folder = self.left_folder_var.get()
-        right_folder = self.right_folder_var.get()
-
-        if not left_folder or not right_folder:
+        # 입력란이 아니라 트리를 만든 비교의 양쪽 폴더에서 읽음
+        context = self._folder_stream.get('context')
+        if context is None:
             return
+        rel_path = self._folder_stream['model'].paths[record]
+        left_folder, right_folder = context['left_folder'], context['right_folder']
 
         left_path = os.path.join(left_folder, rel_path)
         right_path = os.path.join(right_folder, rel_path)
 
         # 미리보기 영역 초기화
+        self._folder_preview = None
         self.folder_preview_left.config(state='normal')
         self.folder_preview_right.config(state='normal')
         self.folder_preview_left.delete('1.0', 'end')
@@ -2653,39 +3803,128 @@ class CompareToolApp:
         self._clear_diff_highlights(self.folder_preview_left)
         self._clear_diff_highlights(self.folder_preview_right)
 
-        left_content = ""
-        right_content = ""
+        # 한도보다 큰 파일은 첫 쪽만 읽고, 스크롤하면 _load_folder_preview_page가 더 읽음
+        threshold = self.data_manager.get_preview_threshold_kb() * 1024
+        left_lines, left_pager = self._open_folder_preview_side(self.folder_preview_left, left_path, threshold)
+        right_lines, right_pager = self._open_folder_preview_side(self.folder_preview_right, right_path, threshold)
+        preview = {
+            'pagers': [left_pager, right_pager],
+            'lines': [left_lines or [], right_lines or []],
+            # 두 파일이 모두 있으면 차이점 하이라이트 (읽은 범위만)
+            'diff': bool(left_lines and right_lines),
+            'anchor': [0, 0],  # 다음 비교를 시작할 줄 (그 앞의 하이라이트는 확정)
+            'after': None,
+        }
+        if left_pager is not None or right_pager is not None:
+            self._folder_preview = preview
+        self._diff_folder_preview(preview)
 
-        # 왼쪽 파일 읽기
-        if os.path.exists(left_path) and os.path.isfile(left_path):
-            try:
-                with open(left_path, 'r', encoding='utf-8') as f:
-                    left_content = f.read()
-                self.folder_preview_left.insert('1.0', left_content)
-            except Exception as e:
-                self.folder_preview_left.insert('1.0', f"{self.t('file_unreadable_marker')}\n{str(e)}")
-        else:
-            self.folder_preview_left.insert('1.0', self.t('file_missing_marker'))
+        self.folder_preview_left.config(state='disabled')
+        self.folder_preview_right.config(state='disabled')
+
+    def _open_folder_preview_side(self, widget, path, threshold):
+        """미리보기 한쪽을 채움. (읽은 줄 목록, 더 읽을 TextFilePager 또는 None)을 반환.
+
+        파일이 없거나 읽을 수 없으면 표시만 하고 (None, None).
+        """
+        if not (os.path.exists(path) and os.path.isfile(path)):
+            widget.insert('1.0', self.t('file_missing_marker'))
+            return None, None
+        try:
+            if os.path.getsize(path) <= threshold:
+                with open(path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                widget.insert('1.0', content)
+                return content.splitlines(), None
+            pager = TextFilePager(path)
+            lines = pager.read_page()
+        except Exception as e:
+            widget.insert('1.0', f"{self.t('file_unreadable_marker')}\n{str(e)}")
+            return None, None
+        widget.insert('1.0', '\n'.join(lines))
+        self._mark_folder_preview_truncated(widget, pager)
+        return lines, (pager if not pager.at_end else None)
+
+    def _mark_folder_preview_truncated(self, widget, pager):
+        """다 읽지 못한 미리보기 끝에 '잘림' 표시 줄을 붙임 (다음 쪽을 붙이기 전에 지움)"""
+        if pager.at_end:
+            return
+        widget.insert('end', '\n' + self.t('preview_truncated', lines=f"{pager.lines_read:,}",
+                                            size=format_byte_size(pager.offset),
+                                            total=format_byte_size(pager.size)),
+                      'preview_truncated')
+
+    def _on_folder_preview_yscroll(self, widget, first, last):
+        """미리보기 스크롤바 갱신. 더 읽을 쪽이 있는데 끝 근처까지 오면 다음 쪽을 예약"""
+        widget.vbar.set(first, last)
+        preview = self._folder_preview
+        if preview is None or preview['after'] is not None or float(last) < FOLDER_PREVIEW_PAGE_TRIGGER:
+            return
+        if any(pager is not None for pager in preview['pagers']):
+            preview['after'] = self.root.after_idle(self._load_folder_preview_page)
 
-        # 오른쪽 파일 읽기
-        if os.path.exists(right_path) and os.path.isfile(right_path):
+    def _load_folder_preview_page(self):
+        """더 읽을 쪽이 있는 미리보기마다 한 쪽씩 이어 붙이고, 새로 읽은 범위만 다시 비교"""
+        preview = self._folder_preview
+        if preview is None:
+            return
+        preview['after'] = None
+        for index, widget in enumerate((self.folder_preview_left, self.folder_preview_right)):
+            pager = preview['pagers'][index]
+            if pager is None:
+                continue
+            widget.config(state='normal')
+            marker = widget.tag_ranges('preview_truncated')
+            if marker:
+                widget.delete(marker[0], 'end')  # 앞의 줄바꿈까지 태그가 붙어 있음
+            lines = preview['lines'][index]
             try:
-                with open(right_path, 'r', encoding='utf-8') as f:
-                    right_content = f.read()
-                self.folder_preview_right.insert('1.0', right_content)
+                new_lines = pager.read_page()
             except Exception as e:
-                self.folder_preview_right.insert('1.0', f"{self.t('file_unreadable_marker')}\n{str(e)}")
+                # 도중에 읽지 못하게 되면 그 쪽은 거기서 멈추고 비교도 멈춤
+                widget.insert('end', f"\n{self.t('file_unreadable_marker')}\n{str(e)}")
+                preview['pagers'][index] = None
+                preview['diff'] = False
+                widget.config(state='disabled')
+                continue
+            if new_lines:
+                widget.insert('end', ('\n' if lines else '') + '\n'.join(new_lines))
+                lines.extend(new_lines)
+            self._mark_folder_preview_truncated(widget, pager)
+            if pager.at_end:
+                preview['pagers'][index] = None
+            widget.config(state='disabled')
+        self._diff_folder_preview(preview)
+        if all(pager is None for pager in preview['pagers']):
+            self._folder_preview = None
+
+    def _diff_folder_preview(self, preview):
+        """읽은 줄 중 anchor 이후만 비교해 하이라이트를 다시 입힘.
+
+        다음 쪽과 이어질 수 있는 마지막 블록, 끝의 같은 줄 몇 개는 다음에 다시 비교하도록
+        anchor를 그 앞에 둔다. 쪽을 더 읽어도 비교 비용은 새로 읽은 범위에 비례한다.
+        """
+        if not preview['diff']:
+            return
+        left_lines, right_lines = preview['lines']
+        left_start, right_start = preview['anchor']
+        self._clear_diff_highlights(self.folder_preview_left, f"{left_start + 1}.0")
+        self._clear_diff_highlights(self.folder_preview_right, f"{right_start + 1}.0")
+        left_window = left_lines[left_start:]
+        right_window = right_lines[right_start:]
+        blocks = []
+        self.compare_text_detailed(self.folder_preview_left, self.folder_preview_right, left_window, right_window,
+                                   store_blocks=True, blocks_list=blocks,
+                                   left_offset=left_start, right_offset=right_start)
+
+        if blocks and blocks[-1]['left_end'] == len(left_window) and blocks[-1]['right_end'] == len(right_window):
+            last = blocks[-1]
+            preview['anchor'] = [left_start + last['left_start'] - 1, right_start + last['right_start'] - 1]
         else:
-            self.folder_preview_right.insert('1.0', self.t('file_missing_marker'))
-
-        # 두 파일이 모두 존재하면 차이점 하이라이트
-        if left_content and right_content:
-            left_lines = left_content.splitlines()
-            right_lines = right_content.splitlines()
-            self.compare_text_detailed(self.folder_preview_left, self.folder_preview_right, left_lines, right_lines)
-
-        self.folder_preview_left.config(state='disabled')
-        self.folder_preview_right.config(state='disabled')
+            tail = len(left_window) - (blocks[-1]['left_end'] if blocks else 0)
+            overlap = min(tail, FOLDER_PREVIEW_DIFF_OVERLAP)
+            preview['anchor'] = [left_start + len(left_window) - overlap,
+                                 right_start + len(right_window) - overlap]
 
     def highlight_text_diff(self, text_widget, text, line_num, start_col, end_col):
         """텍스트 위젯의 특정 위치에 diff 태그 추가"""
@@ -2699,17 +3938,18 @@ class CompareToolApp:
             line_num = line_index + 1
             text_widget.tag_add(tag_name, f"{line_num}.0", f"{line_num + 1}.0")
 
-    def _clear_diff_highlights(self, text_widget):
-        """문자 diff와 hunk line-bg 태그를 함께 제거."""
+    def _clear_diff_highlights(self, text_widget, start='1.0'):
+        """문자 diff와 hunk line-bg 태그를 함께 제거 (start 위치부터)."""
         for tag_name in (
             'diff',
             'diff_line_left_only',
             'diff_line_right_only',
             'diff_line_replace',
         ):
-            text_widget.tag_remove(tag_name, '1.0', 'end')
+            text_widget.tag_remove(tag_name, start, 'end')
 
-    def compare_text_detailed(self, left_widget, right_widget, left_lines, right_lines, store_blocks=False, blocks_list=None):
+    def compare_text_detailed(self, left_widget, right_widget, left_lines, right_lines, store_blocks=False, blocks_list=None,
+                              left_offset=0, right_offset=0):
         """문자 단위로 상세 비교하여 하이라이트
 
         Args:
@@ -2719,70 +3959,39 @@ class CompareToolApp:
             right_lines: 오른쪽 텍스트 라인 리스트
             store_blocks: 차이점 블록 정보를 저장할지 여부
             blocks_list: 블록 정보를 저장할 리스트
+            left_offset/right_offset: 줄 목록 앞에 위젯에 이미 있는 줄 수 (일부 범위만 비교할 때)
         """
         # 블록 정보 저장이 필요한 경우 초기화
         if store_blocks and blocks_list is not None:
             blocks_list.clear()
 
-        # 라인 단위 비교
-        matcher = difflib.SequenceMatcher(None, left_lines, right_lines)
-
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-            if tag == 'equal':
-                continue
+        # 라인/문자 단위 비교는 엔진이 계산하고 여기서는 태그만 입힌다
+        line_tags = {
+            'delete': ('diff_line_left_only', None),
+            'insert': (None, 'diff_line_right_only'),
+            'replace': ('diff_line_replace', 'diff_line_replace'),
+        }
+        for block in diff_text_lines(left_lines, right_lines):
+            tag = block['tag']
 
             # 블록 정보 저장
             if store_blocks and blocks_list is not None:
-                block_info = {
-                    'tag': tag,
-                    'left_start': i1 + 1,  # 1-based line number
-                    'left_end': i2,         # exclusive
-                    'right_start': j1 + 1,  # 1-based line number
-                    'right_end': j2,        # exclusive
-                    'left_lines': left_lines[i1:i2],
-                    'right_lines': right_lines[j1:j2]
-                }
-                blocks_list.append(block_info)
-
-            if tag == 'delete':
-                # 왼쪽에만 있는 라인들
-                self._add_diff_line_background(left_widget, 'diff_line_left_only', i1, i2)
-                for i in range(i1, i2):
-                    self.highlight_text_diff(left_widget, left_lines[i], i+1, 0, len(left_lines[i]))
-            elif tag == 'insert':
-                # 오른쪽에만 있는 라인들
-                self._add_diff_line_background(right_widget, 'diff_line_right_only', j1, j2)
-                for j in range(j1, j2):
-                    self.highlight_text_diff(right_widget, right_lines[j], j+1, 0, len(right_lines[j]))
-            elif tag == 'replace':
-                # 변경된 라인들 - 문자 단위로 상세 비교
-                left_block = left_lines[i1:i2]
-                right_block = right_lines[j1:j2]
-                self._add_diff_line_background(left_widget, 'diff_line_replace', i1, i2)
-                self._add_diff_line_background(right_widget, 'diff_line_replace', j1, j2)
-
-                # 단일 라인 대 단일 라인 비교인 경우 문자 단위 비교
-                if len(left_block) == 1 and len(right_block) == 1:
-                    left_line = left_block[0]
-                    right_line = right_block[0]
-
-                    # 문자 단위 비교
-                    char_matcher = difflib.SequenceMatcher(None, left_line, right_line)
-
-                    for char_tag, c_i1, c_i2, c_j1, c_j2 in char_matcher.get_opcodes():
-                        if char_tag != 'equal':
-                            # 왼쪽 차이 표시
-                            if char_tag in ('replace', 'delete'):
-                                self.highlight_text_diff(left_widget, left_line, i1+1, c_i1, c_i2)
-                            # 오른쪽 차이 표시
-                            if char_tag in ('replace', 'insert'):
-                                self.highlight_text_diff(right_widget, right_line, j1+1, c_j1, c_j2)
-                else:
-                    # 여러 라인이 변경된 경우 라인 단위로 표시
-                    for i in range(i1, i2):
-                        self.highlight_text_diff(left_widget, left_lines[i], i+1, 0, len(left_lines[i]))
-                    for j in range(j1, j2):
-                        self.highlight_text_diff(right_widget, right_lines[j], j+1, 0, len(right_lines[j]))
+                blocks_list.append(block)
+
+            left_tag, right_tag = line_tags[tag]
+            if left_tag:
+                self._add_diff_line_background(left_widget, left_tag, left_offset + block['left_start'] - 1,
+                                               left_offset + block['left_end'])
+            if right_tag:
+                self._add_diff_line_background(right_widget, right_tag, right_offset + block['right_start'] - 1,
+                                               right_offset + block['right_end'])
+
+            for line_num, start_col, end_col in block['left_spans']:
+                self.highlight_text_diff(left_widget, left_lines[line_num - 1], left_offset + line_num,
+                                         start_col, end_col)
+            for line_num, start_col, end_col in block['right_spans']:
+                self.highlight_text_diff(right_widget, right_lines[line_num - 1], right_offset + line_num,
+                                         start_col, end_col)
 
     def compare_text(self):
         """텍스트 비교"""
@@ -2827,11 +4036,19 @@ class CompareToolApp:
 
     def clear_folder_comparison(self):
         """폴더 비교 초기화"""
+        if self._folder_task_running():
+            self._stop_folder_compare_job()
+            self._show_folder_progress(False)
+        self._stop_folder_watch()
+        self.folder_watch_var.set(False)
+        self._folder_stream = self._new_folder_stream()
+
         # 트리뷰 초기화
         for item in self.folder_tree.get_children():
             self.folder_tree.delete(item)
 
         # 미리보기 영역 초기화
+        self._folder_preview = None
         self.folder_preview_left.config(state='normal')
         self.folder_preview_right.config(state='normal')
         self.folder_preview_left.delete('1.0', 'end')
@@ -3224,7 +4441,10 @@ class CompareToolApp:
     def _history_item_values(self, item, category):
         """카테고리별 Treeview 컬럼 값"""
         if category == 'folder':
-            return (item.get('left', ''), item.get('right', ''), self._method_label(item.get('method', '')))
+            method_label = self._method_label(item.get('method', ''))
+            if item.get('method') in ('md5', 'both') and item.get('algorithm'):
+                method_label += f" ({hash_algorithm_label(item['algorithm'])})"
+            return (item.get('left', ''), item.get('right', ''), method_label)
         if category == 'file':
             return (item.get('left', ''), item.get('right', ''))
         left = (item.get('left_preview') or '').replace('\n', ' ')[:60]
@@ -3236,7 +4456,7 @@ class CompareToolApp:
         if category == 'folder':
             return (('left', 'right', 'method'),
                     {'left': self.t('left_folder_heading'), 'right': self.t('right_folder_heading'), 'method': self.t('compare_method_heading')},
-                    {'left': 280, 'right': 280, 'method': 100})
+                    {'left': 280, 'right': 280, 'method': 150})
         if category == 'file':
             return (('left', 'right'),
                     {'left': self.t('left_file_heading'), 'right': self.t('right_file_heading')},
@@ -3519,6 +4739,8 @@ class CompareToolApp:
                 self.right_folder_var.set(item['right'])
                 if 'method' in item:
                     self.compare_method_var.set(item['method'])
+                if 'algorithm' in item:
+                    self._set_selected_hash_algorithm(item['algorithm'])
             elif category == 'file':
                 self.file_left_var.set(item['left'])
                 self.file_right_var.set(item['right'])
@@ -3693,7 +4915,8 @@ class CompareToolApp:
             if not left or not right:
                 messagebox.showwarning(self.t('title_warning'), self.t('select_folder_warning'))
                 return
-            self.data_manager.add_folder_favorite(name, left, right, self.compare_method_var.get())
+            self.data_manager.add_folder_favorite(name, left, right, self.compare_method_var.get(),
+                                                  normalize_hash_algorithm(self._selected_hash_algorithm()))
         elif category == 'file':
             left = self.file_left_var.get()
             right = self.file_right_var.get()
@@ -3837,6 +5060,188 @@ class CompareToolApp:
             pady=(0, 0),
         )
 
+    def show_performance_settings(self):
+        """성능 설정 대화상자"""
+        win = tk.Toplevel(self.root)
+        win.title(self.t('performance_settings'))
+        win.geometry("680x520")
+        win.resizable(True, True)
+
+        win.transient(self.root)
+        win.grab_set()
+
+        main_frame = ttk.Frame(win, padding=20)
+        main_frame.pack(fill='both', expand=True)
+
+        ttk.Label(
+            main_frame,
+            text=self.t('performance_settings_desc'),
+            font=(self.font_family, DEFAULT_TEXT_FONT_SIZE)
+        ).pack(pady=(0, 20))
+
+        # 해시 작업자 수
+        workers_frame = ttk.Frame(main_frame)
+        workers_frame.pack(fill='x', pady=10)
+
+        ttk.Label(workers_frame, text=self.t('hash_workers'), width=15).pack(side='left')
+        workers_var = tk.IntVar(value=self.data_manager.get_hash_workers())
+        ttk.Spinbox(workers_frame, from_=0, to=MAX_HASH_WORKERS,
+                    textvariable=workers_var, width=10).pack(side='left', padx=5)
+        ttk.Label(workers_frame,
+                  text=self.t('hash_workers_hint', count=DEFAULT_HASH_WORKERS),
+                  foreground=NOTION_COLORS['slate']).pack(side='left', padx=5)
+
+        # 해시 읽기 버퍼 크기
+        chunk_frame = ttk.Frame(main_frame)
+        chunk_frame.pack(fill='x', pady=10)
+
+        ttk.Label(chunk_frame, text=self.t('hash_chunk_kb'), width=15).pack(side='left')
+        chunk_kb_var = tk.IntVar(value=self.data_manager.get_hash_chunk_kb())
+        ttk.Spinbox(chunk_frame, from_=MIN_HASH_CHUNK_KB, to=MAX_HASH_CHUNK_KB, increment=256,
+                    textvariable=chunk_kb_var, width=10).pack(side='left', padx=5)
+        ttk.Label(chunk_frame,
+                  text=self.t('hash_chunk_kb_hint', default=DEFAULT_HASH_CHUNK_SIZE // 1024),
+                  foreground=NOTION_COLORS['slate']).pack(side='left', padx=5)
+
+        # 큰 파일 미리보기 한도
+        preview_frame = ttk.Frame(main_frame)
+        preview_frame.pack(fill='x', pady=10)
+
+        ttk.Label(preview_frame, text=self.t('preview_threshold_kb'), width=15).pack(side='left')
+        preview_kb_var = tk.IntVar(value=self.data_manager.get_preview_threshold_kb())
+        ttk.Spinbox(preview_frame, from_=MIN_PREVIEW_THRESHOLD_KB, to=MAX_PREVIEW_THRESHOLD_KB, increment=256,
+                    textvariable=preview_kb_var, width=10).pack(side='left', padx=5)
+        ttk.Label(preview_frame,
+                  text=self.t('preview_threshold_kb_hint', lines=PREVIEW_PAGE_LINES,
+                              default=DEFAULT_PREVIEW_THRESHOLD_KB),
+                  foreground=NOTION_COLORS['slate']).pack(side='left', padx=5)
+
+        # 해시 계산 방식 (스레드 / 프로세스)
+        backend_frame = ttk.Frame(main_frame)
+        backend_frame.pack(fill='x', pady=10)
+
+        backend_labels = {backend: self.t('hash_backend_' + backend) for backend in HASH_BACKENDS}
+        ttk.Label(backend_frame, text=self.t('hash_backend'), width=15).pack(side='left')
+        backend_var = tk.StringVar(value=backend_labels[self.data_manager.get_hash_backend()])
+        ttk.Combobox(backend_frame, textvariable=backend_var, state='readonly', width=12,
+                     values=[backend_labels[backend] for backend in HASH_BACKENDS]).pack(side='left', padx=5)
+        ttk.Label(backend_frame, text=self.t('hash_backend_hint'),
+                  foreground=NOTION_COLORS['slate']).pack(side='left', padx=5)
+
+        # 프로세스 풀 크기 / 작은 파일 묶음 크기
+        process_frame = ttk.Frame(main_frame)
+        process_frame.pack(fill='x', pady=10)
+
+        ttk.Label(process_frame, text=self.t('process_workers'), width=15).pack(side='left')
+        process_workers_var = tk.IntVar(value=self.data_manager.get_process_workers())
+        ttk.Spinbox(process_frame, from_=0, to=MAX_HASH_WORKERS,
+                    textvariable=process_workers_var, width=10).pack(side='left', padx=5)
+        ttk.Label(process_frame, text=self.t('process_batch_size')).pack(side='left', padx=(15, 5))
+        process_batch_var = tk.IntVar(value=self.data_manager.get_process_batch_size())
+        ttk.Spinbox(process_frame, from_=1, to=MAX_PROCESS_BATCH_SIZE, increment=16,
+                    textvariable=process_batch_var, width=8).pack(side='left', padx=5)
+        ttk.Label(process_frame,
+                  text=self.t('process_workers_hint', count=os.cpu_count() or 1),
+                  foreground=NOTION_COLORS['slate']).pack(side='left', padx=5)
+
+        # 해시 캐시 크기
+        cache_frame = ttk.Frame(main_frame)
+        cache_frame.pack(fill='x', pady=10)
+
+        ttk.Label(cache_frame, text=self.t('hash_cache_max_entries'), width=15).pack(side='left')
+        cache_entries_var = tk.IntVar(value=self.data_manager.get_hash_cache_max_entries())
+        ttk.Spinbox(cache_frame, from_=1000, to=10000000, increment=50000,
+                    textvariable=cache_entries_var, width=10).pack(side='left', padx=5)
+        ttk.Label(cache_frame,
+                  text=self.t('hash_cache_max_entries_hint'),
+                  foreground=NOTION_COLORS['slate']).pack(side='left', padx=5)
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill='x', pady=(10, 0))
+
+        def apply_settings():
+            try:
+                workers = workers_var.get()
+            except tk.TclError:
+                workers = 0
+            try:
+                cache_entries = cache_entries_var.get()
+            except tk.TclError:
+                cache_entries = DEFAULT_HASH_CACHE_MAX_ENTRIES
+            try:
+                chunk_kb = chunk_kb_var.get()
+            except tk.TclError:
+                chunk_kb = DEFAULT_HASH_CHUNK_SIZE // 1024
+            try:
+                preview_kb = preview_kb_var.get()
+            except tk.TclError:
+                preview_kb = DEFAULT_PREVIEW_THRESHOLD_KB
+            try:
+                process_workers = process_workers_var.get()
+            except tk.TclError:
+                process_workers = 0
+            try:
+                process_batch_size = process_batch_var.get()
+            except tk.TclError:
+                process_batch_size = DEFAULT_PROCESS_BATCH_SIZE
+            backend = next((key for key, label in backend_labels.items() if label == backend_var.get()),
+                           DEFAULT_HASH_BACKEND)
+            self.data_manager.set_hash_workers(workers)
+            self.data_manager.set_hash_chunk_kb(chunk_kb)
+            self.data_manager.set_preview_threshold_kb(preview_kb)
+            self.data_manager.set_hash_backend(backend)
+            self.data_manager.set_process_workers(process_workers)
+            self.data_manager.set_process_batch_size(process_batch_size)
+            self.data_manager.set_hash_cache_max_entries(cache_entries)
+            messagebox.showinfo(self.t('title_done'), self.t('performance_settings_applied'))
+            win.destroy()
+
+        def clear_hash_cache():
+            if not messagebox.askyesno(self.t('title_confirm'), self.t('clear_hash_cache_confirm'), parent=win):
+                return
+            hash_cache = self.data_manager.open_hash_cache()
+            hash_cache.clear()
+            hash_cache.close()
+            messagebox.showinfo(self.t('title_done'), self.t('hash_cache_cleared'), parent=win)
+
+        benchmark_state = {'results': None}
+
+        def run_benchmark():
+            # 측정은 수 초 걸릴 수 있으므로 작업 스레드에서 실행하고 결과를 폴링
+            benchmark_button.config(state='disabled', text=self.t('hash_benchmark_running'))
+
+            def worker():
+                benchmark_state['results'] = benchmark_hash_algorithms()
+
+            threading.Thread(target=worker, name='conferatur-hash-benchmark', daemon=True).start()
+            win.after(FOLDER_JOB_POLL_MS, poll_benchmark)
+
+        def poll_benchmark():
+            if not win.winfo_exists():
+                return
+            results = benchmark_state['results']
+            if results is None:
+                win.after(FOLDER_JOB_POLL_MS, poll_benchmark)
+                return
+            benchmark_state['results'] = None
+            benchmark_button.config(state='normal', text=build_button_text(self.t('hash_benchmark'), '⏱'))
+            lines = [f"{hash_algorithm_label(name)}: {speed:,.0f} MB/s" for name, speed in results]
+            messagebox.showinfo(self.t('hash_benchmark'),
+                                self.t('hash_benchmark_result', results='\n'.join(lines)), parent=win)
+
+        _, dialog_buttons = build_button_row(
+            button_frame,
+            [
+                {'label': self.t('hash_benchmark'), 'icon': '⏱', 'command': run_benchmark, 'role': 'secondary'},
+                {'label': self.t('clear_hash_cache'), 'icon': '🗑️', 'command': clear_hash_cache, 'role': 'destructive'},
+                {'label': self.t('cancel'), 'command': win.destroy, 'role': 'ghost'},
+                {'label': self.t('apply'), 'icon': '✓', 'command': apply_settings, 'role': 'primary'},
+            ],
+            align='right',
+            pady=(0, 0),
+        )
+        benchmark_button = dialog_buttons[0]
+
     def apply_fonts(self):
         """모든 위젯에 폰트 적용"""
         # 폰트 튜플 생성
@@ -3962,4 +5367,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 프로세스 풀 해시를 PyInstaller 등으로 묶은 실행 파일에서도 쓸 수 있도록
+    multiprocessing.freeze_support()
     main()
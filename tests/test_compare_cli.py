@@ -0,0 +1,70 @@
+"""compare_cli 종료 코드/출력 테스트 (python -m pytest tests)"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import compare_cli  # noqa: E402
+
+
+class FolderCliTest(unittest.TestCase):
+    """compare_cli.main이 같음/다름/오류에 0/1/2를 돌려주는지"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.left = os.path.join(self.tmp.name, 'left')
+        self.right = os.path.join(self.tmp.name, 'right')
+        for folder in (self.left, self.right):
+            os.makedirs(os.path.join(folder, 'sub'))
+            for rel_path, text in (('a.txt', 'alpha'), (os.path.join('sub', 'b.txt'), 'beta')):
+                with open(os.path.join(folder, rel_path), 'w') as f:
+                    f.write(text)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_cli(self, *args):
+        """(종료 코드, 표준 출력 JSON 또는 None) — 캐시 파일은 건드리지 않음"""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with mock.patch.object(sys, 'stdout', stdout), mock.patch.object(sys, 'stderr', stderr):
+            code = compare_cli.main(['folder', *args, '--no-cache'])
+        output = stdout.getvalue()
+        return code, json.loads(output) if output else None
+
+    def test_same_folders_exit_0(self):
+        code, output = self.run_cli(self.left, self.right)
+        self.assertEqual(code, compare_cli.EXIT_SAME)
+        self.assertEqual(code, 0)
+        self.assertEqual(output['results'], [])
+        self.assertEqual(output['summary']['differences'], 0)
+
+    def test_different_folders_exit_1(self):
+        with open(os.path.join(self.right, 'a.txt'), 'w') as f:
+            f.write('ALPHA')
+        os.remove(os.path.join(self.right, 'sub', 'b.txt'))
+        code, output = self.run_cli(self.left, self.right)
+        self.assertEqual(code, compare_cli.EXIT_DIFFERENT)
+        self.assertEqual(code, 1)
+        self.assertEqual([(record['path'], record['status']) for record in output['results']],
+                         [('a.txt', 'content_differs'), ('sub/b.txt', 'left_only')])
+
+    def test_missing_folder_exit_2(self):
+        code, output = self.run_cli(self.left, os.path.join(self.tmp.name, 'missing'))
+        self.assertEqual(code, compare_cli.EXIT_ERROR)
+        self.assertEqual(code, 2)
+        self.assertIsNone(output)
+
+    def test_plain_file_instead_of_folder_exit_2(self):
+        code, output = self.run_cli(self.left, os.path.join(self.left, 'a.txt'))
+        self.assertEqual(code, compare_cli.EXIT_ERROR)
+        self.assertIsNone(output)
+
+
+if __name__ == '__main__':
+    unittest.main()
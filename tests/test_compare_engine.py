@@ -0,0 +1,360 @@
+"""compare_engine 단위 테스트 (GUI 없이 실행: python -m pytest tests)"""
+
+import fnmatch
+import io
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import compare_engine  # noqa: E402
+
+
+class ShortReadFile(io.RawIOBase):
+    """readinto가 요청보다 적게(최대 limit바이트) 돌려주는 버퍼 없는 파일 흉내"""
+
+    def __init__(self, data, limit):
+        self._data = data
+        self._pos = 0
+        self._limit = limit
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = min(len(buffer), self._limit, len(self._data) - self._pos)
+        buffer[:count] = self._data[self._pos:self._pos + count]
+        self._pos += count
+        return count
+
+
+class CompareFilesBinaryTest(unittest.TestCase):
+    def compare_with_short_reads(self, left_data, right_data, left_limit, right_limit, chunk_size=64):
+        files = {'left': ShortReadFile(left_data, left_limit), 'right': ShortReadFile(right_data, right_limit)}
+        with mock.patch.object(compare_engine, 'open', create=True, side_effect=lambda path, *a, **k: files[path]):
+            return compare_engine.compare_files_binary('left', 'right', chunk_size)
+
+    def test_short_reads_on_identical_files(self):
+        data = bytes(range(256)) * 10
+        same, offset, bytes_read = self.compare_with_short_reads(data, data, 7, 13)
+        self.assertTrue(same)
+        self.assertIsNone(offset)
+        self.assertEqual(bytes_read, len(data) * 2)
+
+    def test_short_reads_report_first_difference(self):
+        left = bytes(range(256)) * 10
+        right = bytearray(left)
+        right[1000] ^= 0xFF
+        same, offset, _ = self.compare_with_short_reads(left, bytes(right), 5, 64)
+        self.assertFalse(same)
+        self.assertEqual(offset, 1000)
+
+    def test_short_reads_with_different_lengths(self):
+        left = b'a' * 300
+        same, offset, _ = self.compare_with_short_reads(left, left + b'b', 3, 11)
+        self.assertFalse(same)
+        self.assertEqual(offset, 300)
+
+    def test_real_files(self):
+        with tempfile.TemporaryDirectory() as folder:
+            left_path = os.path.join(folder, 'left')
+            right_path = os.path.join(folder, 'right')
+            with open(left_path, 'wb') as f:
+                f.write(b'x' * 5000)
+            with open(right_path, 'wb') as f:
+                f.write(b'x' * 4000 + b'y' + b'x' * 999)
+            self.assertEqual(compare_engine.compare_files_binary(left_path, right_path, 1024)[:2], (False, 4000))
+            self.assertEqual(compare_engine.compare_files_binary(left_path, left_path, 1024)[:2], (True, None))
+
+
+def baseline_should_exclude(rel_path, patterns):
+    """compare_tool의 원래 should_exclude (패턴마다 fnmatch) — ExcludeMatcher가 지켜야 할 기준"""
+    normalized_path = rel_path.replace(os.sep, '/')
+    for pattern in patterns:
+        normalized_pattern = pattern.replace(os.sep, '/')
+        if normalized_pattern.endswith('/'):
+            folder_pattern = normalized_pattern.rstrip('/')
+            for part in normalized_path.split('/')[:-1]:
+                if fnmatch.fnmatch(part, folder_pattern):
+                    return True
+            if normalized_path.startswith(folder_pattern + '/'):
+                return True
+        else:
+            if fnmatch.fnmatch(normalized_path, normalized_pattern):
+                return True
+            if fnmatch.fnmatch(os.path.basename(normalized_path), normalized_pattern):
+                return True
+            for part in normalized_path.split('/'):
+                if fnmatch.fnmatch(part, normalized_pattern):
+                    return True
+    return False
+
+
+class ExcludeMatcherParityTest(unittest.TestCase):
+    def test_glob_characters_match_across_slashes(self):
+        for path, patterns in (('ba/b', ['ba?b']), ('b/.', ['???']), ('a/b', ['a[/]b']), ('x/a/b', ['*a?b'])):
+            self.assertTrue(baseline_should_exclude(path, patterns))
+            self.assertTrue(compare_engine.should_exclude(path, patterns), (path, patterns))
+
+    def test_random_parity_with_baseline(self):
+        rng = random.Random(20261017)
+        names = ['a', 'b', 'ab', 'ba', '.', 'a.b', 'node_modules']
+        pattern_chars = 'ab.?*/[]!'
+        for _ in range(30000):
+            path = '/'.join(rng.choice(names) for _ in range(rng.randint(1, 4)))
+            patterns = []
+            for _ in range(rng.randint(1, 3)):
+                pattern = ''.join(rng.choice(pattern_chars) for _ in range(rng.randint(1, 5)))
+                if rng.random() < 0.3:
+                    pattern += '/'
+                patterns.append(pattern)
+            compare_engine.compile_exclude_patterns.cache_clear()
+            self.assertEqual(compare_engine.should_exclude(path, patterns),
+                             baseline_should_exclude(path, patterns), (path, patterns))
+
+
+class HashCacheEvictionTest(unittest.TestCase):
+    """max_entries 제한이 flush와 여러 연결(창/CLI가 같은 캐시 파일을 쓸 때)에서 지켜지는지"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'cache.sqlite3')
+        self.old_ns = time.time_ns() - 10 ** 12  # racy window 밖
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def entry(self, index):
+        return compare_engine.FileEntry(f'/x/{index}', 10, self.old_ns, 1, index + 1, self.old_ns)
+
+    def table_count(self, table):
+        conn = sqlite3.connect(self.path)
+        try:
+            return conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_evicts_least_recently_used(self):
+        cache = compare_engine.HashCache(self.path, max_entries=50)
+        for index in range(50):
+            cache.put(self.entry(index), f'd{index}')
+        cache.flush()
+        self.assertEqual(cache.get(self.entry(0)), 'd0')  # 조회한 항목은 최근 사용으로 갱신
+        cache.flush()
+        for index in range(50, 120):
+            cache.put(self.entry(index), f'd{index}')
+        cache.flush()
+        self.assertEqual(self.table_count('file_hashes'), 50)
+        self.assertEqual(cache.get(self.entry(119)), 'd119')
+        self.assertIsNone(cache.get(self.entry(1)))
+        cache.close()
+
+    def test_replacing_keys_does_not_grow_table(self):
+        cache = compare_engine.HashCache(self.path, max_entries=50)
+        for value in ('a', 'b'):
+            for index in range(40):
+                cache.put(self.entry(index), value)
+            cache.flush()
+        self.assertEqual(self.table_count('file_hashes'), 40)
+        self.assertEqual(cache.get(self.entry(0)), 'b')
+        cache.close()
+
+    def test_limit_holds_across_connections(self):
+        first = compare_engine.HashCache(self.path, max_entries=40)
+        second = compare_engine.HashCache(self.path, max_entries=40)
+        for index in range(30):
+            first.put(self.entry(index), 'a')
+            second.put(self.entry(1000 + index), 'b')
+        first.flush()
+        second.flush()
+        self.assertEqual(self.table_count('file_hashes'), 40)
+        first.close()
+        second.close()
+        cache = compare_engine.HashCache(self.path, max_entries=20)
+        cache.put(self.entry(5000), 'c')
+        cache.flush()
+        self.assertEqual(self.table_count('file_hashes'), 20)
+        cache.close()
+
+
+class ExpandChangedDirsTest(unittest.TestCase):
+    """expand_changed_dirs가 탐색 중에 제외를 적용해도 사후 필터링과 결과가 같은지"""
+
+    FILES = (
+        'src/app.py', 'src/app.pyc', 'src/node_modules/lib/index.js', 'src/build/out.o',
+        'src/sub/deep/keep.txt', 'src/sub/deep/skip.log', 'docs/build/page.html', 'docs/readme.md',
+        'node_modules/pkg/a.js',
+    )
+    PATTERNS = ('*.pyc', 'node_modules/', 'src/build/', 'src/sub/*/skip.log')
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.roots = (os.path.join(self.tmp.name, 'left'), os.path.join(self.tmp.name, 'right'))
+        for root in self.roots:
+            for rel_path in self.FILES:
+                path = os.path.join(root, *rel_path.split('/'))
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'w') as f:
+                    f.write(rel_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def filtered_after_scan(self, rel_dirs, matcher):
+        paths = set()
+        for rel_dir in rel_dirs:
+            prefix = rel_dir + os.sep if rel_dir else ''
+            for root in self.roots:
+                files, _, _ = compare_engine.scan_folder_tree(os.path.join(root, rel_dir))
+                paths.update(prefix + rel_path for rel_path in files
+                             if not matcher.excludes((prefix + rel_path).replace(os.sep, '/')))
+        return paths
+
+    def test_matches_filtering_after_scan(self):
+        matcher = compare_engine.ExcludeMatcher(self.PATTERNS)
+        for rel_dirs in ([''], ['src'], [os.path.join('src', 'sub')], ['docs', 'node_modules'],
+                         [os.path.join('src', 'node_modules', 'lib')]):
+            self.assertEqual(compare_engine.expand_changed_dirs(self.roots, rel_dirs, matcher),
+                             self.filtered_after_scan(rel_dirs, matcher), rel_dirs)
+
+    def test_does_not_descend_into_excluded_dirs(self):
+        matcher = compare_engine.ExcludeMatcher(self.PATTERNS)
+        scanned = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            scanned.append(path.replace(os.sep, '/'))
+            return real_scandir(path)
+
+        with mock.patch.object(compare_engine.os, 'scandir', recording_scandir):
+            compare_engine.expand_changed_dirs(self.roots, ['', 'node_modules'], matcher)
+        self.assertFalse([path for path in scanned if 'node_modules' in path or '/src/build' in path])
+
+
+class FolderRefreshJobTest(unittest.TestCase):
+    """FolderRefreshJob이 evaluate_folder_paths 결과를 백그라운드에서 채우는지"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.left = os.path.join(self.tmp.name, 'left')
+        self.right = os.path.join(self.tmp.name, 'right')
+        for folder, files in ((self.left, {'same.txt': 'a', 'differ.txt': 'left', 'left_only.txt': 'x'}),
+                              (self.right, {'same.txt': 'a', 'differ.txt': 'rite'})):
+            os.makedirs(folder)
+            for name, text in files.items():
+                with open(os.path.join(folder, name), 'w') as f:
+                    f.write(text)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_results_match_evaluate_folder_paths(self):
+        rel_paths = ['same.txt', 'differ.txt', 'left_only.txt', 'gone.txt']
+        job = compare_engine.FolderRefreshJob(self.left, self.right, rel_paths, 'md5')
+        job.start()
+        self.assertTrue(job.wait(10))
+        self.assertIsNone(job.error)
+        self.assertFalse(job.cancelled)
+        statuses = {rel_path: result.status if result else None for rel_path, result in job.results.items()}
+        self.assertEqual(statuses, {
+            'same.txt': None,
+            'differ.txt': '내용 다름 (MD5)',
+            'left_only.txt': '왼쪽만 존재',
+            'gone.txt': None,
+        })
+
+    def test_cancel_discards_results(self):
+        job = compare_engine.FolderRefreshJob(self.left, self.right, ['differ.txt'], 'md5')
+        job.cancel()
+        job.run()
+        self.assertTrue(job.is_done())
+        self.assertTrue(job.cancelled)
+        self.assertIsNone(job.results)
+
+
+class FolderManifestTest(unittest.TestCase):
+    """write_folder_manifest → load_folder_manifest 왕복과 매니페스트 비교"""
+
+    FILES = {'a.txt': 'alpha', 'sub/b.txt': 'beta', 'sub/deep/c.bin': 'gamma'}
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = os.path.join(self.tmp.name, 'folder')
+        for rel_path, text in self.FILES.items():
+            path = os.path.join(self.folder, *rel_path.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(text)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_manifest(self, name, algorithm='md5'):
+        path = os.path.join(self.tmp.name, name + compare_engine.MANIFEST_EXTENSION)
+        compare_engine.write_folder_manifest(self.folder, path, algorithm)
+        return path
+
+    def run_job(self, left, right, method='md5'):
+        job = compare_engine.FolderCompareJob(left, right, method)
+        job.run()
+        return job
+
+    def test_round_trip(self):
+        manifest = self.write_manifest('m')
+        self.assertTrue(compare_engine.is_folder_manifest(manifest))
+        header, files, digests, _, _ = compare_engine.load_folder_manifest(manifest)
+        scanned, _, _ = compare_engine.scan_folder_tree(self.folder)
+        self.assertEqual(header['algorithm'], 'md5')
+        self.assertEqual(set(files), set(scanned))
+        for rel_path, entry in scanned.items():
+            self.assertEqual((files[rel_path].size, files[rel_path].mtime_ns), (entry.size, entry.mtime_ns))
+            self.assertEqual(digests[rel_path], compare_engine.calculate_file_digest(entry.path, 'md5'))
+
+    def test_compare_folder_against_manifest(self):
+        manifest = self.write_manifest('m')
+        job = self.run_job(manifest, self.folder)
+        self.assertIsNone(job.error)
+        self.assertEqual(job.results, [])
+
+        with open(os.path.join(self.folder, 'a.txt'), 'w') as f:
+            f.write('ALPHA')  # 크기는 같고 내용만 다름
+        os.remove(os.path.join(self.folder, 'sub', 'b.txt'))
+        job = self.run_job(manifest, self.folder)
+        self.assertIsNone(job.error)
+        statuses = {result.rel_path.replace(os.sep, '/'): result.status for result in job.results}
+        self.assertEqual(statuses, {'a.txt': '내용 다름 (MD5)', 'sub/b.txt': '왼쪽만 존재'})
+
+    def test_mismatched_algorithms_raise(self):
+        job = self.run_job(self.write_manifest('left', 'md5'), self.write_manifest('right', 'crc32'))
+        self.assertIsInstance(job.error, compare_engine.ManifestError)
+
+    def test_unavailable_algorithm_raises(self):
+        manifest = self.write_manifest('m')
+        with open(manifest, encoding='utf-8') as f:
+            lines = f.read().split('\n')
+        header = json.loads(lines[0])
+        header['algorithm'] = 'not-installed'
+        lines[0] = json.dumps(header)
+        with open(manifest, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines))
+        job = self.run_job(manifest, self.folder)
+        self.assertIsInstance(job.error, compare_engine.ManifestError)
+
+    def test_malformed_line_raises_with_line_number(self):
+        manifest = self.write_manifest('m')
+        with open(manifest, 'a', encoding='utf-8') as f:
+            f.write('["x.txt", null, 1, "00"]\n')
+        with self.assertRaises(compare_engine.ManifestError) as raised:
+            compare_engine.load_folder_manifest(manifest)
+        self.assertTrue(str(raised.exception).endswith(f':{len(self.FILES) + 2}'))
+
+
+if __name__ == '__main__':
+    unittest.main()